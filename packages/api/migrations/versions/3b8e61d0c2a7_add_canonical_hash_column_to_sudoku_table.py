@@ -0,0 +1,32 @@
+"""add_canonical_hash_column_to_sudoku_table
+
+Revision ID: 3b8e61d0c2a7
+Revises: f4c04cfaec63
+Create Date: 2026-10-17 10:12:41.508233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e61d0c2a7'
+down_revision: Union[str, Sequence[str], None] = 'f4c04cfaec63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sudoku', sa.Column('canonical_hash', sa.String(length=32), nullable=True))
+    op.create_index(op.f('ix_sudoku_canonical_hash'), 'sudoku', ['canonical_hash'], unique=False)
+
+    # Grids stored before the column existed keep a NULL hash: scripts/sudoku_canonical_hash_backfiller.py fills them in
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sudoku_canonical_hash'), table_name='sudoku')
+    op.drop_column('sudoku', 'canonical_hash')
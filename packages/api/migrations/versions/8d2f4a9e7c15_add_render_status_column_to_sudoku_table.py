@@ -0,0 +1,31 @@
+"""add_render_status_column_to_sudoku_table
+
+Revision ID: 8d2f4a9e7c15
+Revises: 3b8e61d0c2a7
+Create Date: 2026-10-17 14:37:05.917342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4a9e7c15'
+down_revision: Union[str, Sequence[str], None] = '3b8e61d0c2a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Grids stored before this revision had their figures rendered on creation
+    op.add_column('sudoku', sa.Column('render_status', sa.Enum('PENDING', 'RENDERED', 'FAILED', name='sudokurenderstatus'), nullable=False, server_default='RENDERED'))
+    op.create_index(op.f('ix_sudoku_render_status'), 'sudoku', ['render_status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sudoku_render_status'), table_name='sudoku')
+    op.drop_column('sudoku', 'render_status')
@@ -0,0 +1,42 @@
+"""add_lazy_render_status
+
+Revision ID: c61f0e8a4b93
+Revises: 8d2f4a9e7c15
+Create Date: 2026-10-17 18:05:12.384120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c61f0e8a4b93'
+down_revision: Union[str, Sequence[str], None] = '8d2f4a9e7c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('sudoku') as batch_op:
+        batch_op.alter_column(
+            'render_status',
+            existing_type=sa.Enum('PENDING', 'RENDERED', 'FAILED', name='sudokurenderstatus'),
+            type_=sa.Enum('LAZY', 'PENDING', 'RENDERED', 'FAILED', name='sudokurenderstatus'),
+            existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # LAZY sudokus have no stored figures, like the PENDING ones
+    op.execute("UPDATE sudoku SET render_status = 'PENDING' WHERE render_status = 'LAZY'")
+    with op.batch_alter_table('sudoku') as batch_op:
+        batch_op.alter_column(
+            'render_status',
+            existing_type=sa.Enum('LAZY', 'PENDING', 'RENDERED', 'FAILED', name='sudokurenderstatus'),
+            type_=sa.Enum('PENDING', 'RENDERED', 'FAILED', name='sudokurenderstatus'),
+            existing_nullable=False
+        )
@@ -0,0 +1,35 @@
+"""make_nth_layer_columns_nullable_in_sudoku_inference_table
+
+Revision ID: e2b7c94d1f36
+Revises: c61f0e8a4b93
+Create Date: 2026-10-17 21:12:40.518263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c94d1f36'
+down_revision: Union[str, Sequence[str], None] = 'c61f0e8a4b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('sudoku_inference') as batch_op:
+        batch_op.alter_column('succeeded_nth_layer', existing_type=sa.Boolean(), nullable=True)
+        batch_op.alter_column('succeeded_and_unique_nth_layer', existing_type=sa.Boolean(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Ungraded inferences cannot be represented without the NULLs, so they are dropped
+    op.execute("DELETE FROM sudoku_inference WHERE succeeded_nth_layer IS NULL")
+    op.execute("UPDATE sudoku_inference SET succeeded_and_unique_nth_layer = 0 WHERE succeeded_and_unique_nth_layer IS NULL")
+    with op.batch_alter_table('sudoku_inference') as batch_op:
+        batch_op.alter_column('succeeded_nth_layer', existing_type=sa.Boolean(), nullable=False)
+        batch_op.alter_column('succeeded_and_unique_nth_layer', existing_type=sa.Boolean(), nullable=False)
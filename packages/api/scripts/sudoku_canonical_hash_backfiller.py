@@ -0,0 +1,20 @@
+from typing import List
+from tqdm import tqdm
+from api.models.sudoku import Sudoku as SudokuModel
+from api.repositories.sudoku_repository import SudokuRepository
+from core.sudoku_canonical_form import SudokuCanonicalForm
+
+class SudokuCanonicalHashBackfiller:
+    @classmethod
+    def backfill(cls) -> None:
+        # Sudokus stored before the canonical_hash column existed are only deduplicated up to symmetry once hashed
+        sudoku_models: List[SudokuModel] = SudokuRepository.get_all_without_canonical_hash()
+        for sudoku_model in tqdm(sudoku_models, desc="Hashing sudokus", unit="sudoku"):
+            SudokuRepository.update_canonical_hash(sudoku_model.id, SudokuCanonicalForm.of(sudoku_model.grid).hash)
+        print(f"Successfully backfilled the canonical hash of {len(sudoku_models)} sudokus")
+
+def main() -> None:
+    SudokuCanonicalHashBackfiller.backfill()
+
+if __name__ == "__main__":
+    main()
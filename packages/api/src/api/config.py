@@ -1,5 +1,5 @@
 from pathlib import Path
-from os import getenv
+from os import getenv, cpu_count
 from typing import List
 
 class Config:
@@ -7,9 +7,14 @@ class Config:
         CORS_ORIGINS: List[str] = [x.strip() for x in (getenv("API_CORS_ORIGINS") or "").split(",") if x.strip()]
 
     class Sudoku:
-        DEFAULT_MAX_SOLUTIONS: int = int(getenv("SUDOKU_DEFAULT_MAX_SOLUTIONS") or 1000)
         DEFAULT_TARGET_COUNT: int = int(getenv("SUDOKU_DEFAULT_TARGET_COUNT") or 150)
         DEFAULT_MAX_ATTEMPTS: int = int(getenv("SUDOKU_DEFAULT_MAX_ATTEMPTS") or 1000)
+        DEFAULT_SOLVER_TIMEOUT: float = float(getenv("SUDOKU_DEFAULT_SOLVER_TIMEOUT") or 30)
+        FIGURE_FORMAT: str = (getenv("SUDOKU_FIGURE_FORMAT") or "png").lower()
+        IMAGE_MODE: str = (getenv("SUDOKU_IMAGE_MODE") or "eager").lower()
+        RENDER_WORKERS: int = int(getenv("SUDOKU_RENDER_WORKERS") or max(1, (cpu_count() or 1) // 4))
+        IMAGE_CACHE_MAX_BYTES: int = int(getenv("SUDOKU_IMAGE_CACHE_MAX_BYTES") or 64 * 1024 * 1024)
+        IMAGE_CACHE_DISK_MAX_BYTES: int = int(getenv("SUDOKU_IMAGE_CACHE_DISK_MAX_BYTES") or 0)
 
     class LLM:
         MODEL: str = getenv("LLM_MODEL")
@@ -18,3 +23,4 @@ class Config:
     class Paths:
         ROOT: Path = Path(__file__).resolve().parents[2]
         DATA: Path = ROOT / "data"
+        IMAGE_CACHE: Path = DATA / "image_cache"
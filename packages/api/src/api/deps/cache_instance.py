@@ -0,0 +1,16 @@
+from typing import Optional
+from api.config import Config
+from core.sudoku_figure_cache import SudokuFigureCache
+
+class CacheInstance:
+    __sudoku_figure_cache: Optional[SudokuFigureCache] = None
+
+    @classmethod
+    def get_sudoku_figure_cache(cls) -> SudokuFigureCache:
+        if cls.__sudoku_figure_cache is None:
+            cls.__sudoku_figure_cache = SudokuFigureCache(
+                max_bytes=Config.Sudoku.IMAGE_CACHE_MAX_BYTES,
+                directory=Config.Paths.IMAGE_CACHE,
+                directory_max_bytes=Config.Sudoku.IMAGE_CACHE_DISK_MAX_BYTES
+            )
+        return cls.__sudoku_figure_cache
@@ -0,0 +1,54 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+from api.config import Config
+from api.deps.serializer_instance import SerializerInstance
+from core.factories.sudoku_factory import SudokuFactory
+
+class ExecutorInstance:
+    __process_pool_executor: Optional[ProcessPoolExecutor] = None
+    __render_process_pool_executor: Optional[ProcessPoolExecutor] = None
+    __render_writer_thread_pool_executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def get_process_pool_executor(cls) -> ProcessPoolExecutor:
+        if cls.__process_pool_executor is None:
+            # The cores left to the render pool are not used for generation
+            cls.__process_pool_executor = ProcessPoolExecutor(
+                max_workers=max(1, multiprocessing.cpu_count() - Config.Sudoku.RENDER_WORKERS),
+                initializer=SudokuFactory.warm_up,
+                initargs=(4, 9)
+            )
+        return cls.__process_pool_executor
+
+    @classmethod
+    def get_render_process_pool_executor(cls) -> ProcessPoolExecutor:
+        # Figures are rendered in their own pool of Config.Sudoku.RENDER_WORKERS processes (a quarter of the cores by
+        # default), so matplotlib never competes with the generation workers' queue nor their cores
+        if cls.__render_process_pool_executor is None:
+            cls.__render_process_pool_executor = ProcessPoolExecutor(
+                max_workers=Config.Sudoku.RENDER_WORKERS,
+                initializer=SerializerInstance.get_sudoku_figure_serializer
+            )
+        return cls.__render_process_pool_executor
+
+    @classmethod
+    def get_render_writer_thread_pool_executor(cls) -> ThreadPoolExecutor:
+        # A single thread stores the rendered figures, so a slow or locked database write never runs on (and stalls) the
+        # thread that completes the pools' futures
+        if cls.__render_writer_thread_pool_executor is None:
+            cls.__render_writer_thread_pool_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sudoku-render-writer")
+        return cls.__render_writer_thread_pool_executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls.__process_pool_executor is not None:
+            cls.__process_pool_executor.shutdown(wait=True, cancel_futures=True)
+            cls.__process_pool_executor = None
+        if cls.__render_process_pool_executor is not None:
+            cls.__render_process_pool_executor.shutdown(wait=True, cancel_futures=True)
+            cls.__render_process_pool_executor = None
+        # After the render pool, so the figures of the renders that did finish are still stored
+        if cls.__render_writer_thread_pool_executor is not None:
+            cls.__render_writer_thread_pool_executor.shutdown(wait=True)
+            cls.__render_writer_thread_pool_executor = None
@@ -1,12 +1,27 @@
 from typing import Optional
-from api.deps.factory_instance import FactoryInstance
+from api.config import Config
+from core.factories.sudoku_figure_layout_factory import SudokuFigureLayoutFactory
 from core.serializers.sudoku_figure_serializer import SudokuFigureSerializer
+from core.serializers.sudoku_svg_figure_serializer import SudokuSvgFigureSerializer
 
 class SerializerInstance:
     __sudoku_figure_serializer: Optional[SudokuFigureSerializer] = None
+    __sudoku_figure_layout_factory: Optional[SudokuFigureLayoutFactory] = None
 
     @classmethod
     def get_sudoku_figure_serializer(cls) -> SudokuFigureSerializer:
         if cls.__sudoku_figure_serializer is None:
-            cls.__sudoku_figure_serializer = SudokuFigureSerializer(figure=FactoryInstance.get_sudoku_figure_factory())
+            match Config.Sudoku.FIGURE_FORMAT:
+                case "svg":
+                    cls.__sudoku_figure_serializer = SudokuSvgFigureSerializer(layout_factory=cls.get_sudoku_figure_layout_factory())
+                case _:
+                    # Imported here so that the SVG mode never loads matplotlib
+                    from core.serializers.sudoku_png_figure_serializer import SudokuPngFigureSerializer
+                    cls.__sudoku_figure_serializer = SudokuPngFigureSerializer(layout_factory=cls.get_sudoku_figure_layout_factory())
         return cls.__sudoku_figure_serializer
+
+    @classmethod
+    def get_sudoku_figure_layout_factory(cls) -> SudokuFigureLayoutFactory:
+        if cls.__sudoku_figure_layout_factory is None:
+            cls.__sudoku_figure_layout_factory = SudokuFigureLayoutFactory(primary_color="red", secondary_color="darkgreen", tertiary_color="blue")
+        return cls.__sudoku_figure_layout_factory
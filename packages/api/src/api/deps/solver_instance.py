@@ -0,0 +1,13 @@
+from typing import Optional
+from api.config import Config
+from core.solvers.sudoku_bitmask_solver import SudokuBitmaskSolver
+from core.solvers.sudoku_solver import SudokuSolver
+
+class SolverInstance:
+    __sudoku_solver: Optional[SudokuSolver] = None
+
+    @classmethod
+    def get_sudoku_solver(cls) -> SudokuSolver:
+        if cls.__sudoku_solver is None:
+            cls.__sudoku_solver = SudokuBitmaskSolver(timeout=Config.Sudoku.DEFAULT_SOLVER_TIMEOUT)
+        return cls.__sudoku_solver
@@ -1,9 +1,22 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI
+from api.deps.executor_instance import ExecutorInstance
 from api.exceptions import register_exception_handlers
 from api.middlewares import register_middlewares
 from api.routes import register_routes
+from api.services.sudoku_render_service import SudokuRenderService
 
-app = FastAPI(title="Sudoku LLM Reasoning: API")
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    ExecutorInstance.get_process_pool_executor()
+    SudokuRenderService.submit_pending()
+    try:
+        yield
+    finally:
+        ExecutorInstance.shutdown()
+
+app = FastAPI(title="Sudoku LLM Reasoning: API", lifespan=lifespan)
 
 register_middlewares(app)
 register_exception_handlers(app)
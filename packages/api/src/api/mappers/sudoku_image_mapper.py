@@ -1,11 +1,12 @@
 import base64
+from typing import Optional
 from api.schemas.responses.sudoku_image_response_schema import SudokuImageResponseSchema
 from api.models.sudoku_image import SudokuImage as SudokuImageModel
 
 class SudokuImageMapper:
     @classmethod
-    def to_image(cls, content: bytes) -> SudokuImageModel:
-        return SudokuImageModel(content=content)
+    def to_image(cls, content: bytes, sudoku_id: Optional[int] = None, mime: str = "image/png") -> SudokuImageModel:
+        return SudokuImageModel(sudoku_id=sudoku_id, content=content, mime=mime)
 
     @classmethod
     def to_image_response_schema(cls, image: SudokuImageModel) -> SudokuImageResponseSchema:
@@ -6,7 +6,7 @@ from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidat
 
 class SudokuInferenceMapper:
     @classmethod
-    def to_inference(cls, sudoku_id: int, succeeded: bool, succeeded_nth_layer: bool, succeeded_and_unique_nth_layer: bool, explanation: Optional[str]) -> SudokuInferenceModel:
+    def to_inference(cls, sudoku_id: int, succeeded: bool, succeeded_nth_layer: Optional[bool], succeeded_and_unique_nth_layer: Optional[bool], explanation: Optional[str]) -> SudokuInferenceModel:
         return SudokuInferenceModel(
             sudoku_id=sudoku_id,
             succeeded=succeeded,
@@ -35,6 +35,7 @@ class SudokuInferenceMapper:
             total_beyond_non_unique: int,
             total_hallucinations: int,
             total_missed: int,
+            total_ungraded: int,
             total_unprocessed: int,
             total: int
     ) -> SudokuInferenceAnalyticsResponseSchema:
@@ -46,6 +47,7 @@ class SudokuInferenceMapper:
             total_beyond_non_unique=total_beyond_non_unique,
             total_hallucinations=total_hallucinations,
             total_missed=total_missed,
+            total_ungraded=total_ungraded,
             total_unprocessed=total_unprocessed,
             total=total
         )
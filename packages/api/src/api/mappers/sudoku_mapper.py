@@ -1,26 +1,27 @@
-from api.deps.serializer_instance import SerializerInstance
-from api.mappers.sudoku_image_mapper import SudokuImageMapper
+from typing import Optional
 from api.mappers.sudoku_inference_mapper import SudokuInferenceMapper
 from api.models.sudoku import Sudoku as SudokuModel
+from api.schemas.responses.sudoku_generation_stats_response_schema import SudokuGenerationStatsResponseSchema
 from api.schemas.responses.sudoku_response_schema import SudokuResponseSchema
+from core.enums.sudoku_render_status import SudokuRenderStatus
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
+from core.solvers.sudoku_solver import SudokuSolver
 from core.sudoku import Sudoku
+from core.sudoku_generation_stats import SudokuGenerationStats
 
 class SudokuMapper:
     @classmethod
-    def to_sudoku(cls, sudoku_model: SudokuModel) -> Sudoku:
-        return Sudoku(sudoku_model.grid)
+    def to_sudoku(cls, sudoku_model: SudokuModel, solver: Optional[SudokuSolver] = None) -> Sudoku:
+        return Sudoku(sudoku_model.grid, solver=solver)
 
     @classmethod
-    def to_sudoku_model(cls, sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType) -> SudokuModel:
+    def to_sudoku_model(cls, sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType, render_status: SudokuRenderStatus = SudokuRenderStatus.PENDING) -> SudokuModel:
         return SudokuModel(
             n=len(sudoku),
             candidate_type=candidate_type,
             grid=[list(x) for x in sudoku.grid],
-            images=[
-                SudokuImageMapper.to_image(content=content)
-                for content in SerializerInstance.get_sudoku_figure_serializer().serialize(sudoku, candidate_type)
-            ]
+            canonical_hash=sudoku.canonical_form.hash,
+            render_status=render_status
         )
 
     @classmethod
@@ -30,5 +31,19 @@ class SudokuMapper:
             n=sudoku_model.n,
             candidate_type=sudoku_model.candidate_type,
             grid=sudoku_model.grid,
+            render_status=sudoku_model.render_status,
             inference=SudokuInferenceMapper.to_inference_response_schema(sudoku_model.inference) if sudoku_model.inference else None
         )
+
+    @classmethod
+    def to_generation_stats_response_schema(cls, n: int, candidate_type: SudokuSimplifiedCandidateType, generation_stats: SudokuGenerationStats) -> SudokuGenerationStatsResponseSchema:
+        return SudokuGenerationStatsResponseSchema(
+            n=n,
+            candidate_type=candidate_type,
+            total_attempts=generation_stats.attempts,
+            total_successes=generation_stats.successes,
+            total_seconds=generation_stats.seconds,
+            success_rate=generation_stats.success_rate,
+            seconds_per_attempt=generation_stats.seconds_per_attempt,
+            seconds_per_success=generation_stats.seconds_per_success
+        )
@@ -1,8 +1,9 @@
 from typing import List, Optional
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Enum, JSON
+from sqlalchemy import Column, Enum, JSON, String
 from api.models.sudoku_image import SudokuImage
 from api.models.sudoku_inference import SudokuInference
+from core.enums.sudoku_render_status import SudokuRenderStatus
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
 
 class Sudoku(SQLModel, table=True):
@@ -11,6 +12,8 @@ class Sudoku(SQLModel, table=True):
     n: int = Field(nullable=False)
     candidate_type: SudokuSimplifiedCandidateType = Field(sa_column=Column(Enum(SudokuSimplifiedCandidateType), nullable=False))
     grid: List[List[int]] = Field(sa_column=Column(JSON, nullable=False))
+    canonical_hash: Optional[str] = Field(default=None, sa_column=Column(String(length=32), nullable=True, index=True))
+    render_status: SudokuRenderStatus = Field(default=SudokuRenderStatus.PENDING, sa_column=Column(Enum(SudokuRenderStatus), nullable=False, index=True))
     inference: Optional[SudokuInference] = Relationship(
         back_populates="sudoku",
         sa_relationship_kwargs={
@@ -1,11 +1,12 @@
 import random
 from typing import List, Optional, Union
-from sqlalchemy import Null
+from sqlalchemy import Null, and_
 from sqlmodel import Session, select, func, col, null
 from api.database import engine
 from api.models.sudoku import Sudoku
 from api.models.sudoku_image import SudokuImage
 from api.models.sudoku_inference import SudokuInference
+from core.enums.sudoku_render_status import SudokuRenderStatus
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
 
 class SudokuRepository:
@@ -30,12 +31,12 @@ class SudokuRepository:
         return random.choice(entries)
 
     @classmethod
-    def create(cls, sudoku: Sudoku) -> Optional[Sudoku]:
+    def create(cls, sudoku: Sudoku, unique_up_to_symmetry: bool = False) -> Optional[Sudoku]:
         with Session(engine) as session:
             stmt = select(Sudoku).where(
                 Sudoku.n == sudoku.n,
                 Sudoku.candidate_type == sudoku.candidate_type,
-                Sudoku.grid == sudoku.grid
+                Sudoku.canonical_hash == sudoku.canonical_hash if unique_up_to_symmetry else Sudoku.grid == sudoku.grid
             )
 
             existing = session.scalar(stmt)
@@ -47,6 +48,43 @@ class SudokuRepository:
             session.refresh(sudoku)
             return sudoku
 
+    @classmethod
+    def get_all_by_render_status(cls, render_status: SudokuRenderStatus) -> List[Sudoku]:
+        with Session(engine) as session:
+            stmt = select(Sudoku).where(Sudoku.render_status == render_status).order_by(Sudoku.id)
+            return list(session.exec(stmt).unique().all())
+
+    @classmethod
+    def update_render_status(cls, sudoku_id: int, render_status: SudokuRenderStatus, images: List[SudokuImage]) -> bool:
+        with Session(engine) as session:
+            sudoku = session.get(Sudoku, sudoku_id)
+            if sudoku is None:
+                return False
+
+            sudoku.render_status = render_status
+            session.add(sudoku)
+            session.add_all(images)
+            session.commit()
+            return True
+
+    @classmethod
+    def get_all_without_canonical_hash(cls) -> List[Sudoku]:
+        with Session(engine) as session:
+            stmt = select(Sudoku).where(Sudoku.canonical_hash == null()).order_by(Sudoku.id)
+            return list(session.exec(stmt).unique().all())
+
+    @classmethod
+    def update_canonical_hash(cls, sudoku_id: int, canonical_hash: str) -> bool:
+        with Session(engine) as session:
+            sudoku = session.get(Sudoku, sudoku_id)
+            if sudoku is None:
+                return False
+
+            sudoku.canonical_hash = canonical_hash
+            session.add(sudoku)
+            session.commit()
+            return True
+
     @classmethod
     def delete_by_id(cls, sudoku_id: int) -> bool:
         with Session(engine) as session:
@@ -88,6 +126,7 @@ class SudokuRepository:
             inference_succeeded_nth_layer: Union[Optional[bool], Null] = None,
             inference_succeeded_and_unique_nth_layer: Union[Optional[bool], Null] = None,
             inference_has_explanation: Optional[bool] = None,
+            inference_graded_nth_layer: Optional[bool] = None,
             has_images: Optional[bool] = None,
             page: Optional[int] = None,
             size: Optional[int] = None
@@ -106,6 +145,8 @@ class SudokuRepository:
             stmt = stmt.where(SudokuInference.succeeded_and_unique_nth_layer == inference_succeeded_and_unique_nth_layer if not isinstance(inference_succeeded_and_unique_nth_layer, Null) else Sudoku.inference == null())
         if inference_has_explanation is not None:
             stmt = stmt.where(SudokuInference.explanation != null() if inference_has_explanation else SudokuInference.explanation == null())
+        if inference_graded_nth_layer is not None:
+            stmt = stmt.where(SudokuInference.succeeded_nth_layer != null() if inference_graded_nth_layer else and_(SudokuInference.id != null(), SudokuInference.succeeded_nth_layer == null()))
         if has_images is not None:
             stmt = stmt.where(SudokuImage.id != null() if has_images else SudokuImage.id == null())
         if page is not None and size is not None:
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from typing import List
 from api.schemas.queries.sudoku_image_query_schema import SudokuImageQuerySchema
 from api.schemas.responses.sudoku_image_response_schema import SudokuImageResponseSchema
 from api.services.sudoku_image_service import SudokuImageService
@@ -6,6 +7,7 @@ from fastapi import APIRouter, Depends, status
 from api.schemas.queries.base_query_schema import PageSchema
 from api.schemas.queries.sudoku_query_schema import SudokuQuerySchema
 from api.schemas.requests.sudoku_request_schema import SudokuRequestSchema
+from api.schemas.responses.sudoku_generation_stats_response_schema import SudokuGenerationStatsResponseSchema
 from api.schemas.responses.sudoku_response_schema import SudokuResponseSchema
 from api.services.sudoku_service import SudokuService
 
@@ -15,6 +17,10 @@ router = APIRouter()
 def get_all(query: SudokuQuerySchema = Depends()):
     return SudokuService.get_all(query)
 
+@router.get("/generation-stats", response_model=List[SudokuGenerationStatsResponseSchema])
+def get_generation_stats():
+    return SudokuService.get_generation_stats()
+
 @router.get("/{sudoku_id}/images", response_model=PageSchema[SudokuImageResponseSchema])
 def get_all_images(sudoku_id: int, query: SudokuImageQuerySchema = Depends()):
     q: SudokuImageQuerySchema = deepcopy(query)
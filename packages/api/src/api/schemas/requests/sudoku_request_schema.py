@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Literal, List
+from typing import Literal, List, Optional
 from api.config import Config
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
 
@@ -8,3 +8,8 @@ class SudokuRequestSchema(BaseModel):
     candidate_types: List[SudokuSimplifiedCandidateType] = list(SudokuSimplifiedCandidateType)
     target_count: int = Config.Sudoku.DEFAULT_TARGET_COUNT
     max_attempts: int = Config.Sudoku.DEFAULT_MAX_ATTEMPTS
+    max_seconds: Optional[float] = None
+    seed: Optional[int] = None
+    augmentations: int = 0
+    augmentation_verify_rate: float = 0.0
+    unique_up_to_symmetry: bool = False
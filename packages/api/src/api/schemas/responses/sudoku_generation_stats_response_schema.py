@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel
+from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
+
+class SudokuGenerationStatsResponseSchema(BaseModel):
+    n: int
+    candidate_type: SudokuSimplifiedCandidateType
+    total_attempts: int
+    total_successes: int
+    total_seconds: float
+    success_rate: Optional[float] = None
+    seconds_per_attempt: Optional[float] = None
+    seconds_per_success: Optional[float] = None
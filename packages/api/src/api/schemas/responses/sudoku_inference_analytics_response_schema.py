@@ -9,5 +9,6 @@ class SudokuInferenceAnalyticsResponseSchema(BaseModel):
     total_beyond_non_unique: int
     total_hallucinations: int
     total_missed: int
+    total_ungraded: int
     total_unprocessed: int
     total: int
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from pydantic import BaseModel
 from api.schemas.responses.sudoku_inference_response_schema import SudokuInferenceResponseSchema
+from core.enums.sudoku_render_status import SudokuRenderStatus
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
 
 class SudokuResponseSchema(BaseModel):
@@ -8,4 +9,5 @@ class SudokuResponseSchema(BaseModel):
     n: int
     candidate_type: SudokuSimplifiedCandidateType
     grid: List[List[int]]
+    render_status: SudokuRenderStatus
     inference: Optional[SudokuInferenceResponseSchema] = None
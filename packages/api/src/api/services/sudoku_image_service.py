@@ -1,6 +1,11 @@
 import zipfile
 from io import BytesIO
+from typing import List, Optional
+from api.config import Config
+from api.exceptions.sudoku_exceptions import SudokuNotFoundException
 from api.mappers.sudoku_image_mapper import SudokuImageMapper
+from api.models.sudoku import Sudoku as SudokuModel
+from api.models.sudoku_image import SudokuImage as SudokuImageModel
 from api.schemas.queries.base_query_schema import PageSchema, PageableSchema
 from api.schemas.queries.sudoku_image_query_schema import SudokuImageQuerySchema
 from api.schemas.responses.sudoku_image_response_schema import SudokuImageResponseSchema
@@ -8,10 +13,28 @@ from starlette.responses import StreamingResponse
 from api.exceptions.sudoku_image_exceptions import SudokuImageNotFoundException
 from api.repositories.sudoku_image_repository import SudokuImageRepository
 from api.repositories.sudoku_repository import SudokuRepository
+from api.services.sudoku_render_service import SudokuRenderService
+from core.enums.sudoku_render_status import SudokuRenderStatus
 
 class SudokuImageService:
     @classmethod
     def get_all(cls, query: SudokuImageQuerySchema) -> PageSchema[SudokuImageResponseSchema]:
+        if Config.Sudoku.IMAGE_MODE == "lazy":
+            sudoku: Optional[SudokuModel] = SudokuRepository.get_by_id(query.sudoku_id)
+            if sudoku is None:
+                raise SudokuNotFoundException()
+
+            if sudoku.render_status != SudokuRenderStatus.RENDERED:
+                images: List[SudokuImageModel] = SudokuRenderService.get_images(sudoku)
+                return PageSchema[SudokuImageResponseSchema](
+                    content=[SudokuImageMapper.to_image_response_schema(model) for model in images[query.get_skip():query.get_skip() + query.size]],
+                    pageable=PageableSchema(
+                        page=query.page,
+                        size=query.size,
+                        total_elements=len(images)
+                    )
+                )
+
         return PageSchema[SudokuImageResponseSchema](
             content=[
                 SudokuImageMapper.to_image_response_schema(model)
@@ -34,11 +57,14 @@ class SudokuImageService:
     def download_zip(cls) -> StreamingResponse:
         buffer: BytesIO = BytesIO()
         with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as file:
-            for sudoku in SudokuRepository.get_all(has_images=True):
+            # In the lazy image mode, sudokus without stored images are exported with their figures rendered on demand
+            lazy: bool = Config.Sudoku.IMAGE_MODE == "lazy"
+            for sudoku in SudokuRepository.get_all(has_images=None if lazy else True):
                 folder: str = f"{sudoku.n}x{sudoku.n}/{sudoku.candidate_type.simplified_display_name}/sudoku_{sudoku.id}"
-                for image in sudoku.images:
-                    ext: str = image.mime.split("/")[-1]
-                    filename: str = f"{folder}/image_{image.id}.{ext}"
+                images: List[SudokuImageModel] = SudokuRenderService.get_images(sudoku) if lazy and sudoku.render_status != SudokuRenderStatus.RENDERED else sudoku.images
+                for idx, image in enumerate(images):
+                    ext: str = image.mime.split("/")[-1].split("+")[0]
+                    filename: str = f"{folder}/image_{image.id if image.id is not None else idx}.{ext}"
                     file.writestr(filename, image.content)
 
         buffer.seek(0)
@@ -2,6 +2,7 @@ import itertools
 from typing import List, Tuple, Optional
 from sqlmodel import null
 from api.deps.agent_instance import AgentInstance
+from api.deps.solver_instance import SolverInstance
 from api.exceptions.sudoku_inference_exceptions import SudokuInferenceNotFoundException
 from api.logger import logger
 from api.mappers.sudoku_inference_mapper import SudokuInferenceMapper
@@ -13,6 +14,7 @@ from api.schemas.requests.sudoku_inference_request_schema import SudokuInference
 from api.schemas.responses.sudoku_inference_analytics_response_schema import SudokuInferenceAnalyticsResponseSchema
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
 from core.exceptions.sudoku_inference_agent_exceptions import SudokuInferenceAgentGenerationException
+from core.exceptions.sudoku_solver_exceptions import SudokuSolverTimeoutException
 from core.sudoku import Sudoku, SudokuCandidate
 from core.sudoku_inference_agent import SudokuInferenceCandidate
 
@@ -30,6 +32,7 @@ class SudokuInferenceService:
                     total_beyond_non_unique=SudokuRepository.count(n=n, candidate_type=candidate_type, inference_succeeded=False, inference_succeeded_nth_layer=True, inference_succeeded_and_unique_nth_layer=False),
                     total_hallucinations=SudokuRepository.count(n=n, candidate_type=candidate_type, inference_succeeded=False, inference_succeeded_nth_layer=False, inference_has_explanation=True),
                     total_missed=SudokuRepository.count(n=n, candidate_type=candidate_type, inference_succeeded=False, inference_succeeded_nth_layer=False, inference_has_explanation=False),
+                    total_ungraded=SudokuRepository.count(n=n, candidate_type=candidate_type, inference_succeeded=False, inference_graded_nth_layer=False),
                     total_unprocessed=SudokuRepository.count(n=n, candidate_type=candidate_type, inference_succeeded=null(), inference_succeeded_nth_layer=null()),
                     total=SudokuRepository.count(n=n, candidate_type=candidate_type)
                 )
@@ -52,15 +55,15 @@ class SudokuInferenceService:
                     logger.info(f"{n}x{n} grid | {candidate_type.name}: No Sudoku available without inference")
                     break
 
-                sudoku: Sudoku = SudokuMapper.to_sudoku(sudoku_model)
+                sudoku: Sudoku = SudokuMapper.to_sudoku(sudoku_model, solver=SolverInstance.get_sudoku_solver())
                 try: llm_candidate: Optional[SudokuInferenceCandidate] = AgentInstance.get_sudoku_inference_agent().solve(sudoku, candidate_type=candidate_type)
                 except SudokuInferenceAgentGenerationException:
                     logger.error(f"{n}x{n} grid | {candidate_type.name}: LLM inference failed for sudoku_id={sudoku_model.id}")
                     continue
 
                 inference_succeeded: bool = False
-                inference_succeeded_nth_layer: bool = False
-                inference_succeeded_and_unique_nth_layer: bool = False
+                inference_succeeded_nth_layer: Optional[bool] = False
+                inference_succeeded_and_unique_nth_layer: Optional[bool] = False
                 if llm_candidate is not None:
                     candidates: Tuple[SudokuCandidate, ...] = ()
                     match candidate_type:
@@ -68,8 +71,15 @@ class SudokuInferenceService:
                         case SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES: candidates = sudoku.candidates_0th_layer_hidden_singles
                         case SudokuSimplifiedCandidateType.FIRST_LAYER_CONSENSUS: candidates = sudoku.candidates_1st_layer_consensus
                     inference_succeeded = inference_succeeded_nth_layer = llm_candidate.candidate in candidates
-                    inference_succeeded_nth_layer = inference_succeeded or llm_candidate.candidate in sudoku.candidates_nth_layer
-                    inference_succeeded_and_unique_nth_layer = inference_succeeded_nth_layer and len(sudoku.candidate_values_nth_layer_at_position(*llm_candidate.position)) == 1
+                    try:
+                        inference_succeeded_nth_layer = inference_succeeded or llm_candidate.candidate in sudoku.candidates_nth_layer
+                        inference_succeeded_and_unique_nth_layer = inference_succeeded_nth_layer and len(sudoku.candidate_values_nth_layer_at_position(*llm_candidate.position)) == 1
+                    except SudokuSolverTimeoutException:
+                        # Keep the answer and leave whatever the solver could not grade as unknown
+                        logger.error(f"{n}x{n} grid | {candidate_type.name}: Nth layer grading timed out for sudoku_id={sudoku_model.id}")
+                        if not inference_succeeded_nth_layer:
+                            inference_succeeded_nth_layer = None
+                        inference_succeeded_and_unique_nth_layer = None
 
                 generated_inferences += 1
                 logger.info(f"{n}x{n} grid | {candidate_type.name}: sudoku_id={sudoku_model.id} succeeded={inference_succeeded} succeeded_nth_layer={inference_succeeded_nth_layer} ({generated_inferences}/{request.target_count})")
@@ -0,0 +1,91 @@
+import functools
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import List, Dict, Optional
+from api.config import Config
+from api.deps.cache_instance import CacheInstance
+from api.deps.executor_instance import ExecutorInstance
+from api.deps.serializer_instance import SerializerInstance
+from api.logger import logger
+from api.mappers.sudoku_image_mapper import SudokuImageMapper
+from api.mappers.sudoku_mapper import SudokuMapper
+from api.models.sudoku import Sudoku as SudokuModel
+from api.models.sudoku_image import SudokuImage as SudokuImageModel
+from api.repositories.sudoku_repository import SudokuRepository
+from core.enums.sudoku_render_status import SudokuRenderStatus
+from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
+from core.serializers.sudoku_figure_serializer import SudokuFigureSerializer
+from core.sudoku import Sudoku
+
+class SudokuRenderService:
+    __lazy_renders: Dict[str, Future[List[bytes]]] = {}
+    __lazy_renders_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def submit(cls, sudoku_model: SudokuModel) -> None:
+        # The sudoku is already stored (as PENDING, or LAZY): its figures are rendered in the render pool and saved when ready
+        future: Future[List[bytes]] = ExecutorInstance.get_render_process_pool_executor().submit(cls.render, SudokuMapper.to_sudoku(sudoku_model), sudoku_model.candidate_type)
+        future.add_done_callback(functools.partial(cls.__submit_save, sudoku_model.id))
+
+    @classmethod
+    def submit_pending(cls) -> None:
+        # Renders cancelled by a shutdown (or lost in a crash) leave their sudokus PENDING, they are resumed on startup,
+        # along with the LAZY sudokus of an earlier lazy image mode run. In the lazy image mode nothing is rendered ahead
+        if Config.Sudoku.IMAGE_MODE == "lazy":
+            return
+
+        for render_status in [SudokuRenderStatus.PENDING, SudokuRenderStatus.LAZY]:
+            for sudoku_model in SudokuRepository.get_all_by_render_status(render_status):
+                cls.submit(sudoku_model)
+
+    @classmethod
+    def get_images(cls, sudoku_model: SudokuModel) -> List[SudokuImageModel]:
+        # Lazy image mode: the figures are rendered on first request, spread one per worker over the render pool (concurrent
+        # requests wait on the same render), and kept in the figure cache instead of the database, keyed by format,
+        # candidate type and grid
+        serializer: SudokuFigureSerializer = SerializerInstance.get_sudoku_figure_serializer()
+        key: str = hashlib.blake2b(f"{serializer.mime}:{sudoku_model.candidate_type.value}:{sudoku_model.grid}".encode("utf-8"), digest_size=16).hexdigest()
+        contents: Optional[List[bytes]] = CacheInstance.get_sudoku_figure_cache().get(key)
+        if contents is None:
+            with cls.__lazy_renders_lock:
+                future: Optional[Future[List[bytes]]] = cls.__lazy_renders.get(key)
+                rendering: bool = future is None
+                if rendering:
+                    future = cls.__lazy_renders[key] = Future()
+
+            if rendering:
+                try:
+                    contents = serializer.serialize(SudokuMapper.to_sudoku(sudoku_model), sudoku_model.candidate_type, executor=ExecutorInstance.get_render_process_pool_executor())
+                    CacheInstance.get_sudoku_figure_cache().set(key, contents)
+                    future.set_result(contents)
+                except Exception as e:
+                    future.set_exception(e)
+                    raise
+                finally:
+                    with cls.__lazy_renders_lock:
+                        cls.__lazy_renders.pop(key, None)
+            else: contents = future.result()
+        return [SudokuImageMapper.to_image(content, sudoku_id=sudoku_model.id, mime=serializer.mime) for content in contents]
+
+    @staticmethod
+    def render(sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType) -> List[bytes]:
+        return SerializerInstance.get_sudoku_figure_serializer().serialize(sudoku, candidate_type)
+
+    @classmethod
+    def __submit_save(cls, sudoku_id: int, future: Future[List[bytes]]) -> None:
+        # Done callbacks run on the pool's result handling thread: the database write is handed to the writer thread
+        if not future.cancelled():
+            ExecutorInstance.get_render_writer_thread_pool_executor().submit(cls.__save, sudoku_id, future)
+
+    @classmethod
+    def __save(cls, sudoku_id: int, future: Future[List[bytes]]) -> None:
+        try: contents: List[bytes] = future.result()
+        except Exception:
+            logger.exception(f"Figure rendering failed for sudoku_id={sudoku_id}")
+            SudokuRepository.update_render_status(sudoku_id, SudokuRenderStatus.FAILED, images=[])
+            return
+
+        mime: str = SerializerInstance.get_sudoku_figure_serializer().mime
+        if not SudokuRepository.update_render_status(sudoku_id, SudokuRenderStatus.RENDERED, images=[SudokuImageMapper.to_image(content, sudoku_id=sudoku_id, mime=mime) for content in contents]):
+            logger.info(f"Sudoku deleted before its figures were rendered, skipping sudoku_id={sudoku_id}")
@@ -1,5 +1,7 @@
 import itertools
-from typing import Optional
+from typing import List, Optional
+from api.config import Config
+from api.deps.executor_instance import ExecutorInstance
 from api.deps.factory_instance import FactoryInstance
 from api.exceptions.sudoku_exceptions import SudokuNotFoundException
 from api.logger import logger
@@ -9,7 +11,11 @@ from api.repositories.sudoku_repository import SudokuRepository
 from api.schemas.queries.base_query_schema import PageSchema, PageableSchema
 from api.schemas.queries.sudoku_query_schema import SudokuQuerySchema
 from api.schemas.requests.sudoku_request_schema import SudokuRequestSchema
+from api.schemas.responses.sudoku_generation_stats_response_schema import SudokuGenerationStatsResponseSchema
 from api.schemas.responses.sudoku_response_schema import SudokuResponseSchema
+from api.services.sudoku_render_service import SudokuRenderService
+from core.enums.sudoku_render_status import SudokuRenderStatus
+from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
 from core.factories.sudoku_factory import SudokuFactory
 
 class SudokuService:
@@ -50,17 +56,32 @@ class SudokuService:
             raise SudokuNotFoundException()
         return SudokuMapper.to_sudoku_response_schema(sudoku)
 
+    @classmethod
+    def get_generation_stats(cls) -> List[SudokuGenerationStatsResponseSchema]:
+        return [
+            SudokuMapper.to_generation_stats_response_schema(n=factory.n, candidate_type=candidate_type, generation_stats=factory.get_generation_stats(candidate_type))
+            for factory in FactoryInstance.get_sudoku_factories()
+            for candidate_type in SudokuSimplifiedCandidateType
+        ]
+
     @classmethod
     def create(cls, request: SudokuRequestSchema) -> None:
         for n, candidate_type in itertools.product(request.ns, request.candidate_types):
             successful_generations: int = 0
             factory: SudokuFactory = FactoryInstance.get_sudoku_factory(n)
-            for sudoku in factory.get_sudokus_by_candidate_type(candidate_type, request.target_count, request.max_attempts):
+            # Seeded requests cover the seeds [seed, seed + target_count * max_attempts), so disjoint seed ranges can be
+            # generated on different machines and merged without duplicates
+            seeds: Optional[range] = range(request.seed, request.seed + request.target_count * request.max_attempts) if request.seed is not None else None
+            for sudoku in factory.get_sudokus_by_candidate_type(candidate_type, request.target_count, request.max_attempts, seeds=seeds, augmentations=request.augmentations, verify_rate=request.augmentation_verify_rate, max_seconds=request.max_seconds, executor=ExecutorInstance.get_process_pool_executor()):
                 if sudoku is None:
                     logger.info(f"{factory.n}x{factory.n} grid | {candidate_type.name}: Sudoku generation failed")
                     continue
 
-                if SudokuRepository.create(SudokuMapper.to_sudoku_model(sudoku, candidate_type=candidate_type)):
+                render_status: SudokuRenderStatus = SudokuRenderStatus.LAZY if Config.Sudoku.IMAGE_MODE == "lazy" else SudokuRenderStatus.PENDING
+                sudoku_model: Optional[SudokuModel] = SudokuRepository.create(SudokuMapper.to_sudoku_model(sudoku, candidate_type=candidate_type, render_status=render_status), unique_up_to_symmetry=request.unique_up_to_symmetry)
+                if sudoku_model is not None:
+                    if render_status == SudokuRenderStatus.PENDING:
+                        SudokuRenderService.submit(sudoku_model)
                     successful_generations += 1
                     logger.info(f"{factory.n}x{factory.n} grid | {candidate_type.name}: Sudoku generation succeeded ({successful_generations}/{request.target_count})")
                     if successful_generations >= request.target_count:
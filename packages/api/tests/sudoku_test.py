@@ -1,9 +1,29 @@
-from typing import List
+import itertools
+import pickle
+import random
+import time
+import numpy as np
+import pytest
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple, Optional
 from api.mappers.sudoku_mapper import SudokuMapper
 from api.models.sudoku import Sudoku as SudokuModel
 from api.repositories.sudoku_repository import SudokuRepository
+from core.analyzers.sudoku_batch_analyzer import SudokuBatchAnalysis, SudokuBatchAnalyzer
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
-from core.sudoku import Sudoku
+from core.exceptions.sudoku_solver_exceptions import SudokuSolverTimeoutException
+from core.factories.sudoku_factory import SudokuFactory
+from core.factories.sudoku_figure_layout_factory import SudokuFigureLayoutFactory
+from core.serializers.sudoku_svg_figure_serializer import SudokuSvgFigureSerializer
+from core.solvers.sudoku_bitmask_solver import SudokuBitmaskSolver
+from core.solvers.sudoku_z3_solver import SudokuZ3Solver
+from core.sudoku import Sudoku, SudokuConsensusDeductionChain
+from core.sudoku_canonical_form import SudokuCanonicalForm
+from core.sudoku_figure_cache import SudokuFigureCache
+from core.sudoku_generation_stats import SudokuGenerationStats
+from core.sudoku_symmetry import SudokuSymmetry
 
 def test_naked_singles_sudoku() -> None:
     sudoku_models: List[SudokuModel] = SudokuRepository.get_all(candidate_type=SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES)
@@ -40,6 +60,61 @@ def test_example_consensus_sudoku() -> None:
     assert not sudoku.candidates_0th_layer_hidden_singles
     assert sudoku.candidates_1st_layer_consensus
 
+def test_example_consensus_candidates_sudoku() -> None:
+    sudoku: Sudoku = Sudoku([
+        [2, 7, 1, 8, 9, 6, 0, 0, 0],
+        [9, 4, 3, 5, 2, 7, 6, 8, 1],
+        [8, 5, 6, 3, 1, 4, 7, 9, 2],
+        [4, 8, 0, 0, 0, 0, 0, 2, 0],
+        [6, 3, 0, 0, 0, 0, 0, 0, 0],
+        [5, 1, 0, 0, 0, 0, 0, 0, 0],
+        [3, 9, 5, 0, 0, 0, 0, 7, 0],
+        [7, 2, 4, 0, 3, 8, 5, 0, 9],
+        [1, 6, 8, 0, 0, 0, 2, 4, 3]
+    ])
+
+    assert [(candidate.position, candidate.value) for candidate in sudoku.candidates_1st_layer_consensus] == [
+        ((0, 6), 4), ((0, 7), 3), ((0, 8), 5), ((3, 2), 9), ((5, 2), 2),
+        ((6, 3), 2), ((6, 4), 4), ((6, 6), 8), ((6, 8), 6), ((7, 7), 1)
+    ]
+
+def test_example_consensus_deduction_chain_sudoku() -> None:
+    sudoku: Sudoku = Sudoku([
+        [2, 7, 1, 8, 9, 6, 0, 0, 0],
+        [9, 4, 3, 5, 2, 7, 6, 8, 1],
+        [8, 5, 6, 3, 1, 4, 7, 9, 2],
+        [4, 8, 0, 0, 0, 0, 0, 2, 0],
+        [6, 3, 0, 0, 0, 0, 0, 0, 0],
+        [5, 1, 0, 0, 0, 0, 0, 0, 0],
+        [3, 9, 5, 0, 0, 0, 0, 7, 0],
+        [7, 2, 4, 0, 3, 8, 5, 0, 9],
+        [1, 6, 8, 0, 0, 0, 2, 4, 3]
+    ])
+
+    deduction_chains: List[List[SudokuConsensusDeductionChain]] = sudoku.deduction_chain_1st_layer_consensus_at_position(0, 6)
+    assert [[(deduction.initial_assumption_value, deduction.initial_assumption_position) for deduction in deduction_chain] for deduction_chain in deduction_chains] == [
+        [(1, (3, 3)), (1, (3, 5)), (1, (3, 6))],
+        [(1, (3, 5)), (1, (4, 5)), (1, (6, 5))],
+        [(1, (3, 3)), (1, (3, 5)), (1, (4, 3)), (1, (4, 5))]
+    ]
+    assert all((deduction.consensus_candidate_position, deduction.consensus_candidate_value) == ((0, 6), 4) for deduction_chain in deduction_chains for deduction in deduction_chain)
+    assert deduction_chains[0][0].region_positions == [(3, j) for j in range(9)]
+    assert deduction_chains[0][0].consequences == (
+        ((3, 3), 1), ((6, 5), 1), ((7, 3), 6), ((7, 7), 1), ((4, 6), 1), ((4, 7), 5), ((5, 7), 6), ((6, 3), 2), ((6, 4), 4),
+        ((6, 6), 8), ((6, 8), 6), ((0, 7), 3), ((0, 8), 5), ((3, 4), 6), ((3, 8), 7), ((3, 2), 9), ((3, 5), 5), ((8, 4), 5),
+        ((3, 6), 3), ((5, 5), 3), ((5, 6), 9), ((8, 3), 7), ((8, 5), 9), ((4, 3), 9), ((4, 5), 2), ((5, 2), 2), ((5, 3), 4),
+        ((4, 2), 7), ((4, 8), 4), ((5, 4), 7), ((5, 8), 8), ((4, 4), 8), ((0, 6), 4)
+    )
+
+    assert [[(deduction.initial_assumption_value, deduction.initial_assumption_position) for deduction in deduction_chain] for deduction_chain in sudoku.deduction_chain_1st_layer_consensus_at_position(6, 3)] == [
+        [(3, (0, 6)), (3, (0, 7))],
+        [(4, (0, 6)), (4, (0, 8))],
+        [(3, (0, 6)), (3, (3, 6)), (3, (5, 6))],
+        [(4, (0, 6)), (4, (4, 6)), (4, (5, 6))],
+        [(3, (0, 6)), (3, (0, 7))],
+        [(4, (0, 6)), (4, (0, 8))]
+    ]
+
 def test_consensus_sudoku() -> None:
     sudoku_models: List[SudokuModel] = SudokuRepository.get_all(candidate_type=SudokuSimplifiedCandidateType.FIRST_LAYER_CONSENSUS)
     assert sudoku_models
@@ -49,3 +124,179 @@ def test_consensus_sudoku() -> None:
         assert not sudoku.candidates_0th_layer_naked_singles
         assert not sudoku.candidates_0th_layer_hidden_singles
         assert sudoku.candidates_1st_layer_consensus
+
+def test_next_step_sudoku() -> None:
+    def state(sudoku: Sudoku) -> Tuple:
+        return (
+            sudoku.grid, sudoku.cells, sudoku.grid_columns, sudoku.grid_blocks,
+            sudoku.grid_rows_mask, sudoku.grid_columns_mask, sudoku.grid_blocks_mask,
+            sudoku.candidate_masks_0th_layer_plain, sudoku.candidate_masks_0th_layer_hidden_singles,
+            sudoku.candidates_0th_layer_plain, sudoku.candidates_0th_layer_naked_singles, sudoku.candidates_0th_layer_hidden_singles
+        )
+
+    steps: List[Tuple[List[List[int]], Tuple[int, int], int]] = [
+        ([[1, 0, 0, 0], [0, 0, 3, 0], [0, 4, 0, 0], [0, 0, 0, 2]], (0, 1), 2),
+        ([[1, 0, 0, 0], [0, 0, 3, 0], [0, 4, 0, 0], [0, 0, 0, 2]], (1, 2), 0),
+        ([[1, 0, 0, 0], [0, 0, 3, 0], [0, 4, 0, 0], [0, 0, 0, 2]], (2, 1), 1),
+        ([[1, 1, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]], (0, 1), 0),
+        ([[2, 7, 1, 8, 9, 6, 0, 0, 0], [9, 4, 3, 5, 2, 7, 6, 8, 1], [8, 5, 6, 3, 1, 4, 7, 9, 2], [4, 8, 0, 0, 0, 0, 0, 2, 0], [6, 3, 0, 0, 0, 0, 0, 0, 0], [5, 1, 0, 0, 0, 0, 0, 0, 0], [3, 9, 5, 0, 0, 0, 0, 7, 0], [7, 2, 4, 0, 3, 8, 5, 0, 9], [1, 6, 8, 0, 0, 0, 2, 4, 3]], (0, 6), 4),
+        ([[2, 7, 1, 8, 9, 6, 0, 0, 0], [9, 4, 3, 5, 2, 7, 6, 8, 1], [8, 5, 6, 3, 1, 4, 7, 9, 2], [4, 8, 0, 0, 0, 0, 0, 2, 0], [6, 3, 0, 0, 0, 0, 0, 0, 0], [5, 1, 0, 0, 0, 0, 0, 0, 0], [3, 9, 5, 0, 0, 0, 0, 7, 0], [7, 2, 4, 0, 3, 8, 5, 0, 9], [1, 6, 8, 0, 0, 0, 2, 4, 3]], (1, 4), 0),
+        ([[2, 7, 1, 8, 9, 6, 0, 0, 0], [9, 4, 3, 5, 2, 7, 6, 8, 1], [8, 5, 6, 3, 1, 4, 7, 9, 2], [4, 8, 0, 0, 0, 0, 0, 2, 0], [6, 3, 0, 0, 0, 0, 0, 0, 0], [5, 1, 0, 0, 0, 0, 0, 0, 0], [3, 9, 5, 0, 0, 0, 0, 7, 0], [7, 2, 4, 0, 3, 8, 5, 0, 9], [1, 6, 8, 0, 0, 0, 2, 4, 3]], (7, 4), 6)
+    ]
+
+    for grid, (i, j), value in steps:
+        for warm_up in [False, True]:
+            sudoku: Sudoku = Sudoku(grid)
+            if warm_up:
+                state(sudoku)
+            derived_sudoku: Sudoku = sudoku.next_step_at_position(i, j, value)
+            assert derived_sudoku.grid[i][j] == value
+            assert state(derived_sudoku) == state(Sudoku(derived_sudoku.grid))
+            assert state(derived_sudoku.next_step_at_position(i, j, grid[i][j])) == state(Sudoku(grid))
+
+def test_solver_backends_sudoku() -> None:
+    grid: List[List[int]] = [[0 for _ in range(4)] for _ in range(4)]
+    z3_solutions: Tuple[Sudoku, ...] = Sudoku(grid, solver=SudokuZ3Solver()).solve()
+    bitmask_solutions: Tuple[Sudoku, ...] = Sudoku(grid, solver=SudokuBitmaskSolver()).solve()
+    assert len(z3_solutions) == len(bitmask_solutions) == 288
+    assert set(z3_solutions) == set(bitmask_solutions)
+    assert len(Sudoku(grid, solver=SudokuBitmaskSolver()).solve(max_solutions=10)) == 10
+
+def test_z3_solver_scopes_sudoku() -> None:
+    grids: List[Tuple[Tuple[int, ...], ...]] = [
+        ((1, 0, 0, 0), (0, 0, 3, 0), (0, 4, 0, 0), (0, 0, 0, 2)),
+        ((2, 7, 1, 8, 9, 6, 0, 0, 0), (9, 4, 3, 5, 2, 7, 6, 8, 1), (8, 5, 6, 3, 1, 4, 7, 9, 2), (4, 8, 0, 0, 0, 0, 0, 2, 0), (6, 3, 0, 0, 0, 0, 0, 0, 0), (5, 1, 0, 0, 0, 0, 0, 0, 0), (3, 9, 5, 0, 0, 0, 0, 7, 0), (7, 2, 4, 0, 3, 8, 5, 0, 9), (1, 6, 8, 0, 0, 0, 2, 4, 3)),
+        ((1, 2, 3, 0), (0, 0, 0, 4), (0, 0, 0, 0), (0, 0, 0, 0)),
+        ((1, 0, 0, 0), (0, 0, 3, 0), (0, 4, 0, 0), (0, 0, 0, 2)),
+        ((1, 1, 0, 0), (0, 0, 0, 0), (0, 0, 0, 0), (0, 0, 0, 0)),
+        ((2, 7, 1, 8, 9, 6, 0, 0, 0), (9, 4, 3, 5, 2, 7, 6, 8, 1), (8, 5, 6, 3, 1, 4, 7, 9, 2), (4, 8, 0, 0, 0, 0, 0, 2, 0), (6, 3, 0, 0, 0, 0, 0, 0, 0), (5, 1, 0, 0, 0, 0, 0, 0, 0), (3, 9, 5, 0, 0, 0, 0, 7, 0), (7, 2, 4, 0, 3, 8, 5, 0, 9), (1, 6, 8, 0, 0, 0, 2, 4, 3)),
+        ((0, 0, 0, 0), (0, 0, 0, 0), (0, 0, 0, 0), (0, 0, 0, 0))
+    ]
+
+    z3_solver: SudokuZ3Solver = SudokuZ3Solver()
+    bitmask_solver: SudokuBitmaskSolver = SudokuBitmaskSolver()
+    for grid in grids:
+        assert set(z3_solver.solve(grid)) == set(bitmask_solver.solve(grid))
+    assert not z3_solver.solve(grids[2]) and not z3_solver.solve(grids[4])
+
+def test_solver_candidates_sudoku() -> None:
+    grid: Tuple[Tuple[int, ...], ...] = ((1, 0, 0, 0), (0, 0, 0, 0), (0, 0, 0, 0), (0, 0, 0, 2))
+    for solver in [SudokuBitmaskSolver(timeout=10), SudokuZ3Solver(timeout=10)]:
+        solutions: Tuple[Tuple[Tuple[int, ...], ...], ...] = solver.solve(grid)
+        assert len(solutions) > 1
+        assert solver.solve_candidates(grid) == tuple(
+            tuple({solution[i][j] for solution in solutions} if grid[i][j] == 0 else set() for j in range(4))
+            for i in range(4)
+        )
+
+def test_solver_timeout_sudoku() -> None:
+    grid: Tuple[Tuple[int, ...], ...] = tuple((0,) * 9 for _ in range(9))
+    for solver in [SudokuBitmaskSolver(timeout=1e-9), SudokuZ3Solver(timeout=1e-9)]:
+        with pytest.raises(SudokuSolverTimeoutException):
+            solver.solve_candidates(grid)
+        with pytest.raises(SudokuSolverTimeoutException):
+            solver.solve(grid, deadline=time.monotonic() + 0.05)
+
+def test_batch_analyzer_sudoku() -> None:
+    grids: List[List[List[int]]] = [
+        [[1, 0, 0, 0], [0, 0, 3, 0], [0, 4, 0, 0], [0, 0, 0, 2]],
+        [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],
+        [[1, 2, 0, 0], [3, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 4]],
+        [[1, 1, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+    ]
+
+    analysis: SudokuBatchAnalysis = SudokuBatchAnalyzer.analyze(np.array(grids))
+    assert analysis.valid.tolist() == [True, True, True, False]
+    for k, grid in enumerate(grids):
+        sudoku: Sudoku = Sudoku(grid)
+        for i, j in itertools.product(range(4), range(4)):
+            assert {v + 1 for v in np.flatnonzero(analysis.candidates[k, i, j])} == sudoku.candidate_values_0th_layer_plain_at_position(i, j)
+            assert {v + 1 for v in np.flatnonzero(analysis.naked_singles[k, i, j])} == sudoku.candidate_values_0th_layer_naked_singles_at_position(i, j)
+            assert {v + 1 for v in np.flatnonzero(analysis.hidden_singles[k, i, j])} == sudoku.candidate_values_0th_layer_hidden_singles_at_position(i, j)
+            assert analysis.candidate_masks[k, i, j] == sudoku.candidate_masks_0th_layer_plain[i * 4 + j]
+
+def test_seeded_factory_sudoku() -> None:
+    for candidate_type in [SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES]:
+        sudokus: List[Optional[Sudoku]] = [SudokuFactory(4).get_sudoku_by_seed(candidate_type, seed) for seed in range(20)]
+        assert any(sudokus)
+        assert sudokus == [SudokuFactory(4).get_sudoku_by_seed(candidate_type, seed) for seed in range(20)]
+
+def test_augmented_factory_sudoku() -> None:
+    factory: SudokuFactory = SudokuFactory(4)
+    for candidate_type in [SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES]:
+        sudoku: Sudoku = next(filter(None, (factory.get_sudoku_by_seed(candidate_type, seed) for seed in range(100))))
+        augmented_sudokus: List[Sudoku] = factory.get_augmented_sudokus(sudoku, candidate_type, 10, verify_rate=1.0)
+        assert augmented_sudokus and sudoku not in augmented_sudokus
+        assert all(augmented_sudoku.cells.count(0) == sudoku.cells.count(0) for augmented_sudoku in augmented_sudokus)
+
+def test_canonical_form_sudoku() -> None:
+    factory: SudokuFactory = SudokuFactory(9)
+    sudoku: Sudoku = next(filter(None, (factory.get_sudoku_by_seed(SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES, seed) for seed in range(100))))
+    assert sudoku.canonical_form.symmetry.apply(sudoku.grid) == sudoku.canonical_form.grid
+    assert pickle.loads(pickle.dumps(sudoku)).canonical_form == sudoku.canonical_form
+    for augmented_sudoku in factory.get_augmented_sudokus(sudoku, SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES, 5):
+        assert augmented_sudoku.canonical_form.grid == sudoku.canonical_form.grid
+        assert augmented_sudoku.canonical_form.symmetry.apply(augmented_sudoku.grid) == sudoku.canonical_form.grid
+        assert augmented_sudoku.canonical_form.hash == sudoku.canonical_form.hash
+    assert factory.get_solved_sudoku().canonical_form.hash != sudoku.canonical_form.hash
+
+def test_canonical_form_symmetry_sudoku() -> None:
+    rng: random.Random = random.Random(0)
+    grids: List[List[List[int]]] = [
+        [[1, 0, 0, 0], [0, 0, 3, 0], [0, 4, 0, 0], [0, 0, 0, 2]],
+        [[2, 7, 1, 8, 9, 6, 0, 0, 0], [9, 4, 3, 5, 2, 7, 6, 8, 1], [8, 5, 6, 3, 1, 4, 7, 9, 2], [4, 8, 0, 0, 0, 0, 0, 2, 0], [6, 3, 0, 0, 0, 0, 0, 0, 0], [5, 1, 0, 0, 0, 0, 0, 0, 0], [3, 9, 5, 0, 0, 0, 0, 7, 0], [7, 2, 4, 0, 3, 8, 5, 0, 9], [1, 6, 8, 0, 0, 0, 2, 4, 3]],
+        [[0, 0, 0, 0, 0, 0, 0, 0, 0] if i != 4 else [0, 0, 0, 0, 7, 0, 0, 0, 0] for i in range(9)]
+    ]
+
+    for grid in grids:
+        canonical_form: SudokuCanonicalForm = SudokuCanonicalForm.of(grid)
+        assert canonical_form.symmetry.apply(grid) == canonical_form.grid
+        for _ in range(5):
+            symmetric_canonical_form: SudokuCanonicalForm = SudokuCanonicalForm.of(SudokuSymmetry.sample(len(grid), rng).apply(grid))
+            assert symmetric_canonical_form.grid == canonical_form.grid
+            assert symmetric_canonical_form.hash == canonical_form.hash
+
+def test_generation_stats_factory_sudoku() -> None:
+    factory: SudokuFactory = SudokuFactory(4)
+    sudokus: List[Optional[Sudoku]] = list(factory.get_sudokus_by_candidate_type(SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, 5, 4, seeds=range(20), batch_size=5))
+    generation_stats: SudokuGenerationStats = factory.get_generation_stats(SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES)
+    assert generation_stats.attempts == len(sudokus) == 20
+    assert generation_stats.successes == sum(sudoku is not None for sudoku in sudokus)
+    assert generation_stats.seconds_per_attempt is not None and generation_stats.seconds_per_attempt > 0
+
+    augmented_factory: SudokuFactory = SudokuFactory(4)
+    augmented_sudokus: List[Optional[Sudoku]] = list(augmented_factory.get_sudokus_by_candidate_type(SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, 100, 1, seeds=range(20), batch_size=5, augmentations=3))
+    augmented_generation_stats: SudokuGenerationStats = augmented_factory.get_generation_stats(SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES)
+    assert augmented_generation_stats.attempts == 20
+    assert augmented_generation_stats.successes == generation_stats.successes == sum(SudokuFactory(4).get_sudoku_by_seed(SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, seed) is not None for seed in range(20))
+    assert sum(sudoku is not None for sudoku in augmented_sudokus) > augmented_generation_stats.successes
+
+def test_svg_figure_serializer_sudoku() -> None:
+    factory: SudokuFactory = SudokuFactory(4)
+    layout_factory: SudokuFigureLayoutFactory = SudokuFigureLayoutFactory(primary_color="red", secondary_color="darkgreen", tertiary_color="blue")
+    sudoku: Sudoku = next(filter(None, (factory.get_sudoku_by_seed(SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, seed) for seed in range(100))))
+    payload: List[bytes] = SudokuSvgFigureSerializer(layout_factory=layout_factory).serialize(sudoku, SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES)
+    assert len(payload) == len(layout_factory.get_naked_singles_sudoku_figure_layouts(sudoku)) == 1
+    assert ET.fromstring(payload[0]).tag == "{http://www.w3.org/2000/svg}svg"
+
+def test_batch_figure_serializer_sudoku() -> None:
+    factory: SudokuFactory = SudokuFactory(4)
+    serializer: SudokuSvgFigureSerializer = SudokuSvgFigureSerializer(layout_factory=SudokuFigureLayoutFactory(primary_color="red", secondary_color="darkgreen", tertiary_color="blue"))
+    sudokus: List[Tuple[Sudoku, SudokuSimplifiedCandidateType]] = [
+        (sudoku, candidate_type)
+        for candidate_type in [SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES, SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES]
+        for sudoku in itertools.islice(filter(None, (factory.get_sudoku_by_seed(candidate_type, seed) for seed in range(100))), 3)
+    ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        payloads: List[List[bytes]] = serializer.serialize_many(sudokus, executor=executor)
+    assert payloads == [serializer.serialize(sudoku, candidate_type) for sudoku, candidate_type in sudokus]
+
+def test_figure_cache_sudoku(tmp_path: Path) -> None:
+    figure_cache: SudokuFigureCache = SudokuFigureCache(max_bytes=100, directory=tmp_path, directory_max_bytes=200)
+    figure_cache.set("a", [b"a" * 40, b"b" * 20])
+    figure_cache.set("b", [b"c" * 60])
+    assert figure_cache.get("b") == [b"c" * 60]
+    assert figure_cache.get("a") == [b"a" * 40, b"b" * 20]
+    figure_cache.set("c", [b"d" * 120])
+    assert figure_cache.get("b") is None
+    assert SudokuFigureCache(max_bytes=100, directory=tmp_path, directory_max_bytes=200).get("c") == [b"d" * 120]
@@ -0,0 +1,81 @@
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Sequence
+from core.exceptions.sudoku_exceptions import SudokuInvalidDimensionsException
+
+@dataclass(frozen=True)
+class SudokuBatchAnalysis:
+    # (B,) whether no digit is given twice in a row, column or block of the grid
+    valid: np.ndarray
+    # (B, n, n, n) whether value v + 1 is a plain candidate of cell (i, j)
+    candidates: np.ndarray
+    # (B, n, n) plain candidates of each cell as bitmasks (bit 1 << value), as in Sudoku.candidate_masks_0th_layer_plain
+    candidate_masks: np.ndarray
+    # (B, n, n, n) naked and hidden singles, with the same semantics as the per-cell accessors of Sudoku
+    naked_singles: np.ndarray
+    hidden_singles: np.ndarray
+
+    @property
+    def zeroth_layer(self) -> np.ndarray:
+        singles: np.ndarray = self.naked_singles | self.hidden_singles
+        # Per cell, the singles when it has any and its plain candidates otherwise, as in Sudoku's 0th layer
+        return np.where(singles.any(axis=3, keepdims=True), singles, self.candidates)
+
+class SudokuBatchAnalyzer:
+    @classmethod
+    def analyze(cls, grids: np.ndarray | Sequence[Sequence[Sequence[int]]]) -> SudokuBatchAnalysis:
+        grids = np.asarray(grids)
+        if grids.ndim != 3 or grids.shape[1] != grids.shape[2]:
+            raise SudokuInvalidDimensionsException("Grids must be a (B, n, n) array of square grids")
+
+        b, n = grids.shape[0], grids.shape[1]
+        n_isqrt: int = math.isqrt(n)
+        if n != n_isqrt ** 2:
+            raise SudokuInvalidDimensionsException("Grid size must be a perfect square")
+
+        # One-hot givens: given[b, i, j, v] is set when cell (i, j) holds value v + 1
+        given: np.ndarray = grids[..., None] == np.arange(1, n + 1)
+        empty: np.ndarray = grids == 0
+
+        row_counts: np.ndarray = given.sum(axis=2, dtype=np.int32)
+        column_counts: np.ndarray = given.sum(axis=1, dtype=np.int32)
+        block_counts: np.ndarray = cls.__block_sum(given, n_isqrt)
+        valid: np.ndarray = (
+            (row_counts <= 1).all(axis=(1, 2)) &
+            (column_counts <= 1).all(axis=(1, 2)) &
+            (block_counts <= 1).all(axis=(1, 2, 3))
+        )
+
+        used: np.ndarray = (row_counts[:, :, None, :] > 0) | (column_counts[:, None, :, :] > 0) | cls.__block_broadcast(block_counts > 0, n_isqrt)
+        candidates: np.ndarray = ~used & empty[..., None]
+        candidate_counts: np.ndarray = candidates.sum(axis=3, dtype=np.int32)
+        naked_singles: np.ndarray = candidates & (candidate_counts == 1)[..., None]
+
+        # Hidden singles: values of a cell with several candidates that no other cell of one of its units can hold,
+        # kept only when exactly one such value exists
+        hidden_singles: np.ndarray = candidates & (candidate_counts >= 2)[..., None] & (
+            (candidates.sum(axis=2, dtype=np.int32) == 1)[:, :, None, :] |
+            (candidates.sum(axis=1, dtype=np.int32) == 1)[:, None, :, :] |
+            cls.__block_broadcast(cls.__block_sum(candidates, n_isqrt) == 1, n_isqrt)
+        )
+        hidden_singles &= (hidden_singles.sum(axis=3, dtype=np.int32) == 1)[..., None]
+
+        return SudokuBatchAnalysis(
+            valid=valid,
+            candidates=candidates,
+            candidate_masks=(candidates.astype(np.int64) << np.arange(1, n + 1, dtype=np.int64)).sum(axis=3),
+            naked_singles=naked_singles,
+            hidden_singles=hidden_singles
+        )
+
+    @classmethod
+    def __block_sum(cls, values: np.ndarray, n_isqrt: int) -> np.ndarray:
+        # (B, n, n, n) -> (B, n_isqrt, n_isqrt, n): per block row, block column and value
+        b, n = values.shape[0], values.shape[1]
+        return values.reshape(b, n_isqrt, n_isqrt, n_isqrt, n_isqrt, n).sum(axis=(2, 4), dtype=np.int32)
+
+    @classmethod
+    def __block_broadcast(cls, values: np.ndarray, n_isqrt: int) -> np.ndarray:
+        # (B, n_isqrt, n_isqrt, n) -> (B, n, n, n): every cell gets the value of its block
+        return values.repeat(n_isqrt, axis=1).repeat(n_isqrt, axis=2)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+class SudokuRenderStatus(Enum):
+    # LAZY sudokus (created in the lazy image mode) have no stored figures: they are rendered when requested
+    LAZY = "LAZY"
+    PENDING = "PENDING"
+    RENDERED = "RENDERED"
+    FAILED = "FAILED"
@@ -1,2 +1,5 @@
 class SudokuInvalidDimensionsException(Exception):
     pass
+
+class SudokuAugmentationException(Exception):
+    pass
@@ -0,0 +1,2 @@
+class SudokuSolverTimeoutException(Exception):
+    pass
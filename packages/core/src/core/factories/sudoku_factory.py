@@ -1,64 +1,212 @@
 import math
 import random
 import multiprocessing
-from concurrent.futures import Future, as_completed
+import time
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
 from concurrent.futures.process import ProcessPoolExecutor
-from typing import List, Tuple, Optional, Iterator
+from dataclasses import dataclass
+from typing import List, Tuple, Dict, Set, Optional, Iterator
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
-from core.sudoku import Sudoku, SudokuCandidate
+from core.exceptions.sudoku_exceptions import SudokuAugmentationException
+from core.solvers.sudoku_bitmask_solver import SudokuBitmaskSolver
+from core.solvers.sudoku_solver import SudokuSolver
+from core.sudoku import Sudoku
+from core.sudoku_generation_stats import SudokuGenerationStats
+from core.sudoku_symmetry import SudokuSymmetry
+from core.sudoku_topology import SudokuTopology
+
+@dataclass(frozen=True, slots=True)
+class SudokuGenerationBatch:
+    # successes and seconds only count the seeds' attempts, the symmetric copies in sudokus took augmentation_seconds
+    sudokus: List[Sudoku]
+    attempts: int
+    successes: int
+    seconds: float
+    augmentation_seconds: float = 0.0
 
 class SudokuFactory:
-    def __init__(self, n: int, max_solutions: Optional[int] = None) -> None:
-        self.__sudoku: Sudoku = Sudoku(grid=[[0 for _ in range(n)] for _ in range(n)])
-        self.__sudoku_solutions: Tuple[Sudoku, ...] = self.__sudoku.solve(max_solutions=max_solutions)
+    def __init__(self, n: int, solver: Optional[SudokuSolver] = None) -> None:
+        self.__sudoku: Sudoku = Sudoku(grid=[[0 for _ in range(n)] for _ in range(n)], solver=solver)
+        self.__solver: Optional[SudokuSolver] = solver
+        self.__solution_sampler: SudokuBitmaskSolver = SudokuBitmaskSolver()
+        self.__rng: random.Random = random.Random()
+        self.__generation_stats: Dict[SudokuSimplifiedCandidateType, SudokuGenerationStats] = {candidate_type: SudokuGenerationStats() for candidate_type in SudokuSimplifiedCandidateType}
 
     @property
     def n(self) -> int:
         return len(self.__sudoku)
 
+    def get_generation_stats(self, candidate_type: SudokuSimplifiedCandidateType) -> SudokuGenerationStats:
+        return self.__generation_stats[candidate_type]
+
     def get_empty_sudoku(self) -> Sudoku:
         return self.__sudoku
 
-    def get_solved_sudoku(self) -> Sudoku:
-        return random.choice(self.__sudoku_solutions)
+    def get_solved_sudoku(self, rng: Optional[random.Random] = None) -> Sudoku:
+        # Solved grids are sampled on demand: a randomized backtracking fill of the empty grid, then a random symmetry
+        # (digit relabeling, band, stack, row and column permutations, transposition) on top of it
+        rng = rng or self.__rng
+        solution_grid: Tuple[Tuple[int, ...], ...] = self.__solution_sampler.sample_solution(self.__sudoku.grid, rng=rng)
+        return Sudoku(SudokuSymmetry.sample(self.n, rng=rng).apply(solution_grid), solver=self.__solver)
+
+    def get_sudoku_by_seed(self, candidate_type: SudokuSimplifiedCandidateType, seed: int) -> Optional[Sudoku]:
+        # Each attempt draws from its own generator seeded with (seed, n, candidate type), so the same triple always
+        # gives the same puzzle (or the same failure) on any worker or machine
+        rng: random.Random = random.Random(f"{seed}:{self.n}:{candidate_type.value}")
+        return self.convert_sudoku_grid_into_candidate_type(self.get_solved_sudoku(rng=rng).grid, candidate_type, rng=rng)
+
+    def get_augmented_sudokus(self, sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType, count: int, verify_rate: float = 0.0, rng: Optional[random.Random] = None) -> List[Sudoku]:
+        # Naked singles, hidden singles and consensus are invariant under the validity-preserving symmetries, so random
+        # transforms of a verified puzzle are puzzles of the same candidate type. A verify_rate share of them is checked
+        # again anyway, as a guard against transforms that would not preserve the classification
+        rng = rng or self.__rng
+        augmented_sudokus: Dict[Sudoku, None] = {}
+        for _ in range(count):
+            augmented_sudoku: Sudoku = sudoku.transform(SudokuSymmetry.sample(self.n, rng=rng))
+            if augmented_sudoku == sudoku or augmented_sudoku in augmented_sudokus:
+                continue
+
+            if rng.random() < verify_rate and not self.__is_sudoku_of_candidate_type(augmented_sudoku, candidate_type):
+                raise SudokuAugmentationException(f"Augmented {self.n}x{self.n} grid is not of candidate type: {candidate_type.name}")
+            augmented_sudokus[augmented_sudoku] = None
+        return list(augmented_sudokus)
+
+    def get_sudokus_by_candidate_type(
+            self,
+            candidate_type: SudokuSimplifiedCandidateType,
+            target_count: int,
+            max_attempts: int,
+            max_in_flight: Optional[int] = None,
+            batch_size: int = 16,
+            seeds: Optional[range] = None,
+            augmentations: int = 0,
+            verify_rate: float = 0.0,
+            max_seconds: Optional[float] = None,
+            executor: Optional[Executor] = None
+    ) -> Iterator[Optional[Sudoku]]:
+        # Without a (long-lived) executor from the caller, a pool is created for this call only
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=multiprocessing.cpu_count(), initializer=self.warm_up, initargs=(self.n,)) as executor:
+                yield from self.get_sudokus_by_candidate_type(candidate_type, target_count, max_attempts, max_in_flight=max_in_flight, batch_size=batch_size, seeds=seeds, augmentations=augmentations, verify_rate=verify_rate, max_seconds=max_seconds, executor=executor)
+            return
+
+        # Streaming submission: only a bounded window of batches is queued at once and it is refilled as results come
+        # in, so once the caller stops consuming (it has enough puzzles) the batches that never started are cancelled.
+        # Each batch runs the attempts of a range of seeds (solved grids included) in the worker and only sends back the
+        # puzzles found (each followed by up to augmentations symmetric copies), failed attempts are reported to the
+        # caller as None. Without explicit seeds, a random range of target_count * max_attempts seeds is used
+        if seeds is None:
+            seed: int = self.__rng.getrandbits(63)
+            seeds = range(seed, seed + target_count * max_attempts)
+
+        max_in_flight = max_in_flight or 2 * multiprocessing.cpu_count()
+        workers: int = min(max_in_flight, multiprocessing.cpu_count())
+        generation_stats: SudokuGenerationStats = self.__generation_stats[candidate_type]
+        started_at: float = time.perf_counter()
+        remaining_seeds: range = seeds
+        in_flight_attempts: int = 0
+        yielded_sudokus: int = 0
+        yielded_successes: int = 0
+        augmentation_seconds: float = 0.0
+        # The stats only count the seeds' own successes, so the missing puzzles are turned into missing successes by the
+        # number of puzzles (the seed's and its symmetric copies) each success has yielded so far in this request
+        missing_successes: int = math.ceil(target_count / (1 + augmentations))
+        futures: Set[Future[SudokuGenerationBatch]] = set()
+        try:
+            while remaining_seeds or futures:
+                # Adaptive budget: besides the window, only as many attempts are kept in flight as the success rate
+                # observed so far for this (n, candidate type) says are needed (twice over) for the missing successes
+                while remaining_seeds and len(futures) < max_in_flight and (not futures or in_flight_attempts * generation_stats.estimated_success_rate < 2 * max(missing_successes, 1)):
+                    batch_seeds: range = remaining_seeds[:batch_size]
+                    futures.add(executor.submit(self.get_sudokus_by_seeds, self.n, candidate_type, batch_seeds, augmentations, verify_rate))
+                    remaining_seeds = remaining_seeds[batch_size:]
+                    in_flight_attempts += len(batch_seeds)
 
-    def get_sudokus_by_candidate_type(self, candidate_type: SudokuSimplifiedCandidateType, target_count: int, max_attempts: int) -> Iterator[Optional[Sudoku]]:
-        with ProcessPoolExecutor(max_workers=multiprocessing.cpu_count()) as executor:
-            futures: List[Future[Optional[Sudoku]]] = [
-                executor.submit(self.convert_sudoku_grid_into_candidate_type, self.get_solved_sudoku().grid, candidate_type)
-                for _ in range(target_count * max_attempts)
-            ]
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    futures.remove(future)
+                    batch: SudokuGenerationBatch = future.result()
+                    in_flight_attempts -= batch.attempts
+                    generation_stats.record(batch.attempts, batch.successes, batch.seconds)
+                    yielded_sudokus += len(batch.sudokus)
+                    yielded_successes += batch.successes
+                    augmentation_seconds += batch.augmentation_seconds
+                    yield from batch.sudokus
+                    for _ in range(batch.attempts - batch.successes):
+                        yield None
 
-            for future in as_completed(futures):
-                yield future.result()
+                sudokus_per_success: float = yielded_sudokus / yielded_successes if yielded_successes else 1 + augmentations
+                missing_successes = math.ceil(max(target_count - yielded_sudokus, 0) / sudokus_per_success)
+
+                # Early stop: give up once the missing successes (and their copies) are projected to take longer than the
+                # time left
+                if max_seconds is not None and missing_successes > 0:
+                    augmentation_seconds_per_success: float = augmentation_seconds / yielded_successes if yielded_successes else 0.0
+                    projected_seconds: float = missing_successes * (generation_stats.seconds_per_success + augmentation_seconds_per_success) / workers
+                    if time.perf_counter() - started_at + projected_seconds > max_seconds:
+                        return
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def warm_up(*ns: int) -> None:
+        # Worker initializer: pays the per-size precomputation (topology, empty-grid candidate masks) once per process
+        # instead of in the first attempts it runs
+        for n in ns:
+            SudokuTopology.of(n)
+            _ = Sudoku([[0 for _ in range(n)] for _ in range(n)]).candidate_masks_0th_layer_hidden_singles
+
+    @staticmethod
+    def get_sudokus_by_seeds(n: int, candidate_type: SudokuSimplifiedCandidateType, seeds: range, augmentations: int = 0, verify_rate: float = 0.0) -> SudokuGenerationBatch:
+        started_at: float = time.perf_counter()
+        factory: SudokuFactory = SudokuFactory(n)
+        sudokus: List[Sudoku] = []
+        successes: int = 0
+        augmentation_seconds: float = 0.0
+        for seed in seeds:
+            sudoku: Optional[Sudoku] = factory.get_sudoku_by_seed(candidate_type, seed)
+            if sudoku is None:
+                continue
+
+            # The canonical form (hashed into the stored sudoku) is searched for here, in the worker, and pickled back
+            # with the puzzle; its symmetric copies derive theirs from it
+            _ = sudoku.canonical_form
+            successes += 1
+            sudokus.append(sudoku)
+            if augmentations > 0:
+                augmentation_started_at: float = time.perf_counter()
+                rng: random.Random = random.Random(f"{seed}:{n}:{candidate_type.value}:augmentations")
+                sudokus.extend(factory.get_augmented_sudokus(sudoku, candidate_type, augmentations, verify_rate=verify_rate, rng=rng))
+                augmentation_seconds += time.perf_counter() - augmentation_started_at
+        return SudokuGenerationBatch(sudokus=sudokus, attempts=len(seeds), successes=successes, seconds=time.perf_counter() - started_at - augmentation_seconds, augmentation_seconds=augmentation_seconds)
 
     @staticmethod
-    def convert_sudoku_grid_into_candidate_type(sudoku_grid: Tuple[Tuple[int, ...], ...], candidate_type: SudokuSimplifiedCandidateType) -> Optional[Sudoku]:
+    def convert_sudoku_grid_into_candidate_type(sudoku_grid: Tuple[Tuple[int, ...], ...], candidate_type: SudokuSimplifiedCandidateType, rng: Optional[random.Random] = None) -> Optional[Sudoku]:
+        # Incremental digging: each removal derives the next grid from the previous one, so only the candidate state of
+        # the emptied cell and its peers is recomputed. The predicates are checked after every removal since none of
+        # them is monotonic in the number of removed cells (a removal can create or break naked and hidden singles),
+        # which rules out skipping removal counts or binary-searching the depth
         n: int = len(sudoku_grid)
-        sudoku_grid: List[List[int]] = [list(x) for x in sudoku_grid]
+        sudoku: Sudoku = Sudoku(sudoku_grid)
         sudoku_grid_positions: List[Tuple[int, int]] = [(i, j) for i in range(n) for j in range(n)]
-        random.shuffle(sudoku_grid_positions)
+        (rng or random).shuffle(sudoku_grid_positions)
 
         for removed_cells, (i, j) in enumerate(sudoku_grid_positions):
-            sudoku_grid[i][j] = 0
-            sudoku = Sudoku(sudoku_grid)
-            candidates: Optional[Tuple[SudokuCandidate, ...]] = None
-
-            match candidate_type:
-                case SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES:
-                    min_removed_cells: int = math.ceil(sudoku.area() * 0.25)
-                    if removed_cells < min_removed_cells or sudoku.candidates_0th_layer_hidden_singles:
-                        continue
-                    candidates = sudoku.candidates_0th_layer_naked_singles
-                case SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES:
-                    if sudoku.candidates_0th_layer_naked_singles:
-                        continue
-                    candidates = sudoku.candidates_0th_layer_hidden_singles
-                case SudokuSimplifiedCandidateType.FIRST_LAYER_CONSENSUS:
-                    if sudoku.candidates_0th_layer_naked_singles or sudoku.candidates_0th_layer_hidden_singles:
-                        continue
-                    candidates = sudoku.candidates_1st_layer_consensus
-
-            if candidates:
+            sudoku = sudoku.next_step_at_position(i, j, 0)
+            if candidate_type == SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES and removed_cells < math.ceil(sudoku.area() * 0.25):
+                continue
+            if SudokuFactory.__is_sudoku_of_candidate_type(sudoku, candidate_type):
                 return sudoku
         return None
+
+    @staticmethod
+    def __is_sudoku_of_candidate_type(sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType) -> bool:
+        match candidate_type:
+            case SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES:
+                return not sudoku.candidates_0th_layer_hidden_singles and bool(sudoku.candidates_0th_layer_naked_singles)
+            case SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES:
+                return not sudoku.candidates_0th_layer_naked_singles and bool(sudoku.candidates_0th_layer_hidden_singles)
+            case SudokuSimplifiedCandidateType.FIRST_LAYER_CONSENSUS:
+                return not sudoku.candidates_0th_layer_naked_singles and not sudoku.candidates_0th_layer_hidden_singles and bool(sudoku.candidates_1st_layer_consensus)
+        return False
@@ -1,201 +1,68 @@
 import itertools
 import math
 import matplotlib
-import matplotlib.patheffects as pe
 import matplotlib.pyplot as plt
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Dict, Set
+from typing import ClassVar, Optional, List, Tuple, Dict, Set
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PathCollection
 from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 from matplotlib.patches import Rectangle, Circle, FancyArrowPatch
-from matplotlib.text import Text
-from core.enums.sudoku_candidate_type import SudokuCandidateType
-from core.sudoku import Sudoku, SudokuCandidate, SudokuConsensusDeductionChain
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath, text_to_path
+from matplotlib.transforms import Affine2D
+from core.sudoku import Sudoku
+from core.sudoku_figure_layout import SudokuFigureOverlay, SudokuFigureLayout
 
 matplotlib.use("Agg")
 
-@dataclass(frozen=True)
-class SudokuFigureElementOverlay[T]:
-    element: T
-    color: Optional[str] = None
-
-@dataclass(frozen=True)
-class SudokuFigureCircleCandidateElementOverlay:
-    value: int
-    excluded_positions: Optional[List[Tuple[int, int]]]
-
-@dataclass(frozen=True)
-class SudokuFigureOverlay:
-    text_color_cells: List[SudokuFigureElementOverlay[Tuple[int, int]]] = field(default_factory=list)
-    candidate_cells: Dict[SudokuCandidateType, List[SudokuFigureElementOverlay[Tuple[int, int]]]] = field(default_factory=dict)
-    circle_candidate_values: List[SudokuFigureCircleCandidateElementOverlay] = field(default_factory=list)
-    circle_cells: List[SudokuFigureElementOverlay[Tuple[int, int]]] = field(default_factory=list)
-    arrow_cells: List[SudokuFigureElementOverlay[Tuple[Tuple[int, int], Tuple[int, int]]]] = field(default_factory=list)
-
 class SudokuFigureFactory:
-    def __init__(self, primary_color: str, secondary_color: str, tertiary_color: str) -> None:
-        self.__primary_color: str = primary_color
-        self.__secondary_color: str = secondary_color
-        self.__tertiary_color: str = tertiary_color
-
-    def get_naked_singles_sudoku_figures(self, sudoku: Sudoku) -> List[Figure]:
-        return self.__get_single_candidate_principle_sudoku_figures(sudoku, sudoku.candidates_0th_layer_naked_singles)
-
-    def get_hidden_singles_sudoku_figures(self, sudoku: Sudoku) -> List[Figure]:
-        return self.__get_single_candidate_principle_sudoku_figures(sudoku, sudoku.candidates_0th_layer_hidden_singles)
-
-    def get_consensus_sudoku_figures(self, sudoku: Sudoku) -> List[Figure]:
-        n: int = len(sudoku)
-        figures: List[Figure] = []
-        for candidate in sudoku.candidates_1st_layer_consensus:
-            deduction_chains: List[List[SudokuConsensusDeductionChain]] = sudoku.deduction_chain_1st_layer_consensus_at_position(*candidate.position)
-            for deduction_chain in deduction_chains:
-                width: int = max(1, len(deduction_chain)) | 1
-                width_middle: int = width // 2
-
-                fig, ax = self.__subplots(n, width=width, height=3)
-                initial_sub_ax: Axes = self.__sub_ax(ax, position=(0, width_middle))
-                self.__plot_sudoku_on_sub_ax(
-                    sub_ax=initial_sub_ax,
-                    sudoku=sudoku,
-                    overlay=SudokuFigureOverlay(
-                        candidate_cells={
-                            SudokuCandidateType.ZEROTH_LAYER: [
-                                SudokuFigureElementOverlay(element=element, color=self.__primary_color if element == candidate.position else self.__tertiary_color)
-                                for element in {position for x in deduction_chain for position in x.region_positions} | {candidate.position}
-                            ]
-                        },
-                        circle_candidate_values=[
-                            SudokuFigureCircleCandidateElementOverlay(value=deduction_chain[0].initial_assumption_value, excluded_positions=[candidate.position])
-                        ]
-                    )
-                )
-
-                middle_sub_axes: List[Axes] = []
-                for step_column, deduction in enumerate(deduction_chain):
-                    if len(deduction_chain) % 2 == 0 and step_column >= width_middle:
-                        step_column += 1
-
-                    current_sudoku: Sudoku = sudoku
-                    for consequence in deduction.consequences:
-                        current_sudoku = current_sudoku.next_step_at_position(
-                            consequence[0][0],
-                            consequence[0][1],
-                            consequence[1]
-                        )
-
-                    middle_sub_ax: Axes = self.__sub_ax(ax, position=(1, step_column))
-                    middle_consequence_positions: List[Tuple[int, int]] = [consequence[0] for consequence in deduction.consequences]
-                    self.__plot_sudoku_on_sub_ax(
-                        sub_ax=middle_sub_ax,
-                        sudoku=current_sudoku,
-                        overlay=SudokuFigureOverlay(
-                            text_color_cells=[
-                                SudokuFigureElementOverlay(element=x, color=self.__primary_color if x == candidate.position else self.__secondary_color if x == deduction.initial_assumption_position else self.__tertiary_color)
-                                for x in middle_consequence_positions
-                            ],
-                            circle_cells=[
-                                SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color),
-                                SudokuFigureElementOverlay(element=deduction.initial_assumption_position, color=self.__secondary_color)
-                            ],
-                            arrow_cells=[
-                                SudokuFigureElementOverlay(element=x, color=self.__primary_color)
-                                for x in [
-                                    (middle_consequence_positions[i], middle_consequence_positions[i + 1])
-                                    for i in range(len(middle_consequence_positions) - 1)
-                                ]
-                            ]
-                        )
-                    )
-
-                    middle_sub_axes.append(middle_sub_ax)
-                final_sub_ax: Axes = self.__sub_ax(ax, position=(2, width_middle))
-                self.__plot_final_sudoku_on_sub_ax(sub_ax=final_sub_ax, sudoku=sudoku, candidate=candidate)
-                self.__connect_ax(ax, initial_sub_ax, final_sub_ax, middle_sub_axes=middle_sub_axes)
-                figures.append(fig)
-        return figures
+    __base_grid_segments: ClassVar[Dict[int, Tuple[np.ndarray, np.ndarray]]] = {}
+    __text_paths: ClassVar[Dict[Tuple[str, float, str], Path]] = {}
 
-    def __get_single_candidate_principle_sudoku_figures(self, sudoku: Sudoku, candidates: Tuple[SudokuCandidate, ...]) -> List[Figure]:
-        n: int = len(sudoku)
-        figures: List[Figure] = []
-        for candidate in candidates:
-            fig, ax = self.__subplots(n, width=1, height=2)
-            initial_sub_ax, final_sub_ax = self.__sub_ax(ax, position=(0, 0)), self.__sub_ax(ax, position=(1, 0))
-            self.__plot_sudoku_on_sub_ax(
-                sub_ax=initial_sub_ax,
-                sudoku=sudoku,
-                overlay=SudokuFigureOverlay(
-                    candidate_cells={
-                        SudokuCandidateType.ZEROTH_LAYER_PLAIN: [
-                            SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color)
-                        ]
-                    }
-                )
-            )
-
-            self.__plot_final_sudoku_on_sub_ax(final_sub_ax, sudoku=sudoku, candidate=candidate)
-            self.__connect_ax(ax, initial_sub_ax, final_sub_ax)
-            figures.append(fig)
-            break
-        return figures
-
-    def __plot_final_sudoku_on_sub_ax(self, sub_ax: Axes, sudoku: Sudoku, candidate: SudokuCandidate) -> None:
-        return self.__plot_sudoku_on_sub_ax(
-            sub_ax=sub_ax,
-            sudoku=sudoku.next_step_at_position(*candidate.position, candidate.value),
-            overlay=SudokuFigureOverlay(
-                text_color_cells=[
-                    SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color)
-                ],
-                circle_cells=[
-                    SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color)
-                ]
-            )
-        )
+    @classmethod
+    def get_layout_figure(cls, layout: SudokuFigureLayout) -> Figure:
+        fig, ax = cls.__subplots(layout.n, width=layout.width, height=layout.height)
+        sub_axes: List[Axes] = []
+        for panel in layout.panels:
+            sub_ax: Axes = cls.__sub_ax(ax, position=panel.position)
+            cls.__plot_sudoku_on_sub_ax(sub_ax=sub_ax, sudoku=panel.sudoku, overlay=panel.overlay)
+            sub_axes.append(sub_ax)
+
+        for panel_from, panel_to in layout.connections:
+            cls.__connect_sub_axes(ax, sub_axes[panel_from], sub_axes[panel_to])
+        return fig
 
-    def __plot_sudoku_on_sub_ax(self, sub_ax: Axes, sudoku: Sudoku, overlay: SudokuFigureOverlay) -> None:
+    @classmethod
+    def __plot_sudoku_on_sub_ax(cls, sub_ax: Axes, sudoku: Sudoku, overlay: SudokuFigureOverlay) -> None:
         n, n_isqrt = sudoku.shape()
         sub_ax.set_xlim(0, n)
         sub_ax.set_ylim(0, n)
-        sub_ax.set_xticks(np.arange(0, n + 1))
-        sub_ax.set_yticks(np.arange(0, n + 1))
-        sub_ax.set_xticklabels([])
-        sub_ax.set_yticklabels([])
         sub_ax.set_aspect("equal")
         sub_ax.axis("off")
 
-        # Base Grid
-        text_positions: Dict[Tuple[int, int], Text] = {}
-        for i, j in itertools.product(range(n), range(n)):
-            sub_ax.add_patch(
-                Rectangle(
-                    self.__cell_bottom_left(n, position=(i, j)),
-                    width=1,
-                    height=1,
-                    fill=False,
-                    linewidth=0.75,
-                    zorder=3
-                )
-            )
-
-            if sudoku.grid[i][j] != 0:
-                text_positions[(i, j)] = sub_ax.text(
-                    *self.__cell_center(n, position=(i, j)),
-                    s=str(sudoku.grid[i][j]),
-                    ha="center",
-                    va="center",
-                    fontsize=20
-                )
+        # Base Grid: the cell and block lines of every sub-grid of size n are two cached line collections
+        cell_segments, block_segments = cls.__get_base_grid_segments(n)
+        sub_ax.add_collection(LineCollection(cell_segments, linewidths=0.75, colors="black", zorder=3), autolim=False)
+        sub_ax.add_collection(LineCollection(block_segments, linewidths=1.5, colors="black", zorder=2), autolim=False)
+        sub_ax.add_patch(Rectangle((0, 0), n, n, fill=False, linewidth=3, zorder=3))
 
-        # Text Colors
-        for cell in overlay.text_color_cells:
-            position: Tuple[int, int] = cell.element
-            if position in text_positions:
-                text_positions[position].set_color(cell.color or "black")
+        # Digits
+        text_colors: Dict[Tuple[int, int], str] = {cell.element: cell.color or "black" for cell in overlay.text_color_cells}
+        cls.__add_texts(
+            sub_ax,
+            texts=[
+                (cls.__cell_center(n, position=(i, j)), str(sudoku.grid[i][j]), text_colors.get((i, j), "black"))
+                for i, j in itertools.product(range(n), range(n))
+                if sudoku.grid[i][j] != 0
+            ],
+            fontsize=20
+        )
 
         # Candidates
         n_inv_isqrt: float = 1 / n_isqrt
+        candidate_texts: List[Tuple[Tuple[float, float], str, str]] = []
         for candidate_type, cells in overlay.candidate_cells.items():
             for cell in cells:
                 i, j = cell.element
@@ -206,68 +73,105 @@ class SudokuFigureFactory:
                 if not candidates:
                     continue
 
-                color: str = cell.color or self.__primary_color
-                x0, y0 = self.__cell_top_left(n, position=(i, j), margins=(0, -0.05) if n > 4 else None)
+                color: str = cell.color or "black"
+                x0, y0 = cls.__cell_top_left(n, position=(i, j), margins=(0, -0.05) if n > 4 else None)
                 for idx, candidate in enumerate(sorted(candidates)):
                     row, column = divmod(idx, n_isqrt)
-                    x, y = x0 + n_inv_isqrt * (column + 0.5), y0 - n_inv_isqrt * (row + 0.5)
-                    highlighted: bool = any(
-                        candidate == circle_candidate.value and (circle_candidate.excluded_positions is None or (i, j) not in circle_candidate.excluded_positions)
-                        for circle_candidate in overlay.circle_candidate_values or []
-                    )
-
-                    sub_ax.text(
-                        x=x,
-                        y=y,
-                        s=str(candidate),
-                        ha="center",
-                        va="center",
-                        fontsize=12 if n > 4 else 15,
-                        color=color if not highlighted else self.__secondary_color
-                    )
+                    candidate_texts.append(((x0 + n_inv_isqrt * (column + 0.5), y0 - n_inv_isqrt * (row + 0.5)), str(candidate), overlay.candidate_color((i, j), candidate) or color))
+        cls.__add_texts(sub_ax, texts=candidate_texts, fontsize=12 if n > 4 else 15)
 
         # Circles
         for cell in overlay.circle_cells:
             sub_ax.add_patch(
                 Circle(
-                    self.__cell_center(n, position=cell.element),
+                    cls.__cell_center(n, position=cell.element),
                     radius=0.35,
                     fill=False,
-                    edgecolor=cell.color or self.__primary_color,
+                    edgecolor=cell.color or "black",
                     linewidth=1.5
                 )
             )
 
         # Arrows
         if overlay.arrow_cells:
-            color: str = overlay.arrow_cells[0].color or self.__primary_color
+            color: str = overlay.arrow_cells[0].color or "black"
             positions: List[Tuple[float, float]] = [
-                self.__cell_bottom_right(n, position=position, margins=(-0.25, +0.16))
+                cls.__cell_bottom_right(n, position=position, margins=(-0.25, +0.16))
                 for position in [overlay.arrow_cells[0].element[0], *[cell.element[1] for cell in overlay.arrow_cells]]
             ]
 
             sub_ax.plot(*zip(*positions), linewidth=1.5, alpha=0.5, linestyle="-", zorder=1, color=color)
-            for idx, position in enumerate(positions):
-                sub_ax.text(
-                    *position,
-                    s=f"{idx:02d}",
-                    ha="center",
-                    va="center",
-                    weight="bold",
-                    fontsize=10,
-                    path_effects=[
-                        pe.Stroke(linewidth=3, foreground="white"),
-                        pe.Normal()
-                    ],
-                    zorder=2,
-                    color=color
-                )
+            cls.__add_texts(
+                sub_ax,
+                texts=[(position, f"{idx:02d}", color) for idx, position in enumerate(positions)],
+                fontsize=10,
+                weight="bold",
+                zorder=2,
+                stroke=(3, "white")
+            )
 
-        # Borders
-        for i in range(0, n + 1, n_isqrt):
-            sub_ax.plot((0, n), (i, i), linewidth=1.5, color="black")
-            sub_ax.plot((i, i), (0, n), linewidth=1.5, color="black")
-        sub_ax.add_patch(Rectangle((0, 0), n, n, fill=False, linewidth=3, zorder=3))
+    @classmethod
+    def __add_texts(
+            cls,
+            sub_ax: Axes,
+            texts: List[Tuple[Tuple[float, float], str, str]],
+            fontsize: float,
+            weight: str = "normal",
+            zorder: float = 3,
+            stroke: Optional[Tuple[float, str]] = None
+    ) -> None:
+        # Texts centered on their positions (like ha="center" and va="center" text artists) drawn as cached glyph
+        # outlines, one path collection per call instead of an artist per text. A stroke (linewidth, color) is drawn
+        # below the glyphs, as the Stroke path effect does
+        if not texts:
+            return
+
+        centers, strings, colors = zip(*texts)
+        paths: List[Path] = [cls.__get_text_path(string, fontsize, weight) for string in strings]
+        for edgecolors, linewidths in ([(stroke[1], stroke[0])] if stroke is not None else []) + [("none", 0)]:
+            sub_ax.add_collection(
+                PathCollection(
+                    paths,
+                    offsets=centers,
+                    offset_transform=sub_ax.transData,
+                    transform=Affine2D().scale(1 / 72) + sub_ax.get_figure().dpi_scale_trans,
+                    facecolors=colors,
+                    edgecolors=edgecolors,
+                    linewidths=linewidths,
+                    zorder=zorder,
+                    clip_on=False
+                ),
+                autolim=False
+            )
+
+    @classmethod
+    def __get_text_path(cls, text: str, fontsize: float, weight: str) -> Path:
+        # Glyph outlines in points, placed around the origin like a text artist with ha="center" and va="center" (whose
+        # line box is at least as tall as "lp")
+        text_path: Optional[Path] = cls.__text_paths.get((text, fontsize, weight))
+        if text_path is None:
+            font_properties: FontProperties = FontProperties(size=fontsize, weight=weight)
+            width, height, descent = text_to_path.get_text_width_height_descent(text, font_properties, ismath=False)
+            _, lp_height, lp_descent = text_to_path.get_text_width_height_descent("lp", font_properties, ismath=False)
+            height, descent = max(height, lp_height), max(descent, lp_descent)
+            text_path = cls.__text_paths.setdefault((text, fontsize, weight), TextPath((0, 0), text, prop=font_properties).transformed(Affine2D().translate(-width / 2, descent - height / 2)))
+        return text_path
+
+    @classmethod
+    def __get_base_grid_segments(cls, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        base_grid_segments: Optional[Tuple[np.ndarray, np.ndarray]] = cls.__base_grid_segments.get(n)
+        if base_grid_segments is None:
+            n_isqrt: int = math.isqrt(n)
+            cell_lines: np.ndarray = np.arange(n + 1)
+            block_lines: np.ndarray = np.arange(0, n + 1, n_isqrt)
+            base_grid_segments = cls.__base_grid_segments.setdefault(n, (cls.__grid_line_segments(n, cell_lines), cls.__grid_line_segments(n, block_lines)))
+        return base_grid_segments
+
+    @classmethod
+    def __grid_line_segments(cls, n: int, lines: np.ndarray) -> np.ndarray:
+        # (2 * len(lines), 2, 2): a horizontal and a vertical segment across the whole grid per line
+        horizontal_segments: np.ndarray = np.stack([np.stack([np.zeros_like(lines), lines], axis=1), np.stack([np.full_like(lines, n), lines], axis=1)], axis=1)
+        return np.concatenate([horizontal_segments, horizontal_segments[..., ::-1]]).astype(float)
 
     @classmethod
     def __subplots(cls, n: int, width: int, height: int) -> Tuple[Figure, Axes]:
@@ -298,30 +202,18 @@ class SudokuFigureFactory:
         return sub_ax
 
     @classmethod
-    def __connect_ax(cls, ax: Axes, initial_sub_ax: Axes, final_sub_ax: Axes, middle_sub_axes: Optional[List[Axes]] = None) -> None:
-        def add_arrow(sub_ax_from: Axes, sub_ax_to: Axes):
-            ax.add_patch(
-                FancyArrowPatch(
-                    posA=ax.transData.inverted().transform(sub_ax_from.transAxes.transform((0.5, 0))).tolist(),
-                    posB=ax.transData.inverted().transform(sub_ax_to.transAxes.transform((0.5, 1))).tolist(),
-                    arrowstyle="-|>",
-                    mutation_scale=10,
-                    linewidth=3,
-                    color="black",
-                    clip_on=False
-                )
+    def __connect_sub_axes(cls, ax: Axes, sub_ax_from: Axes, sub_ax_to: Axes) -> None:
+        ax.add_patch(
+            FancyArrowPatch(
+                posA=ax.transData.inverted().transform(sub_ax_from.transAxes.transform((0.5, 0))).tolist(),
+                posB=ax.transData.inverted().transform(sub_ax_to.transAxes.transform((0.5, 1))).tolist(),
+                arrowstyle="-|>",
+                mutation_scale=10,
+                linewidth=3,
+                color="black",
+                clip_on=False
             )
-
-        if middle_sub_axes is not None:
-            for middle_sub_ax in middle_sub_axes:
-                add_arrow(initial_sub_ax, middle_sub_ax)
-                add_arrow(middle_sub_ax, final_sub_ax)
-        else: add_arrow(initial_sub_ax, final_sub_ax)
-
-    @classmethod
-    def __cell_bottom_left(cls, n: int, position: Tuple[int, int], margins: Optional[Tuple[float, float]] = None) -> Tuple[float, float]:
-        (i, j), (dx, dy) = position, margins or (0, 0)
-        return j + dx, n - i - 1 + dy
+        )
 
     @classmethod
     def __cell_bottom_right(cls, n: int, position: Tuple[int, int], margins: Optional[Tuple[float, float]] = None) -> Tuple[float, float]:
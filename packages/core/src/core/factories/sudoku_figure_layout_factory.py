@@ -0,0 +1,128 @@
+from typing import List, Tuple
+from core.enums.sudoku_candidate_type import SudokuCandidateType
+from core.sudoku import Sudoku, SudokuCandidate, SudokuConsensusDeductionChain
+from core.sudoku_figure_layout import SudokuFigureElementOverlay, SudokuFigureCircleCandidateElementOverlay, SudokuFigureOverlay, SudokuFigurePanel, SudokuFigureLayout
+
+class SudokuFigureLayoutFactory:
+    def __init__(self, primary_color: str, secondary_color: str, tertiary_color: str) -> None:
+        self.__primary_color: str = primary_color
+        self.__secondary_color: str = secondary_color
+        self.__tertiary_color: str = tertiary_color
+
+    def get_naked_singles_sudoku_figure_layouts(self, sudoku: Sudoku) -> List[SudokuFigureLayout]:
+        return self.__get_single_candidate_principle_sudoku_figure_layouts(sudoku, sudoku.candidates_0th_layer_naked_singles)
+
+    def get_hidden_singles_sudoku_figure_layouts(self, sudoku: Sudoku) -> List[SudokuFigureLayout]:
+        return self.__get_single_candidate_principle_sudoku_figure_layouts(sudoku, sudoku.candidates_0th_layer_hidden_singles)
+
+    def get_consensus_sudoku_figure_layouts(self, sudoku: Sudoku) -> List[SudokuFigureLayout]:
+        layouts: List[SudokuFigureLayout] = []
+        for candidate in sudoku.candidates_1st_layer_consensus:
+            deduction_chains: List[List[SudokuConsensusDeductionChain]] = sudoku.deduction_chain_1st_layer_consensus_at_position(*candidate.position)
+            for deduction_chain in deduction_chains:
+                width: int = max(1, len(deduction_chain)) | 1
+                width_middle: int = width // 2
+
+                panels: List[SudokuFigurePanel] = [
+                    SudokuFigurePanel(
+                        sudoku=sudoku,
+                        overlay=SudokuFigureOverlay(
+                            candidate_cells={
+                                SudokuCandidateType.ZEROTH_LAYER: [
+                                    SudokuFigureElementOverlay(element=element, color=self.__primary_color if element == candidate.position else self.__tertiary_color)
+                                    for element in {position for x in deduction_chain for position in x.region_positions} | {candidate.position}
+                                ]
+                            },
+                            circle_candidate_values=[
+                                SudokuFigureCircleCandidateElementOverlay(value=deduction_chain[0].initial_assumption_value, excluded_positions=[candidate.position], color=self.__secondary_color)
+                            ]
+                        ),
+                        position=(0, width_middle)
+                    )
+                ]
+
+                for step_column, deduction in enumerate(deduction_chain):
+                    if len(deduction_chain) % 2 == 0 and step_column >= width_middle:
+                        step_column += 1
+
+                    current_sudoku: Sudoku = sudoku
+                    for consequence in deduction.consequences:
+                        current_sudoku = current_sudoku.next_step_at_position(
+                            consequence[0][0],
+                            consequence[0][1],
+                            consequence[1]
+                        )
+
+                    middle_consequence_positions: List[Tuple[int, int]] = [consequence[0] for consequence in deduction.consequences]
+                    panels.append(
+                        SudokuFigurePanel(
+                            sudoku=current_sudoku,
+                            overlay=SudokuFigureOverlay(
+                                text_color_cells=[
+                                    SudokuFigureElementOverlay(element=x, color=self.__primary_color if x == candidate.position else self.__secondary_color if x == deduction.initial_assumption_position else self.__tertiary_color)
+                                    for x in middle_consequence_positions
+                                ],
+                                circle_cells=[
+                                    SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color),
+                                    SudokuFigureElementOverlay(element=deduction.initial_assumption_position, color=self.__secondary_color)
+                                ],
+                                arrow_cells=[
+                                    SudokuFigureElementOverlay(element=x, color=self.__primary_color)
+                                    for x in [
+                                        (middle_consequence_positions[i], middle_consequence_positions[i + 1])
+                                        for i in range(len(middle_consequence_positions) - 1)
+                                    ]
+                                ]
+                            ),
+                            position=(1, step_column)
+                        )
+                    )
+
+                panels.append(self.__get_final_sudoku_panel(sudoku, candidate=candidate, position=(2, width_middle)))
+                layouts.append(
+                    SudokuFigureLayout(
+                        width=width,
+                        height=3,
+                        panels=panels,
+                        connections=[
+                            connection
+                            for middle_panel in range(1, len(panels) - 1)
+                            for connection in ((0, middle_panel), (middle_panel, len(panels) - 1))
+                        ]
+                    )
+                )
+        return layouts
+
+    def __get_single_candidate_principle_sudoku_figure_layouts(self, sudoku: Sudoku, candidates: Tuple[SudokuCandidate, ...]) -> List[SudokuFigureLayout]:
+        layouts: List[SudokuFigureLayout] = []
+        for candidate in candidates:
+            initial_panel: SudokuFigurePanel = SudokuFigurePanel(
+                sudoku=sudoku,
+                overlay=SudokuFigureOverlay(
+                    candidate_cells={
+                        SudokuCandidateType.ZEROTH_LAYER_PLAIN: [
+                            SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color)
+                        ]
+                    }
+                ),
+                position=(0, 0)
+            )
+
+            final_panel: SudokuFigurePanel = self.__get_final_sudoku_panel(sudoku, candidate=candidate, position=(1, 0))
+            layouts.append(SudokuFigureLayout(width=1, height=2, panels=[initial_panel, final_panel], connections=[(0, 1)]))
+            break
+        return layouts
+
+    def __get_final_sudoku_panel(self, sudoku: Sudoku, candidate: SudokuCandidate, position: Tuple[int, int]) -> SudokuFigurePanel:
+        return SudokuFigurePanel(
+            sudoku=sudoku.next_step_at_position(*candidate.position, candidate.value),
+            overlay=SudokuFigureOverlay(
+                text_color_cells=[
+                    SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color)
+                ],
+                circle_cells=[
+                    SudokuFigureElementOverlay(element=candidate.position, color=self.__primary_color)
+                ]
+            ),
+            position=position
+        )
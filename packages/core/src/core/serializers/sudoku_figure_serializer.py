@@ -1,36 +1,42 @@
-import io
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from typing import Callable, Dict, List, Optional, Sequence
+import itertools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from core.enums.sudoku_simplified_candidate_type import SudokuSimplifiedCandidateType
-from core.factories.sudoku_figure_factory import SudokuFigureFactory
+from core.factories.sudoku_figure_layout_factory import SudokuFigureLayoutFactory
 from core.sudoku import Sudoku
+from core.sudoku_figure_layout import SudokuFigureLayout
 
-matplotlib.use("Agg")
-
-class SudokuFigureSerializer:
-    def __init__(self, figure: SudokuFigureFactory) -> None:
-        self.__figure_factory: SudokuFigureFactory = figure
-        self.__candidate_figures: Dict[SudokuSimplifiedCandidateType, Callable[[Sudoku], Sequence[Figure]]] = {
-            SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES: SudokuFigureFactory.get_naked_singles_sudoku_figures,
-            SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES: SudokuFigureFactory.get_hidden_singles_sudoku_figures,
-            SudokuSimplifiedCandidateType.FIRST_LAYER_CONSENSUS: SudokuFigureFactory.get_consensus_sudoku_figures,
+class SudokuFigureSerializer(ABC):
+    def __init__(self, layout_factory: SudokuFigureLayoutFactory) -> None:
+        self.__layout_factory: SudokuFigureLayoutFactory = layout_factory
+        self.__candidate_layouts: Dict[SudokuSimplifiedCandidateType, Callable[[SudokuFigureLayoutFactory, Sudoku], List[SudokuFigureLayout]]] = {
+            SudokuSimplifiedCandidateType.ZEROTH_LAYER_NAKED_SINGLES: SudokuFigureLayoutFactory.get_naked_singles_sudoku_figure_layouts,
+            SudokuSimplifiedCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES: SudokuFigureLayoutFactory.get_hidden_singles_sudoku_figure_layouts,
+            SudokuSimplifiedCandidateType.FIRST_LAYER_CONSENSUS: SudokuFigureLayoutFactory.get_consensus_sudoku_figure_layouts,
         }
 
-    def serialize(self, sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType) -> List[bytes]:
-        getter: Optional[Callable[[SudokuFigureFactory, Sudoku], Sequence[Figure]]] = self.__candidate_figures.get(candidate_type)
-        if getter is None:
-            return []
+    @property
+    @abstractmethod
+    def mime(self) -> str:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def serialize_layout(cls, layout: SudokuFigureLayout) -> bytes:
+        pass
+
+    def serialize(self, sudoku: Sudoku, candidate_type: SudokuSimplifiedCandidateType, executor: Optional[Executor] = None) -> List[bytes]:
+        return self.serialize_many([(sudoku, candidate_type)], executor=executor)[0]
 
-        figures: Sequence[Figure] = getter(self.__figure_factory, sudoku)
-        if not figures:
-            return []
+    def serialize_many(self, sudokus: Sequence[Tuple[Sudoku, SudokuSimplifiedCandidateType]], executor: Optional[Executor] = None) -> List[List[bytes]]:
+        # The layouts are built here and only their rendering and encoding is spread over the executor's workers, one
+        # task per figure across all the sudokus (map keeps the order), then regrouped by sudoku
+        layouts: List[List[SudokuFigureLayout]] = []
+        for sudoku, candidate_type in sudokus:
+            getter: Optional[Callable[[SudokuFigureLayoutFactory, Sudoku], List[SudokuFigureLayout]]] = self.__candidate_layouts.get(candidate_type)
+            layouts.append(getter(self.__layout_factory, sudoku) if getter is not None else [])
 
-        payload: List[bytes] = []
-        for figure in figures:
-            fp = io.BytesIO()
-            figure.savefig(fp, format="png", bbox_inches="tight")
-            plt.close(figure)
-            payload.append(fp.getvalue())
-        return payload
+        flat_layouts: List[SudokuFigureLayout] = list(itertools.chain.from_iterable(layouts))
+        contents: Iterator[bytes] = executor.map(self.serialize_layout, flat_layouts) if executor is not None else map(self.serialize_layout, flat_layouts)
+        return [list(itertools.islice(contents, len(sudoku_layouts))) for sudoku_layouts in layouts]
@@ -0,0 +1,22 @@
+import io
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from core.factories.sudoku_figure_factory import SudokuFigureFactory
+from core.serializers.sudoku_figure_serializer import SudokuFigureSerializer
+from core.sudoku_figure_layout import SudokuFigureLayout
+
+matplotlib.use("Agg")
+
+class SudokuPngFigureSerializer(SudokuFigureSerializer):
+    @property
+    def mime(self) -> str:
+        return "image/png"
+
+    @classmethod
+    def serialize_layout(cls, layout: SudokuFigureLayout) -> bytes:
+        figure: Figure = SudokuFigureFactory.get_layout_figure(layout)
+        fp = io.BytesIO()
+        figure.savefig(fp, format="png", bbox_inches="tight")
+        plt.close(figure)
+        return fp.getvalue()
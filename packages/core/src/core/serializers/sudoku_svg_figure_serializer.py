@@ -0,0 +1,139 @@
+import html
+import itertools
+import math
+from typing import Dict, List, Optional, Set, Tuple
+from core.serializers.sudoku_figure_serializer import SudokuFigureSerializer
+from core.sudoku_figure_layout import SudokuFigureLayout, SudokuFigurePanel
+
+class SudokuSvgFigureSerializer(SudokuFigureSerializer):
+    # Writes the figure layouts straight to SVG, without matplotlib: sizes are in points and follow the PNG figures
+    # (a floor(0.75 * n) inch square per panel slot, a panel taking 80% of it, the same font sizes and line widths, the
+    # whole figure plus a 0.1 inch pad as bounding box)
+    __PAD: float = 7.2
+
+    @property
+    def mime(self) -> str:
+        return "image/svg+xml"
+
+    @classmethod
+    def serialize_layout(cls, layout: SudokuFigureLayout) -> bytes:
+        unit: float = math.floor(layout.n * 0.75) * 72
+        x0, y0 = -cls.__PAD, -cls.__PAD
+        width, height = layout.width * unit + 2 * cls.__PAD, layout.height * unit + 2 * cls.__PAD
+
+        elements: List[str] = [f'<rect x="{cls.__number(x0)}" y="{cls.__number(y0)}" width="{cls.__number(width)}" height="{cls.__number(height)}" fill="white"/>']
+        for panel in layout.panels:
+            elements.extend(cls.__panel(panel, unit))
+        for panel_from, panel_to in layout.connections:
+            elements.extend(cls.__connection(layout.panels[panel_from], layout.panels[panel_to], unit))
+
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{cls.__number(width)}pt" height="{cls.__number(height)}pt" '
+            f'viewBox="{cls.__number(x0)} {cls.__number(y0)} {cls.__number(width)} {cls.__number(height)}" font-family="DejaVu Sans, sans-serif">'
+            f'{"".join(elements)}</svg>'
+        ).encode("utf-8")
+
+    @classmethod
+    def __panel(cls, panel: SudokuFigurePanel, unit: float) -> List[str]:
+        # Drawn in the order matplotlib draws the PNG panels (by zorder): circles and the arrow line, block lines and
+        # step labels, then cell lines, frame, digits and candidates
+        sudoku, overlay = panel.sudoku, panel.overlay
+        n, n_isqrt = sudoku.shape()
+        row, column = panel.position
+        x0, y0, cell = (column + 0.1) * unit, (row + 0.1) * unit, 0.8 * unit / n
+
+        def coordinates(x: float, y: float) -> Tuple[str, str]:
+            # Grid coordinates (origin at the bottom left corner, y pointing up, one unit per cell) to SVG ones
+            return cls.__number(x0 + x * cell), cls.__number(y0 + (n - y) * cell)
+
+        def point(x: float, y: float) -> str:
+            return " ".join(coordinates(x, y))
+
+        def texts(items: List[Tuple[Tuple[float, float], str, Optional[str]]], attributes: str) -> str:
+            return f'<g text-anchor="middle" dominant-baseline="central" {attributes}>' + "".join(
+                '<text x="{}" y="{}" fill="{}">{}</text>'.format(*coordinates(*position), cls.__color(color), text)
+                for position, text, color in items
+            ) + "</g>"
+
+        elements: List[str] = []
+
+        # Circles
+        for circle_cell in overlay.circle_cells:
+            i, j = circle_cell.element
+            cx, cy = coordinates(j + 0.5, n - i - 0.5)
+            elements.append(f'<circle cx="{cx}" cy="{cy}" r="{cls.__number(0.35 * cell)}" fill="none" stroke="{cls.__color(circle_cell.color)}" stroke-width="1.5"/>')
+
+        # Arrows
+        arrow_labels: List[Tuple[Tuple[float, float], str, Optional[str]]] = []
+        if overlay.arrow_cells:
+            color: Optional[str] = overlay.arrow_cells[0].color
+            positions: List[Tuple[float, float]] = [
+                (j + 0.75, n - i - 0.84)
+                for i, j in [overlay.arrow_cells[0].element[0], *[arrow_cell.element[1] for arrow_cell in overlay.arrow_cells]]
+            ]
+            elements.append(f'<polyline points="{" ".join(point(*position) for position in positions)}" fill="none" stroke="{cls.__color(color)}" stroke-opacity="0.5" stroke-width="1.5"/>')
+            arrow_labels = [(position, f"{idx:02d}", color) for idx, position in enumerate(positions)]
+
+        # Base Grid
+        block_lines: str = "".join(f"M{point(0, k)}H{cls.__number(x0 + n * cell)}M{point(k, 0)}V{cls.__number(y0)}" for k in range(0, n + 1, n_isqrt))
+        cell_lines: str = "".join(f"M{point(0, k)}H{cls.__number(x0 + n * cell)}M{point(k, 0)}V{cls.__number(y0)}" for k in range(n + 1))
+        elements.append(f'<path d="{block_lines}" stroke="black" stroke-width="1.5"/>')
+        if arrow_labels:
+            elements.append(texts(arrow_labels, 'font-size="10" font-weight="bold" stroke="white" stroke-width="3" paint-order="stroke"'))
+        elements.append(f'<path d="{cell_lines}" stroke="black" stroke-width="0.75"/>')
+        elements.append(f'<rect x="{cls.__number(x0)}" y="{cls.__number(y0)}" width="{cls.__number(n * cell)}" height="{cls.__number(n * cell)}" fill="none" stroke="black" stroke-width="3"/>')
+
+        # Digits
+        text_colors: Dict[Tuple[int, int], Optional[str]] = {text_color_cell.element: text_color_cell.color for text_color_cell in overlay.text_color_cells}
+        digits: List[Tuple[Tuple[float, float], str, Optional[str]]] = [
+            ((j + 0.5, n - i - 0.5), str(sudoku.grid[i][j]), text_colors.get((i, j)))
+            for i, j in itertools.product(range(n), range(n))
+            if sudoku.grid[i][j] != 0
+        ]
+        if digits:
+            elements.append(texts(digits, 'font-size="20"'))
+
+        # Candidates
+        candidates: List[Tuple[Tuple[float, float], str, Optional[str]]] = []
+        for candidate_type, candidate_cells in overlay.candidate_cells.items():
+            for candidate_cell in candidate_cells:
+                i, j = candidate_cell.element
+                if sudoku.grid[i][j] != 0:
+                    continue
+
+                values: Optional[Set[int]] = sudoku.candidate_values_at_position(i, j, candidate_type=candidate_type)
+                if not values:
+                    continue
+
+                top: float = n - i - (0.05 if n > 4 else 0)
+                for idx, value in enumerate(sorted(values)):
+                    value_row, value_column = divmod(idx, n_isqrt)
+                    candidates.append(((j + (value_column + 0.5) / n_isqrt, top - (value_row + 0.5) / n_isqrt), str(value), overlay.candidate_color((i, j), value) or candidate_cell.color))
+        if candidates:
+            elements.append(texts(candidates, f'font-size="{12 if n > 4 else 15}"'))
+        return elements
+
+    @classmethod
+    def __connection(cls, panel_from: SudokuFigurePanel, panel_to: SudokuFigurePanel, unit: float) -> List[str]:
+        # A "-|>" arrow from the bottom center of a panel to the top center of another one, both ends shrunk by 2 points
+        # and a 4 point long, 4 point wide head, as matplotlib's FancyArrowPatch draws it with a mutation scale of 10
+        (row_from, column_from), (row_to, column_to) = panel_from.position, panel_to.position
+        xa, ya = (column_from + 0.5) * unit, (row_from + 0.9) * unit
+        xb, yb = (column_to + 0.5) * unit, (row_to + 0.1) * unit
+        length: float = math.hypot(xb - xa, yb - ya)
+        dx, dy = (xb - xa) / length, (yb - ya) / length
+        xa, ya, xb, yb = xa + 2 * dx, ya + 2 * dy, xb - 2 * dx, yb - 2 * dy
+        xh, yh = xb - 4 * dx, yb - 4 * dy
+        head: str = " ".join(f"{cls.__number(x)},{cls.__number(y)}" for x, y in ((xb, yb), (xh - 2 * dy, yh + 2 * dx), (xh + 2 * dy, yh - 2 * dx)))
+        return [
+            f'<path d="M{cls.__number(xa)} {cls.__number(ya)}L{cls.__number(xh)} {cls.__number(yh)}" stroke="black" stroke-width="3"/>',
+            f'<polygon points="{head}" fill="black" stroke="black" stroke-width="3"/>'
+        ]
+
+    @classmethod
+    def __color(cls, color: Optional[str]) -> str:
+        return html.escape(color or "black", quote=True)
+
+    @classmethod
+    def __number(cls, x: float) -> str:
+        return f"{x:.2f}".rstrip("0").rstrip(".")
@@ -0,0 +1,101 @@
+import random
+import time
+from typing import Iterator, List, Optional, Tuple
+from core.exceptions.sudoku_solver_exceptions import SudokuSolverTimeoutException
+from core.solvers.sudoku_solver import SudokuSolver
+from core.sudoku_topology import SudokuTopology
+
+class SudokuBitmaskSolver(SudokuSolver):
+    def solve(self, grid: Tuple[Tuple[int, ...], ...], max_solutions: Optional[int] = None, deadline: Optional[float] = None) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        solutions: List[Tuple[Tuple[int, ...], ...]] = []
+        if max_solutions is not None and max_solutions <= 0:
+            return ()
+
+        for solution in self.__iter_solutions(grid, deadline=deadline):
+            solutions.append(solution)
+            if max_solutions is not None and len(solutions) >= max_solutions:
+                break
+        return tuple(solutions)
+
+    def sample_solution(self, grid: Tuple[Tuple[int, ...], ...], rng: Optional[random.Random] = None) -> Optional[Tuple[Tuple[int, ...], ...]]:
+        # Randomized backtracking: same search, but the values of each branching cell are tried in a random order
+        return next(self.__iter_solutions(grid, rng=rng or random.Random()), None)
+
+    @classmethod
+    def __iter_solutions(cls, grid: Tuple[Tuple[int, ...], ...], rng: Optional[random.Random] = None, deadline: Optional[float] = None) -> Iterator[Tuple[Tuple[int, ...], ...]]:
+        n: int = len(grid)
+        full_mask: int = ((1 << n) - 1) << 1
+        cells: List[int] = [value for row in grid for value in row]
+        rows_mask: List[int] = [0] * n
+        columns_mask: List[int] = [0] * n
+        blocks_mask: List[int] = [0] * n
+        blocks: Tuple[int, ...] = SudokuTopology.of(n).cell_blocks
+
+        # Givens: reject grids that already repeat a digit in a row, column or block
+        for idx, value in enumerate(cells):
+            if value == 0:
+                continue
+
+            bit: int = 1 << value
+            i, j, b = idx // n, idx % n, blocks[idx]
+            if (rows_mask[i] | columns_mask[j] | blocks_mask[b]) & bit:
+                return
+            rows_mask[i] |= bit
+            columns_mask[j] |= bit
+            blocks_mask[b] |= bit
+
+        empty_cells: List[int] = [idx for idx, value in enumerate(cells) if value == 0]
+        nodes: int = 0
+
+        def search(remaining: int) -> Iterator[Tuple[Tuple[int, ...], ...]]:
+            # Node budget: the deadline is checked once every 1024 visited nodes
+            nonlocal nodes
+            nodes += 1
+            if deadline is not None and nodes % 1024 == 0 and time.monotonic() > deadline:
+                raise SudokuSolverTimeoutException("Could not solve the grid before the deadline")
+
+            if remaining == 0:
+                yield tuple(tuple(cells[i * n:(i + 1) * n]) for i in range(n))
+                return
+
+            # Branch on the empty cell with the fewest candidates (minimum remaining values)
+            best_position: int = -1
+            best_idx: int = -1
+            best_mask: int = 0
+            best_count: int = n + 1
+            for position in range(remaining):
+                idx: int = empty_cells[position]
+                mask: int = full_mask & ~(rows_mask[idx // n] | columns_mask[idx % n] | blocks_mask[blocks[idx]])
+                count: int = mask.bit_count()
+                if count < best_count:
+                    best_position, best_idx, best_mask, best_count = position, idx, mask, count
+                    if count <= 1:
+                        break
+
+            if best_count == 0:
+                return
+
+            empty_cells[best_position], empty_cells[remaining - 1] = empty_cells[remaining - 1], empty_cells[best_position]
+            i, j, b = best_idx // n, best_idx % n, blocks[best_idx]
+            bits: List[int] = []
+            while best_mask:
+                bit: int = best_mask & -best_mask
+                best_mask ^= bit
+                bits.append(bit)
+            if rng is not None:
+                rng.shuffle(bits)
+
+            for bit in bits:
+                cells[best_idx] = bit.bit_length() - 1
+                rows_mask[i] |= bit
+                columns_mask[j] |= bit
+                blocks_mask[b] |= bit
+                yield from search(remaining - 1)
+                rows_mask[i] ^= bit
+                columns_mask[j] ^= bit
+                blocks_mask[b] ^= bit
+
+            cells[best_idx] = 0
+            empty_cells[best_position], empty_cells[remaining - 1] = empty_cells[remaining - 1], empty_cells[best_position]
+
+        yield from search(len(empty_cells))
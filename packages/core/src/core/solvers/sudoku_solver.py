@@ -0,0 +1,65 @@
+import itertools
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set, Tuple
+from core.exceptions.sudoku_solver_exceptions import SudokuSolverTimeoutException
+
+class SudokuSolver(ABC):
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self.__timeout: Optional[float] = timeout
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self.__timeout
+
+    @abstractmethod
+    def solve(self, grid: Tuple[Tuple[int, ...], ...], max_solutions: Optional[int] = None, deadline: Optional[float] = None) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        # deadline is a time.monotonic() value: past it, the search raises SudokuSolverTimeoutException
+        pass
+
+    def solve_candidates(self, grid: Tuple[Tuple[int, ...], ...]) -> Tuple[Tuple[Set[int], ...], ...]:
+        # Backbone: the values each empty cell takes across all solutions, found with one satisfiability check per
+        # (cell, value) pair that no previously found solution has already witnessed, instead of enumerating every solution
+        n: int = len(grid)
+        deadline: Optional[float] = time.monotonic() + self.__timeout if self.__timeout is not None else None
+        candidates: List[List[Set[int]]] = [[set() for _ in range(n)] for _ in range(n)]
+
+        solutions: Tuple[Tuple[Tuple[int, ...], ...], ...] = self.solve(grid, max_solutions=1, deadline=deadline)
+        if not solutions:
+            return tuple(tuple(x) for x in candidates)
+        self.__witness_solution(grid, solutions[0], candidates)
+
+        for i, j in itertools.product(range(n), range(n)):
+            if grid[i][j] != 0:
+                continue
+
+            for value in sorted(self.__plain_candidates(grid, i, j)):
+                if value in candidates[i][j]:
+                    continue
+
+                if deadline is not None and time.monotonic() > deadline:
+                    raise SudokuSolverTimeoutException(f"Could not compute the candidates of the grid within {self.__timeout} seconds")
+
+                assumption_grid: Tuple[Tuple[int, ...], ...] = grid[:i] + (grid[i][:j] + (value,) + grid[i][j + 1:],) + grid[i + 1:]
+                solutions = self.solve(assumption_grid, max_solutions=1, deadline=deadline)
+                if solutions:
+                    self.__witness_solution(grid, solutions[0], candidates)
+        return tuple(tuple(x) for x in candidates)
+
+    @classmethod
+    def __witness_solution(cls, grid: Tuple[Tuple[int, ...], ...], solution_grid: Tuple[Tuple[int, ...], ...], candidates: List[List[Set[int]]]) -> None:
+        for i, j in itertools.product(range(len(grid)), range(len(grid))):
+            if grid[i][j] == 0:
+                candidates[i][j].add(solution_grid[i][j])
+
+    @classmethod
+    def __plain_candidates(cls, grid: Tuple[Tuple[int, ...], ...], i: int, j: int) -> Set[int]:
+        n, n_isqrt = len(grid), math.isqrt(len(grid))
+        i0, j0 = (i // n_isqrt) * n_isqrt, (j // n_isqrt) * n_isqrt
+        used: Set[int] = set(grid[i]) | {grid[ii][j] for ii in range(n)} | {
+            grid[i0 + ii][j0 + jj]
+            for ii in range(n_isqrt)
+            for jj in range(n_isqrt)
+        }
+        return set(range(1, n + 1)) - used
@@ -0,0 +1,136 @@
+import math
+import threading
+import time
+from typing import ClassVar, Dict, List, Optional, Tuple
+from z3 import Int, BoolRef, ModelRef, CheckSatResult, And, Or, Distinct, Solver, sat, unknown
+from core.exceptions.sudoku_solver_exceptions import SudokuSolverTimeoutException
+from core.solvers.sudoku_solver import SudokuSolver
+
+class SudokuZ3Solver(SudokuSolver):
+    # Base solvers: the Sudoku rules only depend on n, so they are declared once per size and every solve only adds
+    # its givens (and the clauses blocking the solutions it already found) inside a push/pop scope
+    __base_solvers: ClassVar[Dict[int, Tuple[Solver, List[List[Int]], threading.Lock]]] = {}
+    __base_solvers_lock: ClassVar[threading.Lock] = threading.Lock()
+    __NO_TIMEOUT: ClassVar[int] = 4294967295
+
+    def solve(self, grid: Tuple[Tuple[int, ...], ...], max_solutions: Optional[int] = None, deadline: Optional[float] = None) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        n: int = len(grid)
+        solver, cells, lock = self.__base_solver(n)
+        with lock:
+            solver.push()
+            try:
+                # Rule: Pre-fill the cells that already have numbers in the given Sudoku grid
+                solver.add([
+                    cells[i][j] == grid[i][j]
+                    for i in range(n)
+                    for j in range(n)
+                    if grid[i][j] != 0
+                ])
+
+                return self.__enumerate_solutions(solver, cells, max_solutions=max_solutions, deadline=deadline)
+            finally:
+                solver.pop()
+                if deadline is not None:
+                    solver.set("timeout", self.__NO_TIMEOUT)
+
+    @classmethod
+    def __base_solver(cls, n: int) -> Tuple[Solver, List[List[Int]], threading.Lock]:
+        with cls.__base_solvers_lock:
+            if n not in cls.__base_solvers:
+                cls.__base_solvers[n] = cls.__build_base_solver(n)
+            return cls.__base_solvers[n]
+
+    @classmethod
+    def __build_base_solver(cls, n: int) -> Tuple[Solver, List[List[Int]], threading.Lock]:
+        # Variables: Integer variable for each cell of the Sudoku grid
+        n_isqrt: int = math.isqrt(n)
+        cells: List[List[Int]] = [
+            [
+                Int(f"x_{i + 1}_{j + 1}")
+                for j in range(n)
+            ]
+            for i in range(n)
+        ]
+
+        # Rule: Each cell must contain a digit (1 to n)
+        cell_constraints: List[BoolRef] = [
+            And(cells[i][j] >= 1, cells[i][j] <= n)
+            for i in range(n)
+            for j in range(n)
+        ]
+
+        # Rule: Every digit has to be placed exactly once in each row
+        row_constraints: List[BoolRef] = [
+            Distinct(cells[i])
+            for i in range(n)
+        ]
+
+        # Rule: Every digit has to be placed exactly once in each column
+        column_constraints: List[BoolRef] = [
+            Distinct(
+                [
+                    cells[i][j]
+                    for i in range(n)
+                ]
+            )
+            for j in range(n)
+        ]
+
+        # Rule: Every digit has to be placed exactly once in each isqrt(n) x isqrt(n) block
+        block_constraints: List[BoolRef] = [
+            Distinct(
+                [
+                    cells[i0 + i][j0 + j]
+                    for i in range(n_isqrt)
+                    for j in range(n_isqrt)
+                ]
+            )
+            for i0 in range(0, n, n_isqrt)
+            for j0 in range(0, n, n_isqrt)
+        ]
+
+        solver: Solver = Solver()
+        solver.add(cell_constraints + row_constraints + column_constraints + block_constraints)
+        return solver, cells, threading.Lock()
+
+    @classmethod
+    def __enumerate_solutions(cls, solver: Solver, cells: List[List[Int]], max_solutions: Optional[int] = None, deadline: Optional[float] = None) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+        n: int = len(cells)
+        solutions: List[Tuple[Tuple[int, ...], ...]] = []
+        while True:
+            # z3 gives up on a check once its timeout (in milliseconds, set to the time left) is over and answers unknown
+            if deadline is not None:
+                remaining_milliseconds: int = int((deadline - time.monotonic()) * 1000)
+                if remaining_milliseconds <= 0:
+                    raise SudokuSolverTimeoutException("Could not solve the grid before the deadline")
+                solver.set("timeout", remaining_milliseconds)
+
+            result: CheckSatResult = solver.check()
+            if result == unknown and deadline is not None:
+                raise SudokuSolverTimeoutException("Could not solve the grid before the deadline")
+            if result != sat:
+                break
+
+            model: ModelRef = solver.model()
+            solution_grid: Tuple[Tuple[int, ...], ...] = tuple(
+                tuple(
+                    model.evaluate(cells[i][j]).as_long()
+                    for j in range(n)
+                )
+                for i in range(n)
+            )
+
+            solutions.append(solution_grid)
+            solver.add(
+                Or(
+                    [
+                        cells[i][j] != model.evaluate(cells[i][j])
+                        for i in range(n)
+                        for j in range(n)
+                    ]
+                )
+            )
+
+            if max_solutions is not None and len(solutions) >= max_solutions:
+                break
+        return tuple(solutions)
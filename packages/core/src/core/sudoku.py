@@ -1,21 +1,30 @@
+import functools
 import itertools
 import math
-from cachetools import Cache, LRUCache, cachedmethod
-from cachetools.keys import hashkey
 from collections import defaultdict
 from dataclasses import dataclass
-from functools import cached_property
-from typing import Self, List, Tuple, Set, Dict, Optional, Sequence, Any
-from z3 import Int, BoolRef, ModelRef, And, Or, Distinct, If, Solver, sat
+from typing import Self, List, Tuple, Set, Dict, Optional, Sequence, Iterable, Callable, Any
 from core.enums.sudoku_candidate_type import SudokuCandidateType
 from core.exceptions.sudoku_exceptions import SudokuInvalidDimensionsException
+from core.solvers.sudoku_bitmask_solver import SudokuBitmaskSolver
+from core.solvers.sudoku_solver import SudokuSolver
+from core.sudoku_canonical_form import SudokuCanonicalForm
+from core.sudoku_symmetry import SudokuSymmetry
+from core.sudoku_topology import SudokuTopology
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SudokuCandidate:
     value: int
     position: Tuple[int, int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SudokuConsensusBranch:
+    masks: Tuple[int, ...]
+    consequences: Tuple[Tuple[Tuple[int, int], int], ...]
+    rounds: Tuple[Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[Tuple[int, int], ...], int], ...]
+    single_rounds: Dict[int, int]
+
+@dataclass(frozen=True, slots=True)
 class SudokuConsensusDeductionChain:
     initial_assumption_value: int
     initial_assumption_position: Tuple[int, int]
@@ -25,21 +34,60 @@ class SudokuConsensusDeductionChain:
     consensus_candidate_position: Tuple[int, int]
 
 class Sudoku:
-    def __new__(cls, grid: Sequence[Sequence[int]]) -> Self:
+    # Grids are created by the million while propagating and generating, so every instance keeps its cells in a
+    # flat byte string and only allocates its caches (and the tuple view of the grid) once they are first needed
+    __slots__ = (
+        "__n",
+        "__topology",
+        "__cells",
+        "__grid",
+        "__solver",
+        "__lazy_values",
+        "__candidate_values",
+        "__solutions",
+        "__candidate_values_nth_layer",
+        "__consensus_branches",
+        "__deduction_chains_1st_layer_consensus"
+    )
+
+    __default_solver: SudokuSolver = SudokuBitmaskSolver()
+
+    @staticmethod
+    def __cached_candidate_values(candidate_type: SudokuCandidateType) -> Callable[[Callable[["Sudoku", int, int], Set[int]]], Callable[["Sudoku", int, int], Set[int]]]:
+        # Memoizes a per-cell candidate accessor in the instance's candidate cache, allocated on first use
+        def decorator(method: Callable[["Sudoku", int, int], Set[int]]) -> Callable[["Sudoku", int, int], Set[int]]:
+            @functools.wraps(method)
+            def wrapper(self: "Sudoku", i: int, j: int) -> Set[int]:
+                cache: Dict[Tuple[SudokuCandidateType, int, int], Set[int]] = self.__candidate_values_cache()
+                key: Tuple[SudokuCandidateType, int, int] = (candidate_type, i, j)
+                if key not in cache:
+                    cache[key] = method(self, i, j)
+                return cache[key]
+            return wrapper
+        return decorator
+
+    def __new__(cls, grid: Sequence[Sequence[int]], solver: Optional[SudokuSolver] = None) -> Self:
         if any(len(row) != len(grid) for row in grid):
             raise SudokuInvalidDimensionsException("Grid must be square")
         if len(grid) != math.isqrt(len(grid)) ** 2:
             raise SudokuInvalidDimensionsException("Grid size must be a perfect square")
         return super().__new__(cls)
 
-    def __init__(self, grid: Sequence[Sequence[int]]) -> None:
-        self.__cache: Cache = LRUCache(len(SudokuCandidateType) * len(grid) ** 2)
-        self.__grid: Tuple[Tuple[int, ...], ...] = tuple(tuple(x) for x in grid)
+    def __init__(self, grid: Sequence[Sequence[int]], solver: Optional[SudokuSolver] = None) -> None:
+        self.__n: int = len(grid)
+        self.__topology: SudokuTopology = SudokuTopology.of(len(grid))
+        self.__cells: bytes = bytes(x for row in grid for x in row)
+        self.__grid: Optional[Tuple[Tuple[int, ...], ...]] = None
+        self.__solver: SudokuSolver = solver or self.__default_solver
+        self.__lazy_values: Optional[Dict[str, Any]] = None
+        self.__candidate_values: Optional[Dict[Tuple[SudokuCandidateType, int, int], Set[int]]] = None
         self.__solutions: Optional[Tuple["Sudoku", ...]] = None
-        self.__deduction_chains_1st_layer_consensus: List[List[Optional[List[List[SudokuConsensusDeductionChain]]]]] = [[None] * len(grid) for _ in range(len(grid))]
+        self.__candidate_values_nth_layer: Optional[Tuple[Tuple[Set[int], ...], ...]] = None
+        self.__consensus_branches: Optional[Dict[Tuple[int, int, int], SudokuConsensusBranch]] = None
+        self.__deduction_chains_1st_layer_consensus: Optional[Dict[Tuple[int, int], List[List[SudokuConsensusDeductionChain]]]] = None
 
     def __len__(self) -> int:
-        return len(self.grid)
+        return self.__n
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -48,82 +96,111 @@ class Sudoku:
         return f"Sudoku({self.grid})"
 
     def __hash__(self) -> int:
-        return hash(self.grid)
+        return hash(self.__cells)
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Sudoku) and self.grid == other.grid
+        return isinstance(other, Sudoku) and self.__cells == other.__cells
+
+    def __reduce__(self) -> Tuple[type, Tuple[Tuple[Tuple[int, ...], ...], Optional[SudokuSolver]], Optional[SudokuCanonicalForm]]:
+        # Only the grid (and a non-default solver) travels, caches are rebuilt on demand by the receiving process. The
+        # canonical form is the exception: it is the costliest value to rebuild, so once computed it travels too
+        canonical_form: Optional[SudokuCanonicalForm] = (self.__lazy_values or {}).get("canonical_form")
+        return Sudoku, (self.grid, self.__solver if self.__solver is not self.__default_solver else None), canonical_form
 
-    def __getnewargs__(self) -> Tuple[Sequence[Sequence[int]],]:
-        return (self.grid,)
+    def __setstate__(self, canonical_form: Optional[SudokuCanonicalForm]) -> None:
+        if canonical_form is not None:
+            self.__lazy_values = {"canonical_form": canonical_form}
 
     @property
     def grid(self) -> Tuple[Tuple[int, ...], ...]:
+        if self.__grid is None:
+            n: int = self.__n
+            self.__grid = tuple(tuple(self.__cells[i * n:(i + 1) * n]) for i in range(n))
         return self.__grid
 
-    @cached_property
+    @property
+    def cells(self) -> bytes:
+        return self.__cells
+
+    @property
+    def topology(self) -> SudokuTopology:
+        return self.__topology
+
+    @property
+    def canonical_form(self) -> SudokuCanonicalForm:
+        return self.__lazy_value("canonical_form", lambda: SudokuCanonicalForm.of(self.grid))
+
+    @property
     def grid_columns(self) -> Tuple[Tuple[int, ...], ...]:
-        return tuple(zip(*self.grid))
+        return self.__lazy_value("grid_columns", lambda: tuple(tuple(self.__cells[j::self.__n]) for j in range(self.__n)))
 
-    @cached_property
+    @property
     def grid_blocks(self) -> Tuple[Tuple[int, ...], ...]:
-        blocks: List[List[int]] = []
-        n, n_isqrt = self.shape()
-        for i0, j0 in itertools.product(range(0, n, n_isqrt), range(0, n, n_isqrt)):
-            block: List[int] = [self.grid[i0 + i][j0 + j] for i in range(n_isqrt) for j in range(n_isqrt)]
-            blocks.append(block)
-        return tuple(tuple(x) for x in blocks)
+        return self.__lazy_value("grid_blocks", lambda: tuple(tuple(self.__cells[idx] for idx in unit) for unit in self.topology.blocks))
+
+    @property
+    def grid_rows_mask(self) -> Tuple[int, ...]:
+        return self.__lazy_value("grid_rows_mask", lambda: tuple(self.__values_mask(self.__cells[k:k + self.__n]) for k in range(0, self.area(), self.__n)))
+
+    @property
+    def grid_columns_mask(self) -> Tuple[int, ...]:
+        return self.__lazy_value("grid_columns_mask", lambda: tuple(self.__values_mask(self.__cells[j::self.__n]) for j in range(self.__n)))
+
+    @property
+    def grid_blocks_mask(self) -> Tuple[int, ...]:
+        return self.__lazy_value("grid_blocks_mask", lambda: tuple(self.__values_mask(self.__cells[idx] for idx in unit) for unit in self.topology.blocks))
 
-    @cached_property
+    @property
     def grid_rows_with_positions(self) -> Tuple[Tuple[Tuple[int, Tuple[int,int]], ...], ...]:
-        return tuple(
-            tuple((value, (i, j)) for j, value in enumerate(row))
-            for i, row in enumerate(self.grid)
-        )
+        return self.__lazy_value("grid_rows_with_positions", lambda: self.__grid_units_with_positions(0))
 
-    @cached_property
+    @property
     def grid_columns_with_positions(self) -> Tuple[Tuple[Tuple[int, Tuple[int,int]], ...], ...]:
-        n: int = len(self.grid)
-        return tuple(
-            tuple((self.grid[i][j], (i, j)) for i in range(n))
-            for j in range(n)
-        )
+        return self.__lazy_value("grid_columns_with_positions", lambda: self.__grid_units_with_positions(1))
 
-    @cached_property
+    @property
     def grid_blocks_with_positions(self) -> Tuple[Tuple[Tuple[int, Tuple[int,int]], ...], ...]:
-        blocks: List[Tuple[Tuple[int, Tuple[int,int]], ...]] = []
-        n, n_isqrt = self.shape()
-        for i0, j0 in itertools.product(range(0, n, n_isqrt), range(0, n, n_isqrt)):
-            block: Tuple[Tuple[int, Tuple[int,int]], ...] = tuple(
-                (self.grid[i0 + i][j0 + j], (i0 + i, j0 + j))
-                for i in range(n_isqrt)
-                for j in range(n_isqrt)
-            )
-            blocks.append(block)
-        return tuple(blocks)
+        return self.__lazy_value("grid_blocks_with_positions", lambda: self.__grid_units_with_positions(2))
 
-    @cached_property
+    @property
+    def candidate_masks_0th_layer_plain(self) -> Tuple[int, ...]:
+        return self.__lazy_value("candidate_masks_0th_layer_plain", self.__candidate_masks_0th_layer_plain)
+
+    @property
+    def candidate_masks_0th_layer_hidden_singles(self) -> Tuple[int, ...]:
+        return self.__lazy_value("candidate_masks_0th_layer_hidden_singles", self.__candidate_masks_0th_layer_hidden_singles)
+
+    @property
     def candidates_0th_layer_plain(self) -> Tuple["SudokuCandidate", ...]:
-        return self.__solve_all_candidates(SudokuCandidateType.ZEROTH_LAYER_PLAIN)
+        return self.__lazy_value("candidates_0th_layer_plain", lambda: self.__solve_all_candidates(SudokuCandidateType.ZEROTH_LAYER_PLAIN))
 
-    @cached_property
+    @property
     def candidates_0th_layer_naked_singles(self) -> Tuple["SudokuCandidate", ...]:
-        return self.__solve_all_candidates(SudokuCandidateType.ZEROTH_LAYER_NAKED_SINGLES)
+        return self.__lazy_value("candidates_0th_layer_naked_singles", lambda: tuple(
+            SudokuCandidate(position=self.topology.positions[idx], value=mask.bit_length() - 1)
+            for idx, mask in enumerate(self.candidate_masks_0th_layer_plain)
+            if mask and mask & (mask - 1) == 0
+        ))
 
-    @cached_property
+    @property
     def candidates_0th_layer_hidden_singles(self) -> Tuple["SudokuCandidate", ...]:
-        return self.__solve_all_candidates(SudokuCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES)
+        return self.__lazy_value("candidates_0th_layer_hidden_singles", lambda: tuple(
+            SudokuCandidate(position=self.topology.positions[idx], value=mask.bit_length() - 1)
+            for idx, mask in enumerate(self.candidate_masks_0th_layer_hidden_singles)
+            if mask
+        ))
 
-    @cached_property
+    @property
     def candidates_0th_layer(self) -> Tuple["SudokuCandidate", ...]:
-        return self.__solve_all_candidates(SudokuCandidateType.ZEROTH_LAYER)
+        return self.__lazy_value("candidates_0th_layer", lambda: self.__solve_all_candidates(SudokuCandidateType.ZEROTH_LAYER))
 
-    @cached_property
+    @property
     def candidates_1st_layer_consensus(self) -> Tuple["SudokuCandidate", ...]:
-        return self.__solve_all_candidates(SudokuCandidateType.FIRST_LAYER_CONSENSUS)
+        return self.__lazy_value("candidates_1st_layer_consensus", lambda: self.__solve_all_candidates(SudokuCandidateType.FIRST_LAYER_CONSENSUS))
 
-    @cached_property
+    @property
     def candidates_nth_layer(self) -> Tuple["SudokuCandidate", ...]:
-        return self.__solve_all_candidates(SudokuCandidateType.NTH_LAYER)
+        return self.__lazy_value("candidates_nth_layer", lambda: self.__solve_all_candidates(SudokuCandidateType.NTH_LAYER))
 
     @property
     def solutions(self) -> Tuple["Sudoku", ...]:
@@ -139,69 +216,54 @@ class Sudoku:
         return n, math.isqrt(n)
 
     def grid_block_at_position(self, i: int, j: int) -> Tuple[int, ...]:
-        _, n_isqrt = self.shape()
-        ii: int = (i // n_isqrt) * n_isqrt + (j // n_isqrt)
-        return self.grid_blocks[ii]
+        return self.grid_blocks[self.topology.cell_blocks[i * len(self) + j]]
 
     def next_step_at_position(self, i: int, j: int, value: int) -> "Sudoku":
-        grid: List[List[int]] = [list(row) for row in self.grid]
-        grid[i][j] = value
-        return Sudoku(grid)
+        # Placing a value on an empty cell or emptying a filled cell is derived from this grid, anything else rebuilds
+        if (self.__cells[i * self.__n + j] == 0) == (value == 0):
+            grid: List[List[int]] = [list(row) for row in self.grid]
+            grid[i][j] = value
+            return Sudoku(grid, solver=self.__solver)
+        return self.__derive_at_position(i, j, value)
+
+    def transform(self, symmetry: SudokuSymmetry) -> "Sudoku":
+        # The symmetric copy shares this grid's canonical form, so once computed here it is handed down without a search
+        sudoku: Sudoku = Sudoku(symmetry.apply(self.grid), solver=self.__solver)
+        canonical_form: Optional[SudokuCanonicalForm] = (self.__lazy_values or {}).get("canonical_form")
+        if canonical_form is not None:
+            sudoku.__lazy_values = {"canonical_form": SudokuCanonicalForm(grid=canonical_form.grid, symmetry=symmetry.inverse().then(canonical_form.symmetry))}
+        return sudoku
 
     def deduction_chain_1st_layer_consensus_at_position(self, i: int, j: int) -> Optional[List[List[SudokuConsensusDeductionChain]]]:
-        if self.__deduction_chains_1st_layer_consensus[i][j] is None:
+        if self.__deduction_chains_1st_layer_consensus is None or (i, j) not in self.__deduction_chains_1st_layer_consensus:
             self.candidate_values_1st_layer_consensus_at_position(i, j)
-        return self.__deduction_chains_1st_layer_consensus[i][j]
+        return (self.__deduction_chains_1st_layer_consensus or {}).get((i, j))
 
-    @cachedmethod(lambda self: self.__cache, key=lambda self, i, j: hashkey(i, j, candidate_type=SudokuCandidateType.ZEROTH_LAYER_PLAIN))
+    @__cached_candidate_values(SudokuCandidateType.ZEROTH_LAYER_PLAIN)
     def candidate_values_0th_layer_plain_at_position(self, i: int, j: int) -> Set[int]:
-        if self.grid[i][j] != 0:
+        if self.__cells[i * self.__n + j] != 0:
             return set()
 
-        n: int = len(self)
-        return set(range(1, n + 1)) - set(self.grid[i]) - set(self.grid_columns[j]) - set(self.grid_block_at_position(i, j))
+        return self.__mask_values(self.candidate_masks_0th_layer_plain[i * len(self) + j])
 
-    @cachedmethod(lambda self: self.__cache, key=lambda self, i, j: hashkey(i, j, candidate_type=SudokuCandidateType.ZEROTH_LAYER_NAKED_SINGLES))
+    @__cached_candidate_values(SudokuCandidateType.ZEROTH_LAYER_NAKED_SINGLES)
     def candidate_values_0th_layer_naked_singles_at_position(self, i: int, j: int) -> Set[int]:
-        if self.grid[i][j] != 0:
+        if self.__cells[i * self.__n + j] != 0:
             return set()
 
-        n: int = len(self)
-        candidates: Set[int] = set(range(1, n + 1)) - set(self.grid[i]) - set(self.grid_columns[j]) - set(self.grid_block_at_position(i, j))
-        return candidates if len(candidates) == 1 else set()
+        mask: int = self.candidate_masks_0th_layer_plain[i * len(self) + j]
+        return self.__mask_values(mask) if mask.bit_count() == 1 else set()
 
-    @cachedmethod(lambda self: self.__cache, key=lambda self, i, j: hashkey(i, j, candidate_type=SudokuCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES))
+    @__cached_candidate_values(SudokuCandidateType.ZEROTH_LAYER_HIDDEN_SINGLES)
     def candidate_values_0th_layer_hidden_singles_at_position(self, i: int, j: int) -> Set[int]:
-        if self.grid[i][j] != 0:
+        if self.__cells[i * self.__n + j] != 0:
             return set()
 
-        base_candidates = self.candidate_values_0th_layer_plain_at_position(i, j)
-        if not base_candidates:
-            return set()
-
-        n, n_isqrt = self.shape()
-        i0, j0 = (i // n_isqrt) * n_isqrt, (j // n_isqrt) * n_isqrt
-        candidates: Set[int] = set()
-
-        for x in base_candidates:
-            is_unique_in_row: bool = not any(x in self.candidate_values_0th_layer_plain_at_position(i, jj) for jj in range(n) if jj != j)
-            is_unique_in_column: bool = not any(x in self.candidate_values_0th_layer_plain_at_position(ii, j) for ii in range(n) if ii != i)
-            is_unique_in_block: bool = not any(
-                x in self.candidate_values_0th_layer_plain_at_position(i0 + ii, j0 + jj)
-                for ii in range(n_isqrt)
-                for jj in range(n_isqrt)
-                if (i0 + ii, j0 + jj) != (i, j)
-            )
-
-            if is_unique_in_row or is_unique_in_column or is_unique_in_block:
-                candidates.add(x)
+        return self.__mask_values(self.candidate_masks_0th_layer_hidden_singles[i * len(self) + j])
 
-        candidates -= self.candidate_values_0th_layer_naked_singles_at_position(i, j)
-        return candidates if len(candidates) == 1 else set()
-
-    @cachedmethod(lambda self: self.__cache, key=lambda self, i, j: hashkey(i, j, candidate_type=SudokuCandidateType.ZEROTH_LAYER))
+    @__cached_candidate_values(SudokuCandidateType.ZEROTH_LAYER)
     def candidate_values_0th_layer_at_position(self, i: int, j: int) -> Set[int]:
-        if self.grid[i][j] != 0:
+        if self.__cells[i * self.__n + j] != 0:
             return set()
 
         base_candidates: Set[int] = self.candidate_values_0th_layer_plain_at_position(i, j)
@@ -209,21 +271,22 @@ class Sudoku:
         hidden_candidates: Set[int] = self.candidate_values_0th_layer_hidden_singles_at_position(i, j)
         return base_candidates if not naked_candidates and not hidden_candidates else naked_candidates | hidden_candidates
 
-    @cachedmethod(lambda self: self.__cache, key=lambda self, i, j: hashkey(i, j, candidate_type=SudokuCandidateType.FIRST_LAYER_CONSENSUS))
+    @__cached_candidate_values(SudokuCandidateType.FIRST_LAYER_CONSENSUS)
     def candidate_values_1st_layer_consensus_at_position(self, i: int, j: int) -> Set[int]:
-        if self.grid[i][j] != 0:
+        if self.__cells[i * self.__n + j] != 0:
             return set()
 
-        n: int = len(self)
         candidates: Set[int] = set()
-        if self.__deduction_chains_1st_layer_consensus[i][j] is None:
-            self.__deduction_chains_1st_layer_consensus[i][j] = []
-        else: self.__deduction_chains_1st_layer_consensus[i][j].clear()
+        branch_consequences: Dict[Tuple[int, int, int], Optional[List[Tuple[Tuple[int, int], int]]]] = {}
+        if self.__deduction_chains_1st_layer_consensus is None:
+            self.__deduction_chains_1st_layer_consensus = {}
+        deduction_chains: List[List[SudokuConsensusDeductionChain]] = self.__deduction_chains_1st_layer_consensus.setdefault((i, j), [])
+        deduction_chains.clear()
 
-        for region in self.grid_rows_with_positions + self.grid_columns_with_positions + self.grid_blocks_with_positions:
+        for region in self.topology.unit_positions:
             candidate_positions: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
-            for value, position in region:
-                if value != 0:
+            for position in region:
+                if self.__cells[position[0] * self.__n + position[1]] != 0:
                     continue
 
                 plain_candidates: Set[int] = self.candidate_values_0th_layer_plain_at_position(*position)
@@ -231,63 +294,46 @@ class Sudoku:
                     candidate_positions[candidate].append(position)
 
             for candidate, positions in candidate_positions.items():
+                # The target itself is never assumed, so a region where it could hold the candidate has no consensus
+                if (i, j) in positions:
+                    continue
+
                 inner_candidates: List[int] = []
                 inner_deduction_chain: List[SudokuConsensusDeductionChain] = []
 
                 for ii, jj in positions:
-                    if (ii, jj) == (i, j):
-                        continue
-
-                    next_sudoku: Sudoku = self.next_step_at_position(ii, jj, candidate)
-                    next_sudoku_consequences: List[Tuple[Tuple[int, int], int]] = [((ii, jj), candidate)]
-
-                    while True:
-                        single_candidates: List[Tuple[int, int, int]] = [
-                            (iii, jjj, next(iter(cell_candidates)))
-                            for iii, jjj in itertools.product(range(n), range(n))
-                            if (
-                                (iii, jjj) != (i, j)
-                                and next_sudoku.grid[iii][jjj] == 0
-                                and len((cell_candidates := next_sudoku.candidate_values_0th_layer_at_position(iii, jjj))) == 1
-                            )
-                        ]
-
-                        if not single_candidates:
-                            break
-
-                        for iii, jjj, single_candidate in single_candidates:
-                            next_sudoku = next_sudoku.next_step_at_position(iii, jjj, single_candidate)
-                            next_sudoku_consequences.append(((iii, jjj), single_candidate))
-
-                    next_candidates: Set[int] = next_sudoku.candidate_values_0th_layer_at_position(i, j)
-                    if len(next_candidates) == 1:
-                        consensus_candidate_value, consensus_candidate_position = next(iter(next_candidates)), (i, j)
-                        inner_candidates.append(consensus_candidate_value)
-                        inner_deduction_chain.append(
-                            SudokuConsensusDeductionChain(
-                                initial_assumption_value=candidate,
-                                initial_assumption_position=(ii, jj),
-                                region_positions=[position for _, position in region],
-                                consequences=tuple(next_sudoku_consequences + [(consensus_candidate_position, consensus_candidate_value)]),
-                                consensus_candidate_value=consensus_candidate_value,
-                                consensus_candidate_position=consensus_candidate_position
-                            )
+                    if (ii, jj, candidate) not in branch_consequences:
+                        branch_consequences[(ii, jj, candidate)] = self.__propagate_singles_at_position(i, j, ii, jj, candidate)
+
+                    next_sudoku_consequences: Optional[List[Tuple[Tuple[int, int], int]]] = branch_consequences[(ii, jj, candidate)]
+                    if next_sudoku_consequences is None or (inner_candidates and next_sudoku_consequences[-1][1] != inner_candidates[0]):
+                        break
+
+                    consensus_candidate_position, consensus_candidate_value = next_sudoku_consequences[-1]
+                    inner_candidates.append(consensus_candidate_value)
+                    inner_deduction_chain.append(
+                        SudokuConsensusDeductionChain(
+                            initial_assumption_value=candidate,
+                            initial_assumption_position=(ii, jj),
+                            region_positions=list(region),
+                            consequences=tuple(next_sudoku_consequences),
+                            consensus_candidate_value=consensus_candidate_value,
+                            consensus_candidate_position=consensus_candidate_position
                         )
-
-                if len(inner_candidates) == len(positions) and len(set(inner_candidates)) == 1:
-                    candidates.add(next(iter(inner_candidates)))
-                    self.__deduction_chains_1st_layer_consensus[i][j].append(inner_deduction_chain)
+                    )
+                else:
+                    candidates.add(inner_candidates[0])
+                    deduction_chains.append(inner_deduction_chain)
         return candidates if len(candidates) == 1 else set()
 
-    @cachedmethod(lambda self: self.__cache, key=lambda self, i, j: hashkey(i, j, candidate_type=SudokuCandidateType.NTH_LAYER))
+    @__cached_candidate_values(SudokuCandidateType.NTH_LAYER)
     def candidate_values_nth_layer_at_position(self, i: int, j: int) -> Set[int]:
-        if self.grid[i][j] != 0:
+        if self.__cells[i * self.__n + j] != 0:
             return set()
 
-        candidates: Set[int] = set()
-        for solution in self.solutions:
-            candidates.add(solution.grid[i][j])
-        return candidates
+        if self.__candidate_values_nth_layer is None:
+            self.__candidate_values_nth_layer = self.__solver.solve_candidates(self.grid)
+        return set(self.__candidate_values_nth_layer[i][j])
 
     def candidate_values_at_position(self, i: int, j: int, candidate_type: SudokuCandidateType) -> Optional[Set[int]]:
         values: Optional[Set[int]] = None
@@ -301,90 +347,251 @@ class Sudoku:
         return values
 
     def solve(self, max_solutions: Optional[int] = None) -> Tuple["Sudoku", ...]:
-        # Variables: Integer variable for each cell of the Sudoku grid
-        n, n_isqrt = self.shape()
-        cells: List[List[Int]] = [
-            [
-                Int(f"x_{i + 1}_{j + 1}")
-                for j in range(n)
-            ]
-            for i in range(n)
-        ]
-
-        # Rule: Each cell must contain a digit (1 to n)
-        cell_constraints: List[BoolRef] = [
-            And(cells[i][j] >= 1, cells[i][j] <= n)
-            for i in range(n)
-            for j in range(n)
-        ]
-
-        # Rule: Every digit has to be placed exactly once in each row
-        row_constraints: List[BoolRef] = [
-            Distinct(cells[i])
-            for i in range(n)
-        ]
-
-        # Rule: Every digit has to be placed exactly once in each row
-        column_constraints: List[BoolRef] = [
-            Distinct(
-                [
-                    cells[i][j]
-                    for i in range(n)
-                ]
-            )
-            for j in range(n)
-        ]
-
-        # Rule: Every digit has to be placed exactly once in each isqrt(n) x isqrt(n) block
-        block_constraints: List[BoolRef] = [
-            Distinct(
-                [
-                    cells[i0 + i][j0 + j]
-                    for i in range(n_isqrt)
-                    for j in range(n_isqrt)
-                ]
+        return tuple(
+            Sudoku(solution_grid, solver=self.__solver)
+            for solution_grid in self.__solver.solve(self.grid, max_solutions=max_solutions)
+        )
+
+    def __propagate_singles_at_position(self, i: int, j: int, ii: int, jj: int, value: int) -> Optional[List[Tuple[Tuple[int, int], int]]]:
+        # Target-specific view of a shared branch: excluding the target (i, j) from the placements only matters from
+        # the round where the target itself turns into a single. Before that the shared propagation is reused as is,
+        # from there on the branch resumes from that round's snapshot without placing the target. Returns the
+        # placements followed by the single the target ends up with, or None if the target has no single
+        n: int = len(self)
+        target: int = i * n + j
+        branch: SudokuConsensusBranch = self.__consensus_branch_at_position(ii, jj, value)
+        target_round: Optional[int] = branch.single_rounds.get(target)
+
+        masks: Sequence[int] = branch.masks
+        consequences: List[Tuple[Tuple[int, int], int]] = list(branch.consequences)
+        if target_round is not None:
+            round_cells, round_masks, round_single_bits, round_consequences = branch.rounds[target_round]
+            cells: List[int] = list(round_cells)
+            masks = list(round_masks)
+            consequences = consequences[:round_consequences]
+            changed: Set[int] = set()
+            for idx, bit in round_single_bits:
+                if idx != target:
+                    self.__place_single(cells, masks, consequences, idx, bit, changed)
+            if not self.__propagate_singles(cells, masks, consequences, changed, self.__unit_peers(changed), target=target):
+                return None
+
+        bit: int = self.__single_bit(masks, target)
+        if bit == 0:
+            return None
+
+        consequences.append(((i, j), bit.bit_length() - 1))
+        return consequences
+
+    def __consensus_branch_at_position(self, i: int, j: int, value: int) -> "SudokuConsensusBranch":
+        # Shared branch: assumes value at (i, j) and propagates it once for every target cell, recording a snapshot
+        # of each round so target-specific views can resume from the round their target turns into a single
+        if self.__consensus_branches is None:
+            self.__consensus_branches = {}
+
+        key: Tuple[int, int, int] = (i, j, value)
+        if key not in self.__consensus_branches:
+            n: int = len(self)
+            cells: List[int] = list(self.__cells)
+            masks: List[int] = list(self.candidate_masks_0th_layer_plain)
+            consequences: List[Tuple[Tuple[int, int], int]] = []
+            rounds: List[Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[Tuple[int, int], ...], int]] = []
+            changed: Set[int] = set()
+
+            self.__place_single(cells, masks, consequences, i * n + j, 1 << value, changed)
+            self.__propagate_singles(cells, masks, consequences, changed, range(n * n), rounds=rounds)
+            self.__consensus_branches[key] = SudokuConsensusBranch(
+                masks=tuple(masks),
+                consequences=tuple(consequences),
+                rounds=tuple(rounds),
+                single_rounds={idx: k for k, (_, _, single_bits, _) in enumerate(rounds) for idx, _ in single_bits}
             )
-            for i0 in range(0, n, n_isqrt)
-            for j0 in range(0, n, n_isqrt)
-        ]
-
-        # Rule: Pre-fill the cells that already have numbers in the given Sudoku grid
-        instance_constraints: List[BoolRef] = [
-            If(self.grid[i][j] == 0, True, cells[i][j] == self.grid[i][j])
-            for i in range(n)
-            for j in range(n)
-        ]
-
-        solver: Solver = Solver()
-        solver.add(cell_constraints + row_constraints + column_constraints + block_constraints + instance_constraints)
-        if solver.check() != sat:
-            return ()
-
-        solutions: List[Sudoku] = []
-        while solver.check() == sat:
-            model: ModelRef = solver.model()
-            solution_grid: List[List[int]] = [
-                [
-                    model.evaluate(cells[i][j]).as_long()
-                    for j in range(n)
-                ]
-                for i in range(n)
+        return self.__consensus_branches[key]
+
+    def __propagate_singles(
+            self,
+            cells: List[int],
+            masks: List[int],
+            consequences: List[Tuple[Tuple[int, int], int]],
+            changed: Set[int],
+            dirty: Sequence[int],
+            target: Optional[int] = None,
+            rounds: Optional[List[Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[Tuple[int, int], ...], int]]] = None
+    ) -> bool:
+        # Worklist propagation: keeps placing naked and hidden singles (never on the target) round by round. After a
+        # round only the cells sharing a unit with a cell whose candidates changed can turn into singles, so only
+        # those are re-evaluated. Returns False as soon as the target runs out of candidates
+        while True:
+            # Contradiction on the target: its candidates only shrink, so it can no longer end up with a single
+            if target is not None and masks[target] == 0:
+                return False
+
+            single_bits: List[Tuple[int, int]] = [
+                (idx, bit)
+                for idx in dirty
+                if idx != target and cells[idx] == 0 and (bit := self.__single_bit(masks, idx))
             ]
 
-            solutions.append(Sudoku(solution_grid))
-            solver.add(
-                Or(
-                    [
-                        cells[i][j] != model.evaluate(cells[i][j])
-                        for i in range(n)
-                        for j in range(n)
-                    ]
-                )
-            )
+            if not single_bits:
+                return True
+
+            if rounds is not None:
+                rounds.append((tuple(cells), tuple(masks), tuple(single_bits), len(consequences)))
+
+            changed = set()
+            for idx, bit in single_bits:
+                self.__place_single(cells, masks, consequences, idx, bit, changed)
+            dirty = self.__unit_peers(changed)
+
+    def __place_single(self, cells: List[int], masks: List[int], consequences: List[Tuple[Tuple[int, int], int]], idx: int, bit: int, changed: Set[int]) -> None:
+        cells[idx] = bit.bit_length() - 1
+        masks[idx] = 0
+        changed.add(idx)
+        for peer in self.topology.peers[idx]:
+            if masks[peer] & bit:
+                masks[peer] &= ~bit
+                changed.add(peer)
+        consequences.append((self.topology.positions[idx], cells[idx]))
+
+    def __single_bit(self, masks: Sequence[int], idx: int) -> int:
+        mask: int = masks[idx]
+        if mask & (mask - 1) == 0:
+            return mask
+
+        topology: SudokuTopology = self.topology
+        units: Tuple[Tuple[int, ...], ...] = topology.units
+        hidden_mask: int = 0
+        for unit in topology.cell_units[idx]:
+            others_mask: int = 0
+            for peer in units[unit]:
+                if peer != idx:
+                    others_mask |= masks[peer]
+            hidden_mask |= mask & ~others_mask
+        return hidden_mask if hidden_mask & (hidden_mask - 1) == 0 else 0
+
+    def __unit_peers(self, indices: Set[int]) -> List[int]:
+        peers: Tuple[Tuple[int, ...], ...] = self.topology.peers
+        return sorted(indices.union(*(peers[idx] for idx in indices)))
+
+    def __grid_units_with_positions(self, kind: int) -> Tuple[Tuple[Tuple[int, Tuple[int,int]], ...], ...]:
+        n: int = len(self)
+        return tuple(
+            tuple((self.__cells[i * n + j], (i, j)) for i, j in positions)
+            for positions in self.topology.unit_positions[kind * n:(kind + 1) * n]
+        )
 
-            if max_solutions is not None and len(solutions) >= max_solutions:
-                break
-        return tuple(solutions)
+    def __candidate_masks_0th_layer_plain(self) -> Tuple[int, ...]:
+        full_mask: int = self.__full_mask(len(self))
+        cell_blocks: Tuple[int, ...] = self.topology.cell_blocks
+        return tuple(
+            full_mask & ~(self.grid_rows_mask[i] | self.grid_columns_mask[j] | self.grid_blocks_mask[cell_blocks[idx]])
+            if self.__cells[idx] == 0 else 0
+            for idx, (i, j) in enumerate(self.topology.positions)
+        )
+
+    def __candidate_masks_0th_layer_hidden_singles(self) -> Tuple[int, ...]:
+        # Single sweep over the units: a value seen once in a unit (and not twice) can only go in one of its cells, so
+        # each cell's hidden single is the one value of its candidates that is unique in its row, column or block
+        topology: SudokuTopology = self.topology
+        masks: Tuple[int, ...] = self.candidate_masks_0th_layer_plain
+        unique_masks: List[int] = []
+        for unit in topology.units:
+            once_mask: int = 0
+            twice_mask: int = 0
+            for idx in unit:
+                twice_mask |= once_mask & masks[idx]
+                once_mask |= masks[idx]
+            unique_masks.append(once_mask & ~twice_mask)
+
+        hidden_masks: List[int] = [0] * len(masks)
+        for idx, mask in enumerate(masks):
+            if mask & (mask - 1) == 0:
+                continue
+
+            row_unit, column_unit, block_unit = topology.cell_units[idx]
+            hidden_mask: int = mask & (unique_masks[row_unit] | unique_masks[column_unit] | unique_masks[block_unit])
+            if hidden_mask and hidden_mask & (hidden_mask - 1) == 0:
+                hidden_masks[idx] = hidden_mask
+        return tuple(hidden_masks)
+
+    def __lazy_value[T](self, name: str, factory: Callable[[], T]) -> T:
+        if self.__lazy_values is None:
+            self.__lazy_values = {}
+        if name not in self.__lazy_values:
+            self.__lazy_values[name] = factory()
+        return self.__lazy_values[name]
+
+    def __candidate_values_cache(self) -> Dict[Tuple[SudokuCandidateType, int, int], Set[int]]:
+        # Holds at most one entry per candidate type and cell, so a plain dictionary is enough
+        if self.__candidate_values is None:
+            self.__candidate_values = {}
+        return self.__candidate_values
+
+    def __derive_at_position(self, i: int, j: int, value: int) -> "Sudoku":
+        # Derived grid: copies the parent's cells with the change and only patches the cached row, column and block
+        # state (and the candidate masks of the cell and its peers) that placing a value on an empty cell, or emptying
+        # a filled cell, can change
+        n, n_isqrt = self.shape()
+        topology: SudokuTopology = self.topology
+        b: int = topology.cell_blocks[i * n + j]
+        bit: int = 1 << value
+
+        idx: int = i * n + j
+        sudoku: Sudoku = super().__new__(Sudoku)
+        sudoku.__n = n
+        sudoku.__topology = topology
+        sudoku.__cells = self.__cells[:idx] + bytes((value,)) + self.__cells[idx + 1:]
+        sudoku.__grid = None
+        sudoku.__solver = self.__solver
+        sudoku.__lazy_values = None
+        sudoku.__candidate_values = None
+        sudoku.__solutions = None
+        sudoku.__candidate_values_nth_layer = None
+        sudoku.__consensus_branches = None
+        sudoku.__deduction_chains_1st_layer_consensus = None
+
+        if self.__grid is not None:
+            sudoku.__grid = self.__grid[:i] + (self.__grid[i][:j] + (value,) + self.__grid[i][j + 1:],) + self.__grid[i + 1:]
+        if not self.__lazy_values:
+            return sudoku
+
+        parent_state: Dict[str, Any] = self.__lazy_values
+        state: Dict[str, Any] = {}
+        sudoku.__lazy_values = state
+        if "grid_columns" in parent_state:
+            column: Tuple[int, ...] = self.grid_columns[j]
+            state["grid_columns"] = self.grid_columns[:j] + (column[:i] + (value,) + column[i + 1:],) + self.grid_columns[j + 1:]
+        if "grid_blocks" in parent_state:
+            block: Tuple[int, ...] = self.grid_blocks[b]
+            k: int = (i % n_isqrt) * n_isqrt + (j % n_isqrt)
+            state["grid_blocks"] = self.grid_blocks[:b] + (block[:k] + (value,) + block[k + 1:],) + self.grid_blocks[b + 1:]
+
+        # Emptied cells get their row, column and block masks rebuilt from the cells, since the removed value may
+        # still be given elsewhere in a unit of an invalid grid
+        if "grid_rows_mask" in parent_state:
+            row_mask: int = self.grid_rows_mask[i] | bit if value != 0 else self.__values_mask(sudoku.__cells[i * n:(i + 1) * n])
+            state["grid_rows_mask"] = self.grid_rows_mask[:i] + (row_mask,) + self.grid_rows_mask[i + 1:]
+        if "grid_columns_mask" in parent_state:
+            column_mask: int = self.grid_columns_mask[j] | bit if value != 0 else self.__values_mask(sudoku.__cells[j::n])
+            state["grid_columns_mask"] = self.grid_columns_mask[:j] + (column_mask,) + self.grid_columns_mask[j + 1:]
+        if "grid_blocks_mask" in parent_state:
+            block_mask: int = self.grid_blocks_mask[b] | bit if value != 0 else self.__values_mask(sudoku.__cells[x] for x in topology.blocks[b])
+            state["grid_blocks_mask"] = self.grid_blocks_mask[:b] + (block_mask,) + self.grid_blocks_mask[b + 1:]
+        if "candidate_masks_0th_layer_plain" in parent_state:
+            masks: List[int] = list(self.candidate_masks_0th_layer_plain)
+            if value != 0:
+                for peer in topology.peers[idx]:
+                    masks[peer] &= ~bit
+                masks[idx] = 0
+            else:
+                full_mask: int = self.__full_mask(n)
+                rows_mask, columns_mask, blocks_mask = sudoku.grid_rows_mask, sudoku.grid_columns_mask, sudoku.grid_blocks_mask
+                for peer in (idx, *topology.peers[idx]):
+                    if sudoku.__cells[peer] == 0:
+                        ii, jj = topology.positions[peer]
+                        masks[peer] = full_mask & ~(rows_mask[ii] | columns_mask[jj] | blocks_mask[topology.cell_blocks[peer]])
+            state["candidate_masks_0th_layer_plain"] = tuple(masks)
+        return sudoku
 
     def __solve_all_candidates(self, candidate_type: SudokuCandidateType) -> Tuple["SudokuCandidate", ...]:
         n: int = len(self)
@@ -393,3 +600,18 @@ class Sudoku:
             for value in self.candidate_values_at_position(i, j, candidate_type=candidate_type):
                 candidates.append(SudokuCandidate(position=(i, j), value=value))
         return tuple(candidates)
+
+    @classmethod
+    def __full_mask(cls, n: int) -> int:
+        return ((1 << n) - 1) << 1
+
+    @classmethod
+    def __values_mask(cls, values: Iterable[int]) -> int:
+        mask: int = 0
+        for value in values:
+            mask |= 1 << value
+        return mask & ~1
+
+    @classmethod
+    def __mask_values(cls, mask: int) -> Set[int]:
+        return {value for value in range(1, mask.bit_length()) if mask >> value & 1}
@@ -0,0 +1,147 @@
+import hashlib
+import math
+from dataclasses import dataclass
+from typing import List, Set, Tuple, Sequence
+from core.sudoku_symmetry import SudokuSymmetry
+
+@dataclass(frozen=True)
+class SudokuCanonicalForm:
+    # grid is the lexicographically smallest (row-major, empty cells first) grid among all the symmetric copies of the
+    # original one, where digits are relabeled in order of first appearance; symmetry maps the original grid onto it
+    grid: Tuple[Tuple[int, ...], ...]
+    symmetry: SudokuSymmetry
+
+    @property
+    def hash(self) -> str:
+        return hashlib.blake2b(bytes((len(self.grid), *(value for row in self.grid for value in row))), digest_size=16).hexdigest()
+
+    @classmethod
+    def of(cls, grid: Sequence[Sequence[int]]) -> "SudokuCanonicalForm":
+        # Branch and bound over the transforms: the first row (and with it every column) is chosen cell by cell, then
+        # the remaining rows one at a time, and a branch is dropped as soon as its prefix is larger than the best grid
+        # found so far. Only ties (cells or rows that relabel to the same values) are branched on, and only once per
+        # class of interchangeable lines: two lines of a band holding the same values, or the first lines of two bands
+        # holding the same lines, are swapped by a symmetry that maps the grid onto itself, so their branches end in the
+        # same grid. This keeps nearly empty grids, where almost everything ties, from blowing up. 9x9 puzzles take from
+        # about 10 to 100 ms, the slowest grids left are full ones, at about a second
+        n: int = len(grid)
+        n_isqrt: int = math.isqrt(n)
+        best_cells: List[int] = []
+        best_symmetry: List[SudokuSymmetry] = []
+
+        for transpose in (False, True):
+            oriented_grid: Tuple[Tuple[int, ...], ...] = tuple(zip(*grid)) if transpose else tuple(map(tuple, grid))
+            row_lines: Tuple[Tuple[int, ...], ...] = oriented_grid
+            column_lines: Tuple[Tuple[int, ...], ...] = tuple(zip(*oriented_grid))
+            rows: List[int] = []
+            columns: List[int] = []
+            labels: List[int] = [0] * (n + 1)
+            cells: List[int] = []
+
+            def distinct(candidates: List[int], lines: Tuple[Tuple[int, ...], ...], first_of_band: bool) -> List[int]:
+                keys: Set[Tuple] = set()
+                distinct_candidates: List[int] = []
+                for candidate in candidates:
+                    band: int = candidate // n_isqrt * n_isqrt
+                    key: Tuple = (lines[candidate], tuple(sorted(lines[band:band + n_isqrt]))) if first_of_band else lines[candidate]
+                    if key not in keys:
+                        keys.add(key)
+                        distinct_candidates.append(candidate)
+                return distinct_candidates
+
+            def label(value: int, next_label: int) -> int:
+                return labels[value] or next_label if value != 0 else 0
+
+            def search_first_row(j: int, next_label: int, tight: bool) -> bool:
+                if j == n:
+                    return search_rows(1, next_label, tight)
+
+                if j % n_isqrt == 0:
+                    candidates: List[int] = [c for c in range(n) if all(column // n_isqrt != c // n_isqrt for column in columns)]
+                else: candidates = [c for c in range(n) if c // n_isqrt == columns[-1] // n_isqrt and c not in columns]
+                candidates = distinct(candidates, column_lines, j % n_isqrt == 0)
+                row: Tuple[int, ...] = oriented_grid[rows[0]]
+                min_label: int = min(label(row[c], next_label) for c in candidates)
+                if tight and min_label > best_cells[j]:
+                    return False
+
+                tight = tight and min_label == best_cells[j]
+                updated: bool = False
+                for c in candidates:
+                    value: int = row[c]
+                    if label(value, next_label) != min_label:
+                        continue
+
+                    new_label: bool = value != 0 and labels[value] == 0
+                    if new_label:
+                        labels[value] = next_label
+                    columns.append(c)
+                    cells.append(min_label)
+                    if search_first_row(j + 1, next_label + new_label, tight):
+                        updated = tight = True
+                    cells.pop()
+                    columns.pop()
+                    if new_label:
+                        labels[value] = 0
+                return updated
+
+            def search_rows(i: int, next_label: int, tight: bool) -> bool:
+                if i == n:
+                    best_cells[:] = cells
+                    digits: List[int] = labels[:]
+                    for value in range(1, n + 1):
+                        if digits[value] == 0:
+                            digits[value] = next_label
+                            next_label += 1
+                    best_symmetry[:] = [SudokuSymmetry(digits=tuple(digits), rows=tuple(rows), columns=tuple(columns), transpose=transpose)]
+                    return True
+
+                if i % n_isqrt == 0:
+                    candidates: List[int] = [r for r in range(n) if all(row // n_isqrt != r // n_isqrt for row in rows)]
+                else: candidates = [r for r in range(n) if r // n_isqrt == rows[-1] // n_isqrt and r not in rows]
+                candidates = distinct(candidates, row_lines, i % n_isqrt == 0)
+
+                labeled_rows: List[Tuple[Tuple[int, ...], List[int]]] = []
+                for r in candidates:
+                    labeled_row: List[int] = []
+                    new_values: List[int] = []
+                    for c in columns:
+                        value: int = oriented_grid[r][c]
+                        if value != 0 and labels[value] == 0 and value not in new_values:
+                            new_values.append(value)
+                        labeled_row.append(labels[value] or next_label + new_values.index(value) if value != 0 else 0)
+                    labeled_rows.append((tuple(labeled_row), new_values))
+
+                min_labeled_row: Tuple[int, ...] = min(labeled_row for labeled_row, _ in labeled_rows)
+                best_row: Tuple[int, ...] = tuple(best_cells[i * n:(i + 1) * n]) if tight else ()
+                if tight and min_labeled_row > best_row:
+                    return False
+
+                tight = tight and min_labeled_row == best_row
+                updated: bool = False
+                for r, (labeled_row, new_values) in zip(candidates, labeled_rows):
+                    if labeled_row != min_labeled_row:
+                        continue
+
+                    for offset, value in enumerate(new_values):
+                        labels[value] = next_label + offset
+                    rows.append(r)
+                    cells.extend(labeled_row)
+                    if search_rows(i + 1, next_label + len(new_values), tight):
+                        updated = tight = True
+                    del cells[-n:]
+                    rows.pop()
+                    for value in new_values:
+                        labels[value] = 0
+                return updated
+
+            for r in distinct(list(range(n)), row_lines, True):
+                rows.append(r)
+                search_first_row(0, 1, bool(best_cells))
+                rows.pop()
+
+        return cls(
+            grid=tuple(tuple(best_cells[i * n:(i + 1) * n]) for i in range(n)),
+            symmetry=best_symmetry[0]
+        )
+
@@ -0,0 +1,89 @@
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional
+from cachetools import LRUCache
+
+class SudokuFigureCache:
+    # Rendered figures by key, in a memory LRU bounded by the figures' total size in bytes, backed (when a directory
+    # and a size are given) by a disk tier of one file per key, evicted by least recent access once over its size
+    def __init__(self, max_bytes: int, directory: Optional[Path] = None, directory_max_bytes: int = 0) -> None:
+        self.__memory: LRUCache[str, List[bytes]] = LRUCache(maxsize=max_bytes, getsizeof=self.__sizeof)
+        self.__directory: Optional[Path] = directory if directory is not None and directory_max_bytes > 0 else None
+        self.__directory_max_bytes: int = directory_max_bytes
+        self.__directory_sizes: Dict[str, int] = {}
+        self.__directory_bytes: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+
+        if self.__directory is not None:
+            self.__directory.mkdir(parents=True, exist_ok=True)
+            for path in sorted(self.__directory.glob("*.bin"), key=lambda x: x.stat().st_mtime):
+                self.__directory_sizes[path.stem] = path.stat().st_size
+                self.__directory_bytes += self.__directory_sizes[path.stem]
+
+    def get(self, key: str) -> Optional[List[bytes]]:
+        with self.__lock:
+            figures: Optional[List[bytes]] = self.__memory.get(key)
+            if figures is not None or self.__directory is None or key not in self.__directory_sizes:
+                return figures
+
+            # Disk hit: moved to the most recent end of both tiers
+            try:
+                figures = self.__unpack(self.__path(key).read_bytes())
+                os.utime(self.__path(key))
+            except OSError:
+                self.__directory_bytes -= self.__directory_sizes.pop(key)
+                return None
+
+            self.__directory_sizes[key] = self.__directory_sizes.pop(key)
+            self.__set_in_memory(key, figures)
+            return figures
+
+    def set(self, key: str, figures: List[bytes]) -> None:
+        with self.__lock:
+            self.__set_in_memory(key, figures)
+            if self.__directory is None:
+                return
+
+            content: bytes = self.__pack(figures)
+            if len(content) > self.__directory_max_bytes:
+                return
+
+            temporary_path: Path = self.__path(key).with_suffix(".tmp")
+            temporary_path.write_bytes(content)
+            temporary_path.replace(self.__path(key))
+            self.__directory_bytes += len(content) - self.__directory_sizes.pop(key, 0)
+            self.__directory_sizes[key] = len(content)
+            while self.__directory_bytes > self.__directory_max_bytes:
+                evicted_key: str = next(iter(self.__directory_sizes))
+                self.__directory_bytes -= self.__directory_sizes.pop(evicted_key)
+                self.__path(evicted_key).unlink(missing_ok=True)
+
+    def __set_in_memory(self, key: str, figures: List[bytes]) -> None:
+        # Figures larger than the whole memory tier are not kept in it (LRUCache would raise)
+        if self.__sizeof(figures) <= self.__memory.maxsize:
+            self.__memory[key] = figures
+
+    def __path(self, key: str) -> Path:
+        return self.__directory / f"{key}.bin"
+
+    @staticmethod
+    def __sizeof(figures: List[bytes]) -> int:
+        return sum(map(len, figures))
+
+    @staticmethod
+    def __pack(figures: List[bytes]) -> bytes:
+        # Figure count, then each figure's length, then the figures
+        return struct.pack(f"<I{len(figures)}Q", len(figures), *map(len, figures)) + b"".join(figures)
+
+    @staticmethod
+    def __unpack(content: bytes) -> List[bytes]:
+        count: int = struct.unpack_from("<I", content)[0]
+        lengths: Tuple[int, ...] = struct.unpack_from(f"<{count}Q", content, offset=4)
+        figures: List[bytes] = []
+        offset: int = 4 + 8 * count
+        for length in lengths:
+            figures.append(content[offset:offset + length])
+            offset += length
+        return figures
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from typing import Optional, List, Tuple, Dict
+from core.enums.sudoku_candidate_type import SudokuCandidateType
+from core.sudoku import Sudoku
+
+@dataclass(frozen=True)
+class SudokuFigureElementOverlay[T]:
+    element: T
+    color: Optional[str] = None
+
+@dataclass(frozen=True)
+class SudokuFigureCircleCandidateElementOverlay:
+    value: int
+    excluded_positions: Optional[List[Tuple[int, int]]]
+    color: Optional[str] = None
+
+@dataclass(frozen=True)
+class SudokuFigureOverlay:
+    text_color_cells: List[SudokuFigureElementOverlay[Tuple[int, int]]] = field(default_factory=list)
+    candidate_cells: Dict[SudokuCandidateType, List[SudokuFigureElementOverlay[Tuple[int, int]]]] = field(default_factory=dict)
+    circle_candidate_values: List[SudokuFigureCircleCandidateElementOverlay] = field(default_factory=list)
+    circle_cells: List[SudokuFigureElementOverlay[Tuple[int, int]]] = field(default_factory=list)
+    arrow_cells: List[SudokuFigureElementOverlay[Tuple[Tuple[int, int], Tuple[int, int]]]] = field(default_factory=list)
+
+    def candidate_color(self, position: Tuple[int, int], value: int) -> Optional[str]:
+        # The color of a highlighted candidate value at a position, None when it keeps its cell color
+        for circle_candidate in self.circle_candidate_values:
+            if value == circle_candidate.value and (circle_candidate.excluded_positions is None or position not in circle_candidate.excluded_positions):
+                return circle_candidate.color
+        return None
+
+@dataclass(frozen=True)
+class SudokuFigurePanel:
+    # A sudoku drawn at (row, column) of the figure's grid of panels, row 0 being the top one
+    sudoku: Sudoku
+    overlay: SudokuFigureOverlay
+    position: Tuple[int, int]
+
+@dataclass(frozen=True)
+class SudokuFigureLayout:
+    # Backend-independent description of a figure: a width x height grid of panels, connections being arrows from the
+    # bottom of a panel to the top of another one (as indexes into panels)
+    width: int
+    height: int
+    panels: List[SudokuFigurePanel]
+    connections: List[Tuple[int, int]]
+
+    @property
+    def n(self) -> int:
+        return len(self.panels[0].sudoku)
@@ -0,0 +1,37 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass
+class SudokuGenerationStats:
+    # Running totals of the generation attempts of one (n, candidate type) pair; seconds is the time spent by the
+    # workers running them, not the wall-clock time of the requests
+    attempts: int = 0
+    successes: int = 0
+    seconds: float = 0.0
+    __lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        return self.successes / self.attempts if self.attempts else None
+
+    @property
+    def estimated_success_rate(self) -> float:
+        # Laplace-smoothed, so a pair that has not succeeded yet gets a small but finite rate (and projected cost)
+        return (self.successes + 1) / (self.attempts + 2)
+
+    @property
+    def seconds_per_attempt(self) -> Optional[float]:
+        return self.seconds / self.attempts if self.attempts else None
+
+    @property
+    def seconds_per_success(self) -> Optional[float]:
+        seconds_per_attempt: Optional[float] = self.seconds_per_attempt
+        return seconds_per_attempt / self.estimated_success_rate if seconds_per_attempt is not None else None
+
+    def record(self, attempts: int, successes: int, seconds: float) -> None:
+        with self.__lock:
+            self.attempts += attempts
+            self.successes += successes
+            self.seconds += seconds
+
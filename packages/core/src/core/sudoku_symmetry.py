@@ -0,0 +1,77 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import List, Tuple, Optional, Sequence
+
+@dataclass(frozen=True)
+class SudokuSymmetry:
+    # digits[v] is the value v is relabeled to (digits[0] is always 0, empty cells stay empty); the transformed grid
+    # takes its row i from rows[i] and its column j from columns[j], after transposing the grid when transpose is set
+    digits: Tuple[int, ...]
+    rows: Tuple[int, ...]
+    columns: Tuple[int, ...]
+    transpose: bool = False
+
+    @classmethod
+    def identity(cls, n: int) -> "SudokuSymmetry":
+        return cls(digits=tuple(range(n + 1)), rows=tuple(range(n)), columns=tuple(range(n)))
+
+    @classmethod
+    def sample(cls, n: int, rng: Optional[random.Random] = None) -> "SudokuSymmetry":
+        # Validity-preserving transforms only: bands and stacks move as a whole and rows (columns) only move inside
+        # their band (stack), so rows, columns and blocks of a valid grid are mapped onto rows, columns and blocks
+        rng = rng or random.Random()
+        digits: List[int] = list(range(1, n + 1))
+        rng.shuffle(digits)
+        return cls(
+            digits=(0, *digits),
+            rows=cls.__sample_lines(n, rng),
+            columns=cls.__sample_lines(n, rng),
+            transpose=rng.random() < 0.5
+        )
+
+    def apply(self, grid: Sequence[Sequence[int]]) -> Tuple[Tuple[int, ...], ...]:
+        grid = tuple(zip(*grid)) if self.transpose else grid
+        return tuple(
+            tuple(self.digits[grid[i][j]] for j in self.columns)
+            for i in self.rows
+        )
+
+    def inverse(self) -> "SudokuSymmetry":
+        # Transposing swaps the roles of rows and columns, so the inverse of a transposing symmetry takes its rows from
+        # the inverse column permutation and its columns from the inverse row permutation
+        digits: List[int] = [0] * len(self.digits)
+        for value, digit in enumerate(self.digits):
+            digits[digit] = value
+        rows, columns = self.__inverse_lines(self.rows), self.__inverse_lines(self.columns)
+        return SudokuSymmetry(digits=tuple(digits), rows=columns if self.transpose else rows, columns=rows if self.transpose else columns, transpose=self.transpose)
+
+    def then(self, other: "SudokuSymmetry") -> "SudokuSymmetry":
+        # The symmetry applying this one and then other, so that self.then(other).apply(grid) == other.apply(self.apply(grid))
+        rows, columns = (self.columns, self.rows) if other.transpose else (self.rows, self.columns)
+        return SudokuSymmetry(
+            digits=tuple(other.digits[digit] for digit in self.digits),
+            rows=tuple(rows[i] for i in other.rows),
+            columns=tuple(columns[j] for j in other.columns),
+            transpose=self.transpose != other.transpose
+        )
+
+    @classmethod
+    def __inverse_lines(cls, lines: Tuple[int, ...]) -> Tuple[int, ...]:
+        inverse_lines: List[int] = [0] * len(lines)
+        for idx, line in enumerate(lines):
+            inverse_lines[line] = idx
+        return tuple(inverse_lines)
+
+    @classmethod
+    def __sample_lines(cls, n: int, rng: random.Random) -> Tuple[int, ...]:
+        n_isqrt: int = math.isqrt(n)
+        bands: List[int] = list(range(n_isqrt))
+        rng.shuffle(bands)
+
+        lines: List[int] = []
+        for band in bands:
+            offsets: List[int] = list(range(n_isqrt))
+            rng.shuffle(offsets)
+            lines.extend(band * n_isqrt + offset for offset in offsets)
+        return tuple(lines)
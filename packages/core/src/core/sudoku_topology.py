@@ -0,0 +1,68 @@
+import math
+from dataclasses import dataclass
+from typing import ClassVar, List, Tuple, Dict, Optional
+
+@dataclass(frozen=True)
+class SudokuTopology:
+    __topologies: ClassVar[Dict[int, "SudokuTopology"]] = {}
+
+    n: int
+    n_isqrt: int
+    positions: Tuple[Tuple[int, int], ...]
+    cell_blocks: Tuple[int, ...]
+    units: Tuple[Tuple[int, ...], ...]
+    unit_positions: Tuple[Tuple[Tuple[int, int], ...], ...]
+    cell_units: Tuple[Tuple[int, ...], ...]
+    peers: Tuple[Tuple[int, ...], ...]
+
+    @property
+    def rows(self) -> Tuple[Tuple[int, ...], ...]:
+        return self.units[:self.n]
+
+    @property
+    def columns(self) -> Tuple[Tuple[int, ...], ...]:
+        return self.units[self.n:2 * self.n]
+
+    @property
+    def blocks(self) -> Tuple[Tuple[int, ...], ...]:
+        return self.units[2 * self.n:]
+
+    @classmethod
+    def of(cls, n: int) -> "SudokuTopology":
+        # Topologies only depend on n, so a single instance per size is shared by every grid of the process
+        topology: Optional[SudokuTopology] = cls.__topologies.get(n)
+        if topology is None:
+            topology = cls.__topologies.setdefault(n, cls.__build(n))
+        return topology
+
+    @classmethod
+    def __build(cls, n: int) -> "SudokuTopology":
+        n_isqrt: int = math.isqrt(n)
+        positions: Tuple[Tuple[int, int], ...] = tuple(divmod(idx, n) for idx in range(n * n))
+        cell_blocks: Tuple[int, ...] = tuple((i // n_isqrt) * n_isqrt + (j // n_isqrt) for i, j in positions)
+
+        # Units: rows first, then columns, then blocks (each block in row-major order)
+        units: Tuple[Tuple[int, ...], ...] = (
+            tuple(tuple(i * n + j for j in range(n)) for i in range(n)) +
+            tuple(tuple(i * n + j for i in range(n)) for j in range(n)) +
+            tuple(tuple(idx for idx in range(n * n) if cell_blocks[idx] == b) for b in range(n))
+        )
+
+        cell_units: List[List[int]] = [[] for _ in range(n * n)]
+        for unit, indices in enumerate(units):
+            for idx in indices:
+                cell_units[idx].append(unit)
+
+        return cls(
+            n=n,
+            n_isqrt=n_isqrt,
+            positions=positions,
+            cell_blocks=cell_blocks,
+            units=units,
+            unit_positions=tuple(tuple(positions[idx] for idx in unit) for unit in units),
+            cell_units=tuple(tuple(x) for x in cell_units),
+            peers=tuple(
+                tuple(sorted({peer for unit in cell_units[idx] for peer in units[unit]} - {idx}))
+                for idx in range(n * n)
+            )
+        )
@@ -21,6 +21,7 @@ class SudokuInferenceAnalyticsChartComponent:
             "total_beyond_non_unique": "Beyond (Non-unique)",
             "total_hallucinations": "Hallucinations",
             "total_missed": "Missed",
+            "total_ungraded": "Ungraded",
             "total_unprocessed": "Unprocessed"
         }
 
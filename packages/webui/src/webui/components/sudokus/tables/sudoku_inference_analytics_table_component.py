@@ -29,6 +29,7 @@ class SudokuInferenceAnalyticsTableComponent:
                 "Beyond (Non-unique) (%)": f"{(analytic.total_beyond_non_unique / total) * 100:.2f}%",
                 "Hallucinations (%)": f"{(analytic.total_hallucinations / total) * 100:.2f}%",
                 "Missed (%)": f"{(analytic.total_missed / total) * 100:.2f}%",
+                "Ungraded (%)": f"{(analytic.total_ungraded / total) * 100:.2f}%",
                 "Unprocessed (%)": f"{(analytic.total_unprocessed / total) * 100:.2f}%",
                 "Total": analytic.total
             })
@@ -27,8 +27,8 @@ class SudokuTableComponent:
                 "Candidate Type": sudoku.candidate_type.display_name,
                 "Grid": str(sudoku.grid),
                 "Inference Succeeded": str(sudoku.inference.succeeded) if sudoku.inference else "—",
-                "Inference Succeeded (Nth Layer)": str(sudoku.inference.succeeded_nth_layer) if sudoku.inference else "—",
-                "Inference Succeeded (Unique in Nth Layer)": str(sudoku.inference.succeeded_and_unique_nth_layer) if sudoku.inference else "—",
+                "Inference Succeeded (Nth Layer)": str(sudoku.inference.succeeded_nth_layer) if sudoku.inference and sudoku.inference.succeeded_nth_layer is not None else "—",
+                "Inference Succeeded (Unique in Nth Layer)": str(sudoku.inference.succeeded_and_unique_nth_layer) if sudoku.inference and sudoku.inference.succeeded_and_unique_nth_layer is not None else "—",
                 "Inference Explanation": sudoku.inference.explanation if sudoku.inference else "—"
             })
         return pd.DataFrame(rows)
@@ -28,7 +28,7 @@ with analytics_tab:
         - **`succeeded_and_unique_nth_layer`**: indica que a LLM encontrou **um candidato que torna o Sudoku válido *e* é um Single Candidate**.  
         - **`explanation`**: texto explicativo retornado pela LLM ao justificar o candidato encontrado.
         
-        A partir desses quatro campos, as inferências são classificadas em **seis grupos mutuamente exclusivos**:
+        A partir desses quatro campos, as inferências são classificadas em **sete grupos mutuamente exclusivos**:
         | Grupo | Condições | Significado |
         |:--|:--|:--|
         | **Predicted** | `succeeded=True`, `succeeded_nth_layer=True` | A LLM encontrou um *Single Candidate* previsto pelo nosso código (correspondência direta). |
@@ -36,6 +36,7 @@ with analytics_tab:
         | **Beyond (Non-unique)** | `succeeded=False`, `succeeded_nth_layer=True`, `succeeded_and_unique_nth_layer=False` | A LLM encontrou um candidato que **torna o Sudoku válido**, mas **não é um Single Candidate**. |
         | **Hallucination** | `succeeded=False`, `succeeded_nth_layer=False`, `explanation≠None` | A LLM propôs um candidato que **não torna o Sudoku válido** — é uma **alucinação**. |
         | **Missed** | `succeeded=False`, `succeeded_nth_layer=False`, `explanation=None` | A LLM **não tentou nenhuma inferência** (não gerou explicação). |
+        | **Ungraded** | `succeeded=False`, `succeeded_nth_layer=None` | O solver **excedeu o tempo limite** ao avaliar o candidato da LLM na camada N; a resposta foi guardada sem essa avaliação. |
         | **Unprocessed** | Inferência inexistente | Sudoku **ainda não processado** pela LLM. |
         """)
     )
@@ -4,6 +4,6 @@ from pydantic import BaseModel
 class SudokuInferenceSchema(BaseModel):
     id: int
     succeeded: bool
-    succeeded_nth_layer: bool
-    succeeded_and_unique_nth_layer: bool
+    succeeded_nth_layer: Optional[bool]
+    succeeded_and_unique_nth_layer: Optional[bool]
     explanation: Optional[str]